@@ -0,0 +1,80 @@
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from fakes import (  # noqa
+    FakeDriver,
+    FakePage,
+    make_default_pages,
+    make_page_mappings,
+    make_skins,
+)
+from pypom_navigation.index import build_page_index  # noqa
+from pypom_navigation.navigation import Navigation  # noqa
+
+
+PAGES = 10000
+SKINS = 20
+BASE_URL = 'https://skin0-coolsite.com'
+
+
+@pytest.fixture(scope='session')
+def skins():
+    return make_skins(SKINS)
+
+
+@pytest.fixture(scope='session')
+def skin(skins):
+    return skins[0]
+
+
+@pytest.fixture(scope='session')
+def default_pages(skins):
+    return make_default_pages(skins)
+
+
+@pytest.fixture(scope='session')
+def page_mappings(skins):
+    return make_page_mappings(PAGES, skins)
+
+
+@pytest.fixture(scope='session')
+def page_index(skin, page_mappings):
+    return build_page_index(skin, BASE_URL, page_mappings)
+
+
+@pytest.fixture
+def driver():
+    return FakeDriver()
+
+
+@pytest.fixture
+def fake_page(driver):
+    return FakePage(driver)
+
+
+def make_navigation(page, page_mappings, skin, page_index=None):
+    navigation = Navigation(
+        page,
+        FakePage,
+        page_mappings,
+        {},
+        skin,
+        BASE_URL,
+        None,
+        {},
+        timeout=10)
+    navigation.page_index = page_index
+    return navigation
+
+
+@pytest.fixture
+def navigation(fake_page, page_mappings, skin, page_index):
+    """ Navigation using the compiled page index """
+    return make_navigation(fake_page, page_mappings, skin, page_index)
+
+
+@pytest.fixture
+def navigation_no_index(fake_page, page_mappings, skin):
+    """ Navigation walking page_mappings """
+    return make_navigation(fake_page, page_mappings, skin)
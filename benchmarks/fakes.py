@@ -0,0 +1,91 @@
+""" In memory fakes used by the navigation benchmarks """
+
+
+class FakeCookies(object):
+
+    def __init__(self):
+        self.cookies = {}
+
+    def add(self, cookies):
+        self.cookies.update(cookies)
+
+    def all(self, verbose=False):
+        return dict(self.cookies)
+
+    def delete(self, *cookies):
+        if cookies:
+            for cookie in cookies:
+                self.cookies.pop(cookie, None)
+        else:
+            self.cookies.clear()
+
+
+class FakeDriver(object):
+    """ Splinter like driver without a browser """
+
+    def __init__(self):
+        self.url = 'about:blank'
+        self.cookies = FakeCookies()
+        self.visits = 0
+
+    def visit(self, url):
+        self.url = url
+        self.visits += 1
+
+    def execute_script(self, script, *args):
+        pass
+
+    def evaluate_script(self, script, *args):
+        return None
+
+    def is_text_present(self, text, wait_time=None):
+        return True
+
+    def quit(self):
+        pass
+
+
+class FakePage(object):
+    """ Page object with no load wait """
+
+    def __init__(self, driver, **kwargs):
+        self.driver = driver
+        self.kwargs = kwargs
+
+    def wait_for_page_to_load(self):
+        return self
+
+
+class FakeSkinPage(FakePage):
+    """ Page object mapped for a specific skin """
+
+
+def make_skins(count):
+    return ['skin{0}'.format(index) for index in range(count)]
+
+
+def make_default_pages(skins):
+    return dict((skin, 'fakes.FakePage') for skin in skins)
+
+
+def make_page_mappings(pages, skins):
+    """ Return page mappings with the given number of pages, each one
+        linked to the next one with a ``next`` action. Every other page
+        has a page class mapped for the first skin.
+    """
+    page_mappings = {}
+    for index in range(pages):
+        page_mapping = {
+            'path': '/page/{0}'.format(index),
+            'actions': {
+                'next': 'Page{0}'.format((index + 1) % pages),
+                'home': 'Page0',
+            },
+        }
+        if index % 2:
+            page_mapping['page_class'] = {
+                skins[0]: 'fakes.FakeSkinPage',
+                'fallback': 'fakes.FakePage',
+            }
+        page_mappings['Page{0}'.format(index)] = page_mapping
+    return page_mappings
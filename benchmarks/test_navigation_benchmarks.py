@@ -0,0 +1,82 @@
+import pytest
+
+
+STEPS = 1000
+
+
+@pytest.mark.parametrize('fixture_name', ['navigation', 'navigation_no_index'])
+def test_visit_page(benchmark, request, fixture_name):
+    """ visit_page for many different pages """
+    navigation = request.getfixturevalue(fixture_name)
+    page_ids = ['Page{0}'.format(index) for index in range(STEPS)]
+
+    def visit_all():
+        for page_id in page_ids:
+            navigation.visit_page(page_id)
+
+    benchmark(visit_all)
+    assert navigation.page_id == 'Page{0}'.format(STEPS - 1)
+
+
+@pytest.mark.parametrize('fixture_name', ['navigation', 'navigation_no_index'])
+def test_action_chain(benchmark, request, fixture_name):
+    """ Long chain of action_performed """
+    navigation = request.getfixturevalue(fixture_name)
+
+    def follow_chain():
+        navigation.update_page('Page0')
+        for index in range(STEPS):
+            navigation.action_performed('next')
+
+    benchmark(follow_chain)
+    assert navigation.page_id == 'Page{0}'.format(STEPS)
+
+
+def test_action_chain_fallback(benchmark, navigation):
+    """ Long chain of unmapped actions (fallback page) """
+
+    def follow_chain():
+        for index in range(STEPS):
+            navigation.update_page('Page0')
+            navigation.action_performed('unknown')
+
+    benchmark(follow_chain)
+    assert navigation.page_id is None
+
+
+def test_visit_page_timings(benchmark, navigation):
+    """ visit_page with step timings enabled """
+    from pypom_navigation.timing import NavigationTimings
+
+    navigation.timings = NavigationTimings()
+    page_ids = ['Page{0}'.format(index) for index in range(STEPS)]
+
+    def visit_all():
+        for page_id in page_ids:
+            navigation.visit_page(page_id)
+
+    benchmark(visit_all)
+
+
+@pytest.mark.parametrize('kwargs', [{}, {'timeout': 5, 'extra': 1}])
+def test_visit_page_kwargs(benchmark, navigation, kwargs):
+    """ visit_page with and without page kwargs overrides """
+    page_ids = ['Page{0}'.format(index) for index in range(STEPS)]
+
+    def visit_all():
+        for page_id in page_ids:
+            navigation.visit_page(page_id, **kwargs)
+
+    benchmark(visit_all)
+
+
+@pytest.mark.parametrize('kwargs', [{}, {'timeout': 5, 'extra': 1}])
+def test_action_chain_kwargs(benchmark, navigation, kwargs):
+    """ Long chain of action_performed with and without page kwargs """
+
+    def follow_chain():
+        navigation.update_page('Page0')
+        for index in range(STEPS):
+            navigation.action_performed('next', **kwargs)
+
+    benchmark(follow_chain)
@@ -0,0 +1,32 @@
+import pytest
+from parametrizer import Parametrizer
+
+from pypom_navigation.parametrizer import CachingParametrizer
+
+
+TEMPLATES = [
+    '{"username": "$username", "run": "$test_run_identifier"}',
+    '{"name": "{! name.upper() !}", "skin": "$skin"}',
+    '{"plain": "value"}',
+] * 100
+
+
+@pytest.mark.parametrize('parametrizer_class', [
+    Parametrizer,
+    CachingParametrizer,
+])
+def test_parametrize(benchmark, parametrizer_class):
+    """ Parametrize the same step templates many times """
+    mapping = {
+        'username': 'admin',
+        'test_run_identifier': 'QA-123',
+        'name': 'a name',
+        'skin': 'skin1',
+    }
+
+    def parametrize_all():
+        parametrizer = parametrizer_class(mapping)
+        for template in TEMPLATES:
+            parametrizer.parametrize(template)
+
+    benchmark(parametrize_all)
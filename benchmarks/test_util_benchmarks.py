@@ -0,0 +1,57 @@
+from pypom_navigation.util import (
+    get_page_class,
+    get_page_url,
+    page_factory,
+    validate_page_mappings,
+)
+from pypom_navigation.index import build_page_index
+
+
+def test_get_page_class(benchmark, skins, page_mappings, default_pages):
+    """ Page class resolution for all pages of all skins """
+    page_ids = sorted(page_mappings)[:1000]
+
+    def resolve_all():
+        for skin in skins:
+            for page_id in page_ids:
+                get_page_class(skin, page_mappings, page_id=page_id,
+                               default_pages=default_pages)
+
+    benchmark(resolve_all)
+
+
+def test_get_page_url(benchmark, skin, page_mappings):
+    """ Page url lookup for all pages """
+    page_ids = sorted(page_mappings)
+
+    def lookup_all():
+        for page_id in page_ids:
+            get_page_url(skin, page_mappings, page_id)
+
+    benchmark(lookup_all)
+
+
+def test_page_factory(benchmark, skin, page_mappings, driver):
+    """ Page factory for all pages """
+    from fakes import FakePage
+
+    page_ids = sorted(page_mappings)
+
+    def create_all():
+        for page_id in page_ids:
+            page_factory('https://skin0-coolsite.com', driver, FakePage,
+                         page_mappings, skin, page_id=page_id)
+
+    benchmark(create_all)
+
+
+def test_build_page_index(benchmark, skin, page_mappings):
+    """ Page index build for a large page mapping """
+    benchmark(build_page_index, skin, 'https://skin0-coolsite.com',
+              page_mappings)
+
+
+def test_validate_page_mappings(benchmark, default_pages, page_mappings):
+    """ Page mappings validation for a large page mapping """
+    assert benchmark(validate_page_mappings, default_pages,
+                     page_mappings) == []
@@ -0,0 +1,9 @@
+import sys
+
+collect_ignore = []
+if sys.version_info < (3, 5):
+    # asyncio based modules (Python 3 only)
+    collect_ignore.extend([
+        'pypom_navigation/async_navigation.py',
+        'tests/test_async_navigation.py',
+    ])
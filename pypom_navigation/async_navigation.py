@@ -0,0 +1,62 @@
+import asyncio
+import functools
+import threading
+
+
+class AsyncNavigation(object):
+    """ Awaitable wrapper of a :class:`pypom_navigation.navigation.Navigation`
+        instance (Python 3 only).
+
+        Navigation steps run in a thread pool executor (the event loop
+        default one if not provided) so that blocking drivers do not
+        block the event loop and several navigations, each one with its
+        own driver, can be driven concurrently::
+
+            await asyncio.gather(
+                navigation1.visit_page('HomePage'),
+                navigation2.visit_page('LoginPage'))
+
+        Steps of the same navigation run one at a time, since they
+        change the wrapped page. The driver is resolved on the event
+        loop thread before the first step (fixtures are not thread
+        safe).
+
+        Any other attribute is looked up on the wrapped navigation.
+    """
+
+    def __init__(self, navigation, executor=None):
+        self.navigation = navigation
+        self.executor = executor
+        self.lock = threading.Lock()
+
+    def __getattr__(self, name):
+        return getattr(self.navigation, name)
+
+    def run(self, func, *args, **kwargs):
+        """ Run func in the executor, after the previous steps of this
+            navigation, and return an awaitable result
+        """
+        if self.navigation.page is None:
+            # the browser fixture (or a pool driver) is set up here
+            self.navigation.driver
+        loop = asyncio.get_event_loop()
+        return loop.run_in_executor(
+            self.executor, functools.partial(
+                self._run_locked, func, *args, **kwargs))
+
+    def _run_locked(self, func, *args, **kwargs):
+        with self.lock:
+            return func(*args, **kwargs)
+
+    def visit_page(self, page_id, **kwargs):
+        """ Awaitable ``visit_page`` """
+        return self.run(self.navigation.visit_page, page_id, **kwargs)
+
+    def update_page(self, page_id, **kwargs):
+        """ Awaitable ``update_page`` """
+        return self.run(self.navigation.update_page, page_id, **kwargs)
+
+    def action_performed(self, action, fallback=None, **kwargs):
+        """ Awaitable ``action_performed`` """
+        return self.run(self.navigation.action_performed, action,
+                        fallback=fallback, **kwargs)
@@ -0,0 +1,76 @@
+try:
+    from types import MappingProxyType
+except ImportError:
+    # python2 compatibility
+    MappingProxyType = dict
+
+class SkinConfig(object):
+    """ Read only settings of a skin built once per session from
+        variables: base url and credentials.
+
+        >>> config = build_skin_config(
+        ...     'skin1',
+        ...     {'skins': {'skin1': {
+        ...          'base_url': 'https://skin1-coolsite.com',
+        ...          'credentials': {'Administrator': {
+        ...              'username': 'admin', 'password': 'pwd'}}}}})
+        >>> config.base_url
+        'https://skin1-coolsite.com'
+        >>> config.credentials['Administrator']['username']
+        'admin'
+    """
+    __slots__ = ('skin', 'base_url', 'credentials')
+
+    def __init__(self, skin, base_url, credentials):
+        set_attr = super(SkinConfig, self).__setattr__
+        set_attr('skin', skin)
+        set_attr('base_url', base_url)
+        set_attr('credentials', MappingProxyType(dict(credentials)))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('{0} is read only'.format(
+            self.__class__.__name__))
+
+    def __repr__(self):
+        return '<{0} {1} {2}>'.format(
+            self.__class__.__name__, self.skin, self.base_url)
+
+
+def slice_variables(variables, skin_names=None):
+    """ Return a copy of variables keeping only the given skins (all the
+        skins if not provided). Raise ValueError if variables are not
+        valid.
+
+        >>> slice_variables(
+        ...     {'default_timeout': 5,
+        ...      'skins': {'skin1': {'base_url': 'https://skin1'},
+        ...                'skin2': {'base_url': 'https://skin2'}}},
+        ...     ['skin1']) == {
+        ...     'default_timeout': 5,
+        ...     'skins': {'skin1': {'base_url': 'https://skin1'}}}
+        True
+    """
+    if not isinstance(variables, dict):
+        raise ValueError('variables must be a mapping')
+    skins = variables.get('skins', {})
+    if not isinstance(skins, dict):
+        raise ValueError('variables skins must be a mapping')
+    for skin_name, skin_variables in skins.items():
+        if not isinstance(skin_variables, dict):
+            raise ValueError(
+                'variables for skin {0} must be a mapping'.format(skin_name))
+    result = dict(variables)
+    if skin_names and 'skins' in variables:
+        result['skins'] = dict(
+            (skin_name, skins[skin_name])
+            for skin_name in skin_names if skin_name in skins)
+    return result
+
+
+def build_skin_config(skin_name, variables):
+    """ Return the :class:`SkinConfig` for the given skin """
+    skin_variables = variables.get('skins', {}).get(skin_name, {})
+    return SkinConfig(
+        skin_name,
+        skin_variables.get('base_url', ''),
+        skin_variables.get('credentials', {}))
@@ -0,0 +1,122 @@
+import codecs
+import csv
+import io
+import json
+import os
+
+from .util import string_types
+
+# data source formats by file extension
+DATA_FORMATS = {
+    '.csv': 'csv',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.yml': 'yaml',
+    '.yaml': 'yaml',
+}
+
+
+def get_data_format(path, data_format=None):
+    """ Return the data format of path, guessed by file extension if not
+        provided
+    """
+    if data_format is None:
+        data_format = DATA_FORMATS.get(os.path.splitext(path)[1].lower())
+    if data_format not in ('csv', 'jsonl', 'yaml'):
+        raise ValueError('unsupported data source {0}'.format(path))
+    return data_format
+
+
+def _iter_records(data_file):
+    """ Yield the offset and the raw bytes of each CSV record, records
+        can span multiple lines if quoted
+    """
+    offset = data_file.tell()
+    record = b''
+    for line in iter(data_file.readline, b''):
+        record += line
+        if record.count(b'"') % 2:
+            # quoted newline, the record continues
+            continue
+        yield offset, record
+        offset += len(record)
+        record = b''
+    if record:
+        yield offset, record
+
+
+def _is_yaml_item(line):
+    """ True if line starts a top level YAML sequence item """
+    return line[:1] == b'-' and line[1:2] in (b' ', b'\t', b'\r', b'\n')
+
+
+def _skip_bom(data_file):
+    """ Skip the UTF-8 byte order mark (added by some editors and
+        spreadsheet exports) and return the data start offset
+    """
+    if data_file.read(len(codecs.BOM_UTF8)) == codecs.BOM_UTF8:
+        return len(codecs.BOM_UTF8)
+    data_file.seek(0)
+    return 0
+
+
+def iter_row_offsets(path, data_format):
+    """ Yield the byte offset of each data row of path without parsing
+        rows, so memory usage does not depend on the data size.
+
+        CSV files start with a header record, JSON lines files have an
+        object per line and YAML files are a top level sequence of
+        mappings (items start with ``-`` on the first column).
+    """
+    with open(path, 'rb') as data_file:
+        if data_format == 'csv':
+            records = _iter_records(data_file)
+            next(records, None)  # header
+            for offset, record in records:
+                if record.strip():
+                    yield offset
+            return
+        # skip the byte order mark, if any
+        offset = _skip_bom(data_file)
+        if data_format == 'jsonl':
+            for line in iter(data_file.readline, b''):
+                if line.strip():
+                    yield offset
+                offset += len(line)
+        else:
+            for line in iter(data_file.readline, b''):
+                if _is_yaml_item(line):
+                    yield offset
+                offset += len(line)
+
+
+def read_row(path, data_format, offset):
+    """ Return the data row of path starting at offset """
+    with open(path, 'rb') as data_file:
+        if data_format == 'csv':
+            header = next(_iter_records(data_file))[1]
+            data_file.seek(offset)
+            record = next(_iter_records(data_file))[1]
+            reader = csv.reader(io.StringIO(
+                (header + record).decode('utf-8-sig'), newline=''))
+            keys = next(reader)
+            return dict(zip(keys, next(reader)))
+        data_file.seek(offset)
+        if data_format == 'jsonl':
+            return json.loads(data_file.readline().decode('utf-8'))
+        lines = [data_file.readline()]
+        for line in iter(data_file.readline, b''):
+            if _is_yaml_item(line):
+                break
+            lines.append(line)
+        import yaml
+        return yaml.safe_load(b''.join(lines).decode('utf-8'))[0]
+
+
+def render_row(row, parametrizer):
+    """ Return the row with its string values rendered by parametrizer
+    """
+    return dict(
+        (key, parametrizer.parametrize(value)
+         if isinstance(value, string_types) else value)
+        for key, value in row.items())
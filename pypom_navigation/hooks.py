@@ -0,0 +1,28 @@
+def pytest_pypom_navigation_step(navigation, step, page_id, timings):
+    """ Called after each navigation step (``visit_page``, ``update_page``
+        or ``action_performed``) if navigation timings are enabled.
+
+        :param navigation: the navigation instance
+        :param step: navigation step name
+        :param page_id: the page id (None for fallback pages)
+        :param timings: mapping of phase (``resolve``, ``visit``, ``wait``,
+                        ``total``) to duration in seconds
+    """
+
+
+def pytest_pypom_navigation_bdd_vars(register):
+    """ Register additional ``bdd_vars`` computed only when referenced.
+        Called once per session::
+
+            def pytest_pypom_navigation_bdd_vars(register):
+                register('customer_id',
+                         lambda request: create_customer(),
+                         scope='session')
+
+        :param register: ``register(name, factory, scope='test')``
+                         callable. The factory is called with the pytest
+                         ``request`` of the test referencing the value
+                         for the first time, then the value is cached
+                         for the current test, module or session (and
+                         skin) depending on scope
+    """
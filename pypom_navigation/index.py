@@ -0,0 +1,168 @@
+from collections import deque
+try:
+    from urlparse import urljoin
+except ImportError:
+    # python3 compatibility
+    from urllib.parse import urljoin
+try:
+    from types import MappingProxyType
+except ImportError:
+    # python2 compatibility
+    MappingProxyType = dict
+
+from .util import page_class_cache
+
+
+class PageRecord(object):
+    """ Compiled ``page_mappings`` entry for a given skin.
+
+        Holds the absolute page url, the page class mapped for the skin
+        (resolved on first access, ``None`` if not mapped) and the
+        actions table.
+    """
+    __slots__ = ('page_id', 'path', 'url', 'page_class_name', 'actions',
+                 '_page_class')
+
+    def __init__(self, page_id, path, url, page_class_name, actions):
+        set_attr = super(PageRecord, self).__setattr__
+        set_attr('page_id', page_id)
+        set_attr('path', path)
+        set_attr('url', url)
+        set_attr('page_class_name', page_class_name)
+        set_attr('actions', MappingProxyType(dict(actions)))
+        set_attr('_page_class', None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('{0} is read only'.format(
+            self.__class__.__name__))
+
+    def __repr__(self):
+        return '<{0} {1} {2}>'.format(
+            self.__class__.__name__, self.page_id, self.url)
+
+    @property
+    def page_class(self):
+        """ Return the page class mapped for the skin or None """
+        if self._page_class is None and self.page_class_name is not None:
+            super(PageRecord, self).__setattr__(
+                '_page_class',
+                page_class_cache.resolve(self.page_class_name))
+        return self._page_class
+
+
+class PageIndex(object):
+    """ Read only index of :class:`PageRecord` by page id.
+
+        >>> index = build_page_index(
+        ...     'skin1',
+        ...     'https://skin1-coolsite.com',
+        ...     {'HomePage': {'path': '/home',
+        ...                   'actions': {'logout': 'LoginPage'}},
+        ...      'LoginPage': {}})
+        >>> index['HomePage'].url
+        'https://skin1-coolsite.com/home'
+        >>> index['HomePage'].actions['logout']
+        'LoginPage'
+        >>> index['LoginPage'].url
+        'https://skin1-coolsite.com/'
+        >>> index['LoginPage'].page_class is None
+        True
+    """
+    __slots__ = ('skin', 'base_url', 'records')
+
+    def __init__(self, skin, base_url, records):
+        set_attr = super(PageIndex, self).__setattr__
+        set_attr('skin', skin)
+        set_attr('base_url', base_url)
+        set_attr('records', MappingProxyType(records))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('{0} is read only'.format(
+            self.__class__.__name__))
+
+    def __getitem__(self, page_id):
+        return self.records[page_id]
+
+    def __contains__(self, page_id):
+        return page_id in self.records
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __len__(self):
+        return len(self.records)
+
+    def get(self, page_id, default=None):
+        """ Return the page record for page_id or default """
+        return self.records.get(page_id, default)
+
+    def shortest_path(self, source, target, is_valid=None):
+        """ Return the shortest list of ``(action, page_id)`` steps
+            leading from the source page to the target page following
+            the ``actions`` graph, None if the target is not reachable.
+
+            Edges can be filtered with ``is_valid(page_id, action)``.
+
+            >>> index = build_page_index('skin1', 'http://base', {
+            ...     'HomePage': {'actions': {'login': 'LoginPage',
+            ...                              'search': 'SearchPage'}},
+            ...     'LoginPage': {'actions': {'submit': 'ProfilePage'}},
+            ...     'SearchPage': {'actions': {'profile': 'ProfilePage'}},
+            ...     'ProfilePage': {}})
+            >>> index.shortest_path('HomePage', 'ProfilePage')
+            [('login', 'LoginPage'), ('submit', 'ProfilePage')]
+            >>> index.shortest_path(
+            ...     'HomePage', 'ProfilePage',
+            ...     is_valid=lambda page_id, action: action != 'login')
+            [('search', 'SearchPage'), ('profile', 'ProfilePage')]
+            >>> index.shortest_path('ProfilePage', 'HomePage') is None
+            True
+        """
+        if source == target:
+            return []
+        previous = {source: None}
+        queue = deque([source])
+        while queue:
+            page_id = queue.popleft()
+            record = self.records.get(page_id)
+            if record is None:
+                continue
+            for action in sorted(record.actions):
+                next_page_id = record.actions[action]
+                if next_page_id in previous:
+                    continue
+                if is_valid is not None and not is_valid(page_id, action):
+                    continue
+                previous[next_page_id] = (page_id, action)
+                if next_page_id == target:
+                    path = []
+                    while next_page_id != source:
+                        page_id, action = previous[next_page_id]
+                        path.append((action, next_page_id))
+                        next_page_id = page_id
+                    path.reverse()
+                    return path
+                queue.append(next_page_id)
+        return None
+
+
+def build_page_index(skin_name, skin_base_url, page_mappings):
+    """ Compile page_mappings for the given skin into a
+        :class:`PageIndex`.
+
+        Page classes are resolved lazily through the
+        ``pypom_navigation.util.page_class_cache``.
+    """
+    records = {}
+    for page_id, page_mapping in page_mappings.items():
+        path = page_mapping.get('path', '/')
+        page_class_mapping = page_mapping.get('page_class', None) or {}
+        page_class_name = page_class_mapping.get(
+            skin_name, page_class_mapping.get('fallback', None))
+        records[page_id] = PageRecord(
+            page_id,
+            path,
+            urljoin(skin_base_url, path),
+            page_class_name or None,
+            page_mapping.get('actions', None) or {})
+    return PageIndex(skin_name, skin_base_url, records)
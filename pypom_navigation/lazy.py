@@ -0,0 +1,119 @@
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    # python2 compatibility
+    from collections import MutableMapping
+
+
+class LazyPage(object):
+    """ Page proxy creating the page instance on first attribute access
+        (or when explicitly forced with :meth:`force`).
+
+        The driver is available without creating the page.
+
+        >>> from mock import MagicMock
+        >>> factory = MagicMock(return_value=MagicMock(title='Home'))
+        >>> page = LazyPage('driver', factory)
+        >>> page.driver
+        'driver'
+        >>> page.forced
+        False
+        >>> page.title
+        'Home'
+        >>> page.forced
+        True
+        >>> page.force() is factory.return_value
+        True
+        >>> factory.call_count
+        1
+    """
+
+    def __init__(self, driver, factory):
+        set_attr = super(LazyPage, self).__setattr__
+        set_attr('driver', driver)
+        set_attr('_factory', factory)
+        set_attr('_page', None)
+
+    @property
+    def forced(self):
+        """ True if the page instance has been created """
+        return self._page is not None
+
+    def force(self):
+        """ Create the page instance, if needed, and return it """
+        if self._page is None:
+            super(LazyPage, self).__setattr__('_page', self._factory())
+        return self._page
+
+    def __getattr__(self, name):
+        return getattr(self.force(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self.force(), name, value)
+
+    def __repr__(self):
+        if self._page is None:
+            return '<{0} not forced>'.format(self.__class__.__name__)
+        return '<{0} {1!r}>'.format(self.__class__.__name__, self._page)
+
+
+class LazyMapping(MutableMapping):
+    """ Mapping of values computed by factories on first access.
+
+        Values can be set or deleted like a regular dict.
+
+        >>> from mock import MagicMock
+        >>> factory = MagicMock(return_value='QA-123')
+        >>> mapping = LazyMapping({'test_run_identifier': factory})
+        >>> factory.called
+        False
+        >>> mapping['test_run_identifier']
+        'QA-123'
+        >>> mapping['test_run_identifier']
+        'QA-123'
+        >>> factory.call_count
+        1
+        >>> mapping['skin'] = 'skin1'
+        >>> sorted(mapping)
+        ['skin', 'test_run_identifier']
+    """
+
+    def __init__(self, factories):
+        self._factories = dict(factories)
+        self._values = {}
+
+    def is_computed(self, key):
+        """ True if the value for key is available without calling its
+            factory
+        """
+        return key in self._values
+
+    def __getitem__(self, key):
+        if key not in self._values:
+            self._values[key] = self._factories[key]()
+        return self._values[key]
+
+    def __setitem__(self, key, value):
+        self._values[key] = value
+
+    def __contains__(self, key):
+        return key in self._values or key in self._factories
+
+    def __delitem__(self, key):
+        if key not in self._values and key not in self._factories:
+            raise KeyError(key)
+        self._values.pop(key, None)
+        self._factories.pop(key, None)
+
+    def __iter__(self):
+        for key in self._factories:
+            yield key
+        for key in self._values:
+            if key not in self._factories:
+                yield key
+
+    def __len__(self):
+        return len(set(self._factories).union(self._values))
+
+    def __repr__(self):
+        return '<{0} {1}>'.format(self.__class__.__name__, sorted(self))
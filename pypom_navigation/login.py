@@ -0,0 +1,58 @@
+import threading
+import time
+
+
+class LoginCache(object):
+    """ Browser states (cookies, local and session storage) captured
+        after a real login, by skin, skin base url and user id.
+
+        States older than ``ttl`` seconds (if provided) are discarded.
+        ``is_logged_in(navigation)`` is the optional check used by
+        :meth:`pypom_navigation.navigation.Navigation.restore_login`
+        after a state is restored.
+
+        >>> cache = LoginCache(ttl=60, clock=lambda: 0)
+        >>> key = ('skin1', 'https://skin1-coolsite.com', 'Administrator')
+        >>> cache.set(key, {'cookies': []})
+        >>> cache.get(key)
+        {'cookies': []}
+        >>> cache.invalidate(key)
+        >>> cache.get(key) is None
+        True
+    """
+
+    def __init__(self, ttl=None, is_logged_in=None, clock=time.time):
+        self.ttl = ttl
+        self.is_logged_in = is_logged_in
+        self.clock = clock
+        self.states = {}
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """ Return the state captured for key or None """
+        with self.lock:
+            item = self.states.get(key)
+            if item is not None and self.ttl and \
+                    self.clock() - item[0] > self.ttl:
+                del self.states[key]
+                item = None
+            if item is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return item[1]
+
+    def set(self, key, state):
+        """ Store the state captured for key """
+        with self.lock:
+            self.states[key] = (self.clock(), state)
+
+    def invalidate(self, key=None):
+        """ Discard the state for key or all the states """
+        with self.lock:
+            if key is None:
+                self.states.clear()
+            else:
+                self.states.pop(key, None)
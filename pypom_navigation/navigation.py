@@ -4,14 +4,37 @@ except ImportError:
     # python3 compatibility
     from urllib.parse import urljoin
 
+from .index import build_page_index
+from .lazy import LazyPage
+from .timing import NULL_STEP_TIMER
 from .util import (
+    capture_browser_state,
+    clear_browser_state,
     get_page_class,
     get_page_url,
+    restore_browser_state,
 )
 
 
 class Navigation(object):
     page_id = None
+    # compiled page_mappings (see pypom_navigation.index), if available
+    page_index = None
+    # drivers pool (see pypom_navigation.pool), if enabled
+    browser_pool = None
+    pool_driver = None
+    # skip visit_page if the page is already loaded
+    visit_if_needed = False
+    skipped_visits = 0
+    # step timings (see pypom_navigation.timing), if enabled
+    timings = None
+    # update_page and action_performed wrap a LazyPage proxy (see
+    # pypom_navigation.lazy) instead of a loaded page instance
+    lazy_pages = False
+    # login states cache (see pypom_navigation.login), if enabled
+    login_cache = None
+    # checkpoints by skin, base url and name (see checkpoint)
+    checkpoints = None
 
     def __init__(self,
                  page,
@@ -35,62 +58,212 @@ class Navigation(object):
 
     def setPage(self, page, page_id=None):
         """ Set wrapping page and update reference links
-            for page and navigation
+            for page and navigation. Page snapshots (see
+            ``BasePage.snapshot``) are invalidated.
         """
         self.page = page
         self.page_id = page_id
-        if page is not None:
+        if page is not None and not isinstance(page, LazyPage):
             page.navigation = self
+            self.invalidate_snapshot()
+
+    def invalidate_snapshot(self):
+        """ Forget the memoized state of the current page, if any """
+        page = self.page
+        if isinstance(page, LazyPage):
+            if not page.forced:
+                return
+            page = page.force()
+        invalidate = getattr(page, 'invalidate_snapshot', None)
+        if invalidate is not None:
+            invalidate()
+
+    def reset(self):
+        """ Reset the browser state (cookies, local and session storage)
+            keeping the current driver, if any, so that this navigation
+            instance can be reused by another test without relaunching
+            the browser.
+        """
+        if self.page is not None:
+            clear_browser_state(self.page.driver)
+            self.setPage(self.page)
 
     def merge_kwargs(self, keyword_args):
         """ merge keyword args with default keywordargs """
         kwargs = self.kwargs.copy()
-        new_kwargs = keyword_args.copy()
-        kwargs.update(new_kwargs)
+        kwargs.update(keyword_args)
         return kwargs
 
     def visit_page(self, page_id, **kwargs):
         """ Visit page id reference in navigation
-            class
+            class.
+
+            If ``visit_if_needed`` is enabled and the current page is
+            already the requested one (same page id and url) no visit is
+            performed and the current page is returned.
         """
-        kwargs = self.merge_kwargs(kwargs)
-        page_url = urljoin(self.skin_base_url, self.get_page_url(page_id))
+        page_url = self.get_page_absolute_url(page_id)
+        if self.visit_if_needed and self.page is not None and \
+                self.page_id == page_id and \
+                self.page.driver.url == page_url:
+            self.skipped_visits += 1
+            self.invalidate_snapshot()
+            return self.page
+        timer = self.start_timer('visit_page', page_id)
         page_instance = self.get_page_instance(page_id=page_id, **kwargs)
+        timer.lap('resolve')
         page_instance.driver.visit(page_url)
+        timer.lap('visit')
         page_instance.wait_for_page_to_load()
+        timer.lap('wait')
         self.setPage(page_instance, page_id=page_id)
+        timer.stop()
         return page_instance
 
     def update_page(self, page_id, **kwargs):
         """ Update the wrapped page with the appropriate instance
             mapped to the passed page_id
         """
-        kwargs = self.merge_kwargs(kwargs)
-        page_instance = self.get_page_instance(page_id=page_id, **kwargs)
-        page_instance.wait_for_page_to_load()
-        self.setPage(page_instance, page_id=page_id)
-        return page_instance
+        return self._load_page('update_page', page_id, None, kwargs)
 
     def action_performed(self, action, fallback=None, **kwargs):
         """ Update the wrapped page with the appropriate instance
             referenced by the given action on the current page
         """
-        kwargs = self.merge_kwargs(kwargs)
-        page_mapping = self.page_mappings[self.page_id]
-        page_id = page_mapping.get('actions', {}).get(action)
+        page_id = self.get_page_actions(self.page_id).get(action)
         if page_id:
-            return self.update_page(page_id, **kwargs)
+            return self._load_page('action_performed', page_id, None, kwargs)
         else:
-            page_instance = self.get_page_instance(fallback=fallback, **kwargs)
-            page_instance.wait_for_page_to_load()
-            self.setPage(page_instance)
+            return self._load_page('action_performed', None, fallback, kwargs)
+
+    def _load_page(self, step, page_id, fallback, kwargs):
+        """ Wrap a fresh page instance for page_id (or fallback) waiting
+            for the page to load.
+
+            If ``lazy_pages`` is enabled a :class:`LazyPage` proxy is
+            wrapped instead: the page instance is created and loaded on
+            first access, then it replaces the proxy if still wrapped.
+        """
+        if not self.lazy_pages:
+            page_instance, timer = self._create_page(
+                step, page_id, fallback, kwargs)
+            self.setPage(page_instance, page_id=page_id)
+            timer.stop()
             return page_instance
 
+        def factory():
+            page_instance, timer = self._create_page(
+                step, page_id, fallback, kwargs)
+            if self.page is lazy_page:
+                self.setPage(page_instance, page_id=page_id)
+            else:
+                page_instance.navigation = self
+            timer.stop()
+            return page_instance
+        lazy_page = LazyPage(self.driver, factory)
+        self.setPage(lazy_page, page_id=page_id)
+        return lazy_page
+
+    def _create_page(self, step, page_id, fallback, kwargs):
+        """ Return a fresh page instance for page_id (or fallback)
+            waiting for the page to load and the step timer to be
+            stopped
+        """
+        timer = self.start_timer(step, page_id)
+        page_instance = self.get_page_instance(
+            page_id=page_id, fallback=fallback, **kwargs)
+        timer.lap('resolve')
+        page_instance.wait_for_page_to_load()
+        timer.lap('wait')
+        return page_instance, timer
+
+    def start_timer(self, step, page_id=None):
+        """ Return a step timer, a no-op one if timings are disabled """
+        if self.timings is None:
+            return NULL_STEP_TIMER
+        return self.timings.start(self, step, page_id)
+
+    def navigate_to(self, page_id, **kwargs):
+        """ Reach the given page id from the current page with the fewest
+            page transitions.
+
+            If the target page is reachable from the current page
+            following the ``actions`` mappings, and every page in the way
+            provides a method named after the action, the actions are
+            replayed (see ``perform_action``). Otherwise, or when recorded
+            timings say that a direct visit is cheaper, the page is
+            visited.
+        """
+        if self.page is not None and self.page_id == page_id:
+            return self.page
+        path = None
+        if self.page is not None and self.page_id is not None:
+            path = self.get_action_path(self.page_id, page_id)
+        if not path or not self._is_path_cheaper(path, page_id):
+            return self.visit_page(page_id, **kwargs)
+        for action, next_page_id in path:
+            timer = self.start_timer('follow_action', next_page_id)
+            self.perform_action(action)
+            self.action_performed(action, **kwargs)
+            timer.stop()
+        return self.page
+
+    def get_action_path(self, source, target):
+        """ Return the shortest replayable list of ``(action, page_id)``
+            steps from source to target or None
+        """
+        if self.page_index is None:
+            self.page_index = build_page_index(
+                self.skin, self.skin_base_url, self.page_mappings)
+
+        def is_valid(page_id, action):
+            page_class = self.get_page_class(page_id=page_id)
+            return callable(getattr(page_class, action, None))
+        return self.page_index.shortest_path(source, target,
+                                             is_valid=is_valid)
+
+    def perform_action(self, action):
+        """ Perform the given action on the current page calling the page
+            method with the same name
+        """
+        return getattr(self.page, action)()
+
+    def _is_path_cheaper(self, path, page_id):
+        """ Compare the recorded mean durations of the path steps with a
+            direct visit. Paths are preferred if timings are not
+            available.
+        """
+        if self.timings is None:
+            return True
+        visit = self.timings.mean(self.skin, page_id, 'visit_page')
+        steps = [self.timings.mean(self.skin, next_page_id, 'follow_action')
+                 for action, next_page_id in path]
+        if visit is None or None in steps:
+            return True
+        return sum(steps) <= visit
+
     def get_page_url(self, page_id):
         """ Return the page url for the current wrapped page """
         return get_page_url(self.skin,
                             self.page_mappings, page_id)
 
+    def get_page_absolute_url(self, page_id):
+        """ Return the absolute page url for the given page_id.
+
+            Compiled urls are used unless ``get_page_url`` is overridden
+            by a subclass.
+        """
+        if self.page_index is not None and \
+                type(self).get_page_url is Navigation.get_page_url:
+            return self.page_index[page_id].url
+        return urljoin(self.skin_base_url, self.get_page_url(page_id))
+
+    def get_page_actions(self, page_id):
+        """ Return the actions mapping (action -> page id) for page_id """
+        if self.page_index is not None:
+            return self.page_index[page_id].actions
+        return self.page_mappings[page_id].get('actions', {})
+
     def get_credentials(self, user_id):
         """ Return a tuple with username and password for the given
             user_id
@@ -98,9 +271,154 @@ class Navigation(object):
         user_credentials = self.credentials_mapping[user_id]
         return user_credentials['username'], user_credentials['password']
 
+    def get_login_key(self, user_id):
+        """ Return the login cache key for user_id """
+        return (self.skin, self.skin_base_url, user_id)
+
+    def login(self, user_id, do_login, is_logged_in=None):
+        """ Log in as user_id calling ``do_login(username, password)``
+            unless a login state previously captured for the same skin,
+            base url and user id is restored (see ``restore_login``).
+
+            Return True if the login state has been restored.
+        """
+        if self.restore_login(user_id, is_logged_in=is_logged_in):
+            return True
+        do_login(*self.get_credentials(user_id))
+        self.capture_login(user_id)
+        return False
+
+    def capture_login(self, user_id):
+        """ Store the current browser state (cookies, local and session
+            storage) as login state for user_id, if the login cache is
+            enabled
+        """
+        if self.login_cache is None:
+            return
+        self.login_cache.set(self.get_login_key(user_id),
+                             capture_browser_state(self.driver))
+
+    def restore_login(self, user_id, is_logged_in=None):
+        """ Restore the login state captured for user_id, visiting the
+            skin base url first if the browser is on another site. Then
+            the skin base url is loaded again with the restored state
+            and wrapped with a fresh default page instance.
+
+            The state is checked with ``is_logged_in(navigation)`` (or
+            the login cache one) and discarded if the check fails.
+
+            Return True if the login state has been restored.
+        """
+        if self.login_cache is None:
+            return False
+        key = self.get_login_key(user_id)
+        state = self.login_cache.get(key)
+        if state is None:
+            return False
+        timer = self.start_timer('restore_login')
+        driver = self.visit_site()
+        restore_browser_state(driver, state)
+        page_instance = self.get_page_instance()
+        timer.lap('resolve')
+        page_instance.driver.visit(self.skin_base_url)
+        timer.lap('visit')
+        page_instance.wait_for_page_to_load()
+        timer.lap('wait')
+        self.setPage(page_instance)
+        timer.stop()
+        is_logged_in = is_logged_in or self.login_cache.is_logged_in
+        if is_logged_in is not None and not is_logged_in(self):
+            self.invalidate_login(user_id)
+            return False
+        return True
+
+    def invalidate_login(self, user_id=None):
+        """ Discard the login state captured for user_id or, if not
+            provided, all the captured login states
+        """
+        if self.login_cache is None:
+            return
+        if user_id is None:
+            self.login_cache.invalidate()
+        else:
+            self.login_cache.invalidate(self.get_login_key(user_id))
+
+    def visit_site(self):
+        """ Visit the skin base url if the browser is on another site
+            (cookies and storage can only be set for the current site)
+            and return the driver
+        """
+        driver = self.driver
+        if not (driver.url or '').startswith(self.skin_base_url):
+            driver.visit(self.skin_base_url)
+        return driver
+
+    def get_checkpoint_key(self, name):
+        """ Return the checkpoints key for name """
+        return (self.skin, self.skin_base_url, name)
+
+    def checkpoint(self, name):
+        """ Store the current page id, url and browser state (cookies,
+            local and session storage) as checkpoint name, so that
+            following tests sharing the same steps can ``restore`` it
+        """
+        if self.checkpoints is None:
+            self.checkpoints = {}
+        driver = self.driver
+        self.checkpoints[self.get_checkpoint_key(name)] = {
+            'page_id': self.page_id,
+            'url': driver.url,
+            'browser_state': capture_browser_state(driver),
+        }
+
+    def restore(self, name):
+        """ Restore the browser state of checkpoint name, visit its url
+            and wrap a fresh page instance for its page id.
+
+            Return the page instance or None if there is no such
+            checkpoint.
+        """
+        state = (self.checkpoints or {}).get(self.get_checkpoint_key(name))
+        if state is None:
+            return None
+        page_id = state['page_id']
+        timer = self.start_timer('restore', page_id)
+        driver = self.visit_site()
+        clear_browser_state(driver)
+        restore_browser_state(driver, state['browser_state'])
+        page_instance = self.get_page_instance(page_id=page_id)
+        timer.lap('resolve')
+        page_instance.driver.visit(state['url'])
+        timer.lap('visit')
+        page_instance.wait_for_page_to_load()
+        timer.lap('wait')
+        self.setPage(page_instance, page_id=page_id)
+        timer.stop()
+        return page_instance
+
+    def prefix(self, name, steps):
+        """ Restore checkpoint name if available, otherwise call
+            ``steps(navigation)`` and store the checkpoint.
+
+            Tests sharing the same prefix should be marked with
+            ``@pytest.mark.navigation_prefix(name)`` so that they run
+            together (and on the same xdist worker).
+
+            Return True if the checkpoint has been restored.
+        """
+        if self.restore(name) is not None:
+            return True
+        steps(self)
+        self.checkpoint(name)
+        return False
+
     def get_page_class(self, page_id=None, fallback=None):
         """ Return the page class """
         fallback = fallback and fallback or self.default_page_class
+        if self.page_index is not None:
+            if not page_id:
+                return fallback
+            return self.page_index[page_id].page_class or fallback
         return get_page_class(
             self.skin,
             self.page_mappings,
@@ -108,18 +426,38 @@ class Navigation(object):
             fallback=fallback)
 
     def get_page_instance(self, page_id=None, fallback=None, **kwargs):
-        """ Get a fresh page instance """
-        kwargs = self.merge_kwargs(kwargs)
+        """ Get a fresh page instance.
+
+            Default keyword args (``self.kwargs``) are used as they are
+            unless overridden, in that case they are merged just once
+            here.
+        """
+        kwargs = kwargs and self.merge_kwargs(kwargs) or self.kwargs
         page_class = self.get_page_class(page_id=page_id, fallback=fallback)
         return page_class(self.driver, **kwargs)
 
     @property
     def driver(self):
-        """ Return page driver or a fresh browser fixture to be used as driver
-            for first initialization
+        """ Return page driver or a fresh browser fixture (or a driver
+            checked out from the browser pool if enabled) to be used as
+            driver for first initialization
         """
         if self.page is not None:
             value = self.page.driver
+        elif self.browser_pool is not None:
+            if self.pool_driver is None:
+                self.pool_driver = self.browser_pool.checkout(
+                    self.skin, self.skin_base_url)
+            value = self.pool_driver
         else:
             value = self.request.getfixturevalue('browser')
         return value
+
+    def release_driver(self, error=False):
+        """ Give back the driver obtained from the browser pool, if any """
+        if self.pool_driver is not None:
+            self.browser_pool.checkin(
+                self.pool_driver, self.skin, self.skin_base_url,
+                error=error)
+            self.pool_driver = None
+            self.setPage(None)
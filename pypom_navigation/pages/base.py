@@ -1,9 +1,36 @@
+import json
+
 from pypom_form.form import BaseFormPage
 
+from .wait import (
+    AdaptiveWait,
+    ExpectedDurations,
+)
+
+
+# return, for each css selector, the matching elements
+FIND_MANY_SCRIPT = """(function (selectors) {
+    return selectors.map(function (selector) {
+        return Array.prototype.slice.call(
+            document.querySelectorAll(selector));
+    });
+})(%s)"""
+
 
 class BasePage(BaseFormPage):
     """ Base page """
 
+    # adaptive polling settings (see pypom_navigation.pages.wait):
+    # True or a dict of AdaptiveWait keyword args. If None the
+    # ``adaptive_wait`` variable is used
+    adaptive_wait = None
+    # durations learned by adaptive waits, shared by all pages
+    expected_durations = ExpectedDurations()
+    # True memoizes the page state read between two navigation steps
+    # (see snapshot). If None the ``snapshot_cache`` variable is used
+    snapshot_cache = None
+    _snapshot = None
+
     @property
     def current_url(self):
         """
@@ -12,7 +39,66 @@ class BasePage(BaseFormPage):
             :return: current_url of the driver instance
             :rtype: str
         """
-        return self.driver.url
+        return self.snapshot('current_url', lambda: self.driver.url)
+
+    def get_setting(self, name):
+        """
+            Returns the page class attribute with the given name or, if
+            None, the variable with the same name
+
+            :return: setting value
+            :rtype: object
+        """
+        value = getattr(self, name)
+        navigation = getattr(self, 'navigation', None)
+        if value is None and navigation is not None:
+            value = navigation.variables.get(name)
+        return value
+
+    def snapshot(self, name, getter):
+        """
+            Returns the value read with getter. If the snapshot cache
+            is enabled the value is memoized until the next navigation
+            step (see ``invalidate_snapshot``).
+
+            :return: value returned by getter
+            :rtype: object
+        """
+        if not self.get_setting('snapshot_cache'):
+            return getter()
+        if self._snapshot is None:
+            self._snapshot = {}
+        if name not in self._snapshot:
+            self._snapshot[name] = getter()
+        return self._snapshot[name]
+
+    def invalidate_snapshot(self, name=None):
+        """
+            Forget the memoized page state, only the given name
+            if provided. Called by navigation on each page transition.
+        """
+        if name is None:
+            self._snapshot = None
+        elif self._snapshot is not None:
+            self._snapshot.pop(name, None)
+
+    def get_adaptive_wait(self):
+        """
+            Returns the adaptive wait strategy, if enabled with the
+            ``adaptive_wait`` class attribute or variable. The page
+            timeout (``default_timeout``) is used as timeout.
+
+            :return: AdaptiveWait instance or None
+            :rtype: object
+        """
+        settings = self.get_setting('adaptive_wait')
+        if not settings:
+            return None
+        if settings is True:
+            settings = {}
+        return AdaptiveWait(timeout=self.timeout,
+                            durations=self.expected_durations,
+                            **settings)
 
     def wait_for_url_change(self, url):
         """
@@ -21,14 +107,115 @@ class BasePage(BaseFormPage):
             :return: BasePage instance
             :rtype: object
         """
-        self.wait.until(lambda s: self.current_url != url)
+        adaptive_wait = self.get_adaptive_wait()
+        if adaptive_wait is None:
+            self.wait.until(lambda s: self.driver.url != url)
+        else:
+            adaptive_wait.until(
+                lambda: self.driver.url != url,
+                key=(self.__class__, 'wait_for_url_change'),
+                message='url {0} not changed'.format(url))
+        self.invalidate_snapshot()
         return self
 
     def has_text(self, text):
         """
             Check for text in page.
 
+            With adaptive waits, negative checks give up once the text
+            is overdue compared to the durations learned for this page.
+
             :return: True if the given text is present
             :rtype: bool
         """
-        return self.driver.is_text_present(text, wait_time=self.timeout)
+        if self._snapshot_has_text(text):
+            return True
+        # the page is changing, the text snapshot is out of date
+        self.invalidate_snapshot('text')
+        adaptive_wait = self.get_adaptive_wait()
+        if adaptive_wait is None:
+            return self.driver.is_text_present(text, wait_time=self.timeout)
+        key = (self.__class__, 'has_text')
+        return adaptive_wait.poll(
+            lambda: self._is_text_present(text),
+            key=key,
+            timeout=adaptive_wait.negative_timeout(key))
+
+    def _snapshot_has_text(self, text):
+        """ Check for text in the page text snapshot, if enabled """
+        if not self.get_setting('snapshot_cache'):
+            return False
+        try:
+            page_text = self.snapshot(
+                'text', lambda: self.driver.find_by_tag('body').text)
+        except Exception:
+            # body not available yet or stale while the page changes
+            return False
+        return text in page_text
+
+    def _get_page_text(self):
+        """ Return the page body text or None if not available """
+        try:
+            return self.driver.find_by_tag('body').text
+        except Exception:
+            # body not available yet or stale while the page changes
+            return None
+
+    def _is_text_present(self, text):
+        """ Check for text in page once """
+        page_text = self._get_page_text()
+        return page_text is not None and text in page_text
+
+    def has_texts(self, texts):
+        """
+            Check for many texts in page reading the body text once per
+            check, waiting for all of them up to the page timeout.
+
+            Texts are searched in the body text like splinter
+            ``is_text_present`` (used by ``has_text``) does, so hidden
+            elements are not considered. Old splinter versions search
+            text nodes with XPath instead, hidden ones included.
+
+            :return: mapping of each text to True if present
+            :rtype: dict
+        """
+        results = dict((text, self._snapshot_has_text(text))
+                       for text in texts)
+        if all(results.values()):
+            return results
+        self.invalidate_snapshot('text')
+
+        def check():
+            page_text = self._get_page_text()
+            if page_text is None:
+                return False
+            for text in results:
+                results[text] = text in page_text
+            return all(results.values())
+
+        adaptive_wait = self.get_adaptive_wait()
+        key = (self.__class__, 'has_texts')
+        if adaptive_wait is None:
+            AdaptiveWait(timeout=self.timeout).poll(check)
+        else:
+            adaptive_wait.poll(check,
+                               key=key,
+                               timeout=adaptive_wait.negative_timeout(key))
+        return results
+
+    def find_many(self, selectors):
+        """
+            Find the elements matching many css selectors with one script
+            execution. Elements are the ones returned by the driver
+            script execution and they are memoized if the snapshot cache
+            is enabled.
+
+            :return: mapping of each selector to the list of elements
+            :rtype: dict
+        """
+        selectors = list(selectors)
+        elements = self.snapshot(
+            ('find_many', tuple(selectors)),
+            lambda: self.driver.evaluate_script(
+                FIND_MANY_SCRIPT % json.dumps(selectors)))
+        return dict(zip(selectors, elements))
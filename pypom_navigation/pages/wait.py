@@ -0,0 +1,120 @@
+import time
+
+from selenium.common.exceptions import TimeoutException
+
+
+class ExpectedDurations(object):
+    """ Learned durations by key (exponential moving average).
+
+        >>> durations = ExpectedDurations(alpha=0.5)
+        >>> durations.get('HomePage') is None
+        True
+        >>> durations.add('HomePage', 2)
+        >>> durations.add('HomePage', 4)
+        >>> durations.get('HomePage')
+        3.0
+    """
+
+    def __init__(self, alpha=0.3):
+        self.alpha = alpha
+        self.durations = {}
+
+    def get(self, key):
+        """ Return the expected duration (seconds) or None """
+        return self.durations.get(key)
+
+    def add(self, key, duration):
+        """ Update the expected duration with a measured one """
+        previous = self.durations.get(key)
+        if previous is None:
+            self.durations[key] = duration
+        else:
+            self.durations[key] = previous + self.alpha * (duration - previous)
+
+    def clear(self):
+        """ Forget all the learned durations """
+        self.durations.clear()
+
+
+class AdaptiveWait(object):
+    """ Poll conditions with exponential backoff.
+
+        The first check is immediate, then the poll interval starts
+        from ``initial_interval`` (or from the expected duration learned
+        for the given key, if any) and it is multiplied by ``backoff``
+        after each check, up to ``max_interval``.
+
+        Checks that are likely to fail (see :meth:`negative_timeout`)
+        give up after ``negative_factor`` times the expected duration
+        (at least ``negative_min`` seconds) instead of waiting for the
+        whole ``timeout``.
+    """
+
+    def __init__(self,
+                 timeout=10,
+                 initial_interval=0.01,
+                 max_interval=0.5,
+                 backoff=2,
+                 negative_factor=3,
+                 negative_min=0.5,
+                 durations=None,
+                 clock=time.time,
+                 sleep=time.sleep):
+        self.timeout = timeout
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.negative_factor = negative_factor
+        self.negative_min = negative_min
+        self.durations = durations
+        self.clock = clock
+        self.sleep = sleep
+
+    def expected(self, key):
+        """ Return the expected duration learned for key or None """
+        if key is None or self.durations is None:
+            return None
+        return self.durations.get(key)
+
+    def negative_timeout(self, key):
+        """ Return the timeout for a check that could fail: the whole
+            ``timeout`` if nothing has been learned yet for key
+        """
+        expected = self.expected(key)
+        if expected is None:
+            return self.timeout
+        return min(self.timeout,
+                   max(self.negative_min, expected * self.negative_factor))
+
+    def poll(self, condition, key=None, timeout=None):
+        """ Call condition until it returns a true value or timeout
+            (default ``self.timeout``) expires and return its last
+            value. Successful durations are learned for key.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        start = self.clock()
+        end = start + timeout
+        interval = self.initial_interval
+        expected = self.expected(key)
+        if expected:
+            interval = min(max(expected, interval), self.max_interval)
+        while True:
+            value = condition()
+            now = self.clock()
+            if value:
+                if key is not None and self.durations is not None:
+                    self.durations.add(key, now - start)
+                return value
+            if now >= end:
+                return value
+            self.sleep(min(interval, end - now))
+            interval = min(interval * self.backoff, self.max_interval)
+
+    def until(self, condition, key=None, message=''):
+        """ Like :meth:`poll` but raise a selenium ``TimeoutException``
+            if the condition is not met
+        """
+        value = self.poll(condition, key=key)
+        if not value:
+            raise TimeoutException(message)
+        return value
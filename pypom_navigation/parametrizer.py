@@ -0,0 +1,227 @@
+from collections import OrderedDict
+import re
+from string import Template
+import threading
+
+from jinja2 import (
+    Template as Jinja2Template,
+    meta,
+)
+from parametrizer import Parametrizer
+
+# jinja2 markers, see Parametrizer.parametrize
+JINJA2_MARKERS = ('{!', '{%', '{#', '\r')
+# jinja2 tags, raw blocks are not supported by the substitution binding
+JINJA2_TAG = re.compile(r'\{!.*?!\}|\{%.*?%\}|\{#.*?#\}', re.DOTALL)
+JINJA2_RAW = re.compile(r'\{%-?\s*raw\s*-?%\}')
+# jinja2 variables bound to the substituted values outside tags
+SUBSTITUTION_NAME = '_substitution_{0}'
+
+
+class TemplateCache(object):
+    """ Bounded LRU cache of compiled templates.
+
+        >>> cache = TemplateCache(maxsize=1)
+        >>> cache.get('key', lambda: 'compiled')
+        'compiled'
+        >>> cache.get('key', lambda: 'compiled again')
+        'compiled'
+        >>> cache.get('another key', lambda: 'compiled')
+        'compiled'
+        >>> cache.info() == {
+        ...     'hits': 1, 'misses': 2, 'size': 1, 'maxsize': 1,
+        ...     'hit_rate': 1 / 3.0}
+        True
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key, compile_value):
+        """ Return the value cached for key, compiling it with
+            ``compile_value()`` if needed
+        """
+        with self.lock:
+            try:
+                value = self.cache.pop(key)
+            except KeyError:
+                pass
+            else:
+                self.cache[key] = value
+                self.hits += 1
+                return value
+        value = compile_value()
+        with self.lock:
+            self.misses += 1
+            self.cache[key] = value
+            while len(self.cache) > self.maxsize:
+                self.cache.popitem(last=False)
+        return value
+
+    def clear(self):
+        """ Invalidate all the compiled templates and reset counters """
+        with self.lock:
+            self.cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """ Return hit/miss counters, hit rate and cache size """
+        total = self.hits + self.misses
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self.cache),
+                'maxsize': self.maxsize,
+                'hit_rate': float(self.hits) / total if total else 0.0}
+
+
+template_cache = TemplateCache()
+
+
+def compile_substitution(value):
+    """ Compile a ``string.Template`` into a list of literal strings
+        and ``(identifier, placeholder)`` tuples
+    """
+    plan = []
+    position = 0
+    for match in Template.pattern.finditer(value):
+        start, end = match.span()
+        if start > position:
+            plan.append(value[position:start])
+        groups = match.groupdict()
+        identifier = groups['named'] or groups['braced']
+        if identifier is not None:
+            plan.append((identifier, match.group()))
+        elif groups['escaped'] is not None:
+            plan.append(Template.delimiter)
+        else:
+            plan.append(match.group())
+        position = end
+    if position < len(value):
+        plan.append(value[position:])
+    return plan
+
+
+def compile_jinja2(value):
+    """ Compile a jinja2 template with ``{! !}`` variable markers and
+        return it with the names it references
+    """
+    template = Jinja2Template(
+        value,
+        variable_start_string='{!',
+        variable_end_string='!}')
+    names = meta.find_undeclared_variables(template.environment.parse(value))
+    return template, names
+
+
+def bind_substitutions(substituted, spans):
+    """ Replace the substituted values found outside jinja2 tags with
+        jinja2 variables, so that the same template source is compiled
+        whatever the values are (for example a different
+        ``$test_run_identifier`` for each test).
+
+        ``spans`` are the ``(start, end)`` positions of the substituted
+        values. Return the template source and the bound values by
+        variable name. Values that could change how the template is
+        parsed (braces, leading or trailing whitespace, carriage
+        returns) are kept as they are.
+
+        >>> source, values = bind_substitutions(
+        ...     '42 {! 42 + 1 !}', [(0, 2), (6, 8)])
+        >>> source
+        '{! _substitution_0 !} {! 42 + 1 !}'
+        >>> values
+        {'_substitution_0': '42'}
+    """
+    if JINJA2_RAW.search(substituted):
+        return substituted, {}
+    tags = [match.span() for match in JINJA2_TAG.finditer(substituted)]
+    parts = []
+    values = {}
+    position = 0
+    tag_index = 0
+    for start, end in spans:
+        while tag_index < len(tags) and tags[tag_index][1] <= start:
+            tag_index += 1
+        if tag_index < len(tags) and tags[tag_index][0] < end:
+            # inside a tag, the value is part of the template code
+            continue
+        value = substituted[start:end]
+        if not value or value.strip() != value or \
+                '{' in value or '}' in value or '\r' in value:
+            continue
+        name = SUBSTITUTION_NAME.format(len(values))
+        values[name] = value
+        parts.append(substituted[position:start])
+        parts.append('{! ' + name + ' !}')
+        position = end
+    if not values:
+        return substituted, values
+    parts.append(substituted[position:])
+    return ''.join(parts), values
+
+
+class CachingParametrizer(Parametrizer):
+    """ Parametrizer compiling each template once.
+
+        Templates are compiled into substitution plans kept in a bounded
+        LRU cache shared by all instances (see ``template_cache``), so
+        only the referenced variables are read from mapping and context
+        (lazy mappings compute just those values).
+
+        jinja2 templates are cached by source after ``$`` substitution:
+        values substituted outside jinja2 tags are bound as variables
+        (see ``bind_substitutions``), while values substituted inside
+        ``{! !}``, ``{% %}`` or ``{# #}`` tags are part of the source.
+        So templates using per test values (like
+        ``$test_run_identifier``) inside tags are compiled again for
+        each new value.
+
+        >>> parametrizer = CachingParametrizer(
+        ...     {'name': 'a name', 'baudrate_value': 250})
+        >>> parametrizer.parametrize('{"baudrate": $baudrate_value}')
+        '{"baudrate": 250}'
+        >>> parametrizer.json_loads(
+        ...     '{"name": "{! name.upper() !}"}') == {'name': 'A NAME'}
+        True
+    """
+    cache = template_cache
+
+    def parametrize(self, value):
+        """ Return the value with template substitution """
+        plan = self.cache.get(
+            ('substitution', value), lambda: compile_substitution(value))
+        mapping = self.mapping
+        parts = []
+        spans = []
+        length = 0
+        for part in plan:
+            if part.__class__ is tuple:
+                identifier, placeholder = part
+                if identifier in mapping:
+                    part = '%s' % (mapping[identifier],)
+                    spans.append((length, length + len(part)))
+                else:
+                    part = placeholder
+            parts.append(part)
+            length += len(part)
+        substituted = ''.join(parts)
+
+        if not any(marker in substituted for marker in JINJA2_MARKERS):
+            # plain text, jinja2 would just strip the trailing newline
+            if substituted.endswith('\n'):
+                substituted = substituted[:-1]
+            return substituted
+        source, values = bind_substitutions(substituted, spans)
+        template, names = self.cache.get(
+            ('jinja2', source), lambda: compile_jinja2(source))
+        context = self.context
+        variables = dict(
+            (name, context[name]) for name in names
+            if name not in values and name in context)
+        variables.update(values)
+        return template.render(**variables)
@@ -6,55 +6,523 @@ created in the ``pypom_navigation`` package:
 .. graphviz::
 
    digraph {
+      async_navigation;
       bdd_vars;
+      bdd_vars_cache;
+      bdd_vars_factories;
       browser;
+      browser_pool;
+      browser_pool_factory;
+      check_page_mappings;
+      checked_page_mappings;
       credentials_mapping;
+      data_row;
       default_page;
       default_page_class;
       default_pages;
+      login_cache;
       navigation;
+      navigation_cache;
+      navigation_checkpoints;
       navigation_class;
+      navigation_timings;
       now;
+      page_index;
+      page_index_cache;
       page_mappings,
       parametrizer;
       parametrizer_class;
       request;
       skin;
       skin_base_url;
+      skin_config;
       skip_by_skin_names;
       test_run_identifier;
       variables;
-      default_timeout -> {variables};
+      default_timeout -> {navigation};
       bdd_vars -> {parametrizer};
+      bdd_vars_cache -> {bdd_vars};
+      bdd_vars_factories -> {bdd_vars};
+      browser_pool -> {navigation};
+      browser_pool_factory -> {browser_pool};
       credentials_mapping -> {navigation};
       default_page_class -> {navigation};
-      default_pages -> {default_page_class};
+      default_pages -> {default_page_class check_page_mappings};
+      navigation -> {async_navigation};
+      navigation_cache -> {navigation};
+      navigation_checkpoints -> {navigation};
       navigation_class -> {navigation};
+      navigation_timings -> {navigation};
       now -> {bdd_vars};
-      page_mappings -> {default_page_class navigation};
+      page_index -> {navigation};
+      page_index_cache -> {page_index};
+      checked_page_mappings -> {check_page_mappings};
+      login_cache -> {navigation};
+      page_mappings -> {default_page_class navigation page_index
+                        check_page_mappings};
+      parametrizer -> {data_row};
       parametrizer_class -> {parametrizer};
-      request -> {skip_by_skin_names};
-      skin -> {skin_base_url credentials_mapping default_page_class
-               navigation skip_by_skin_names
-               test_run_identifier bdd_vars};
-      skin_base_url -> {navigation};
+      request -> {skip_by_skin_names bdd_vars bdd_vars_factories};
+      skin -> {skin_config default_page_class navigation page_index
+               skip_by_skin_names test_run_identifier bdd_vars};
+      skin_base_url -> {navigation page_index};
+      skin_config -> {skin_base_url credentials_mapping};
       test_run_identifier -> {bdd_vars};
-      variables -> {skin_base_url credentials_mapping};
+      variables -> {skin_config default_timeout navigation};
    }
 
 
 .. _pytest fixtures: http://doc.pytest.org/en/latest/fixture.html
 """
 
+import json
+import os
 import pytest
 import uuid
 import datetime
 
-from parametrizer import Parametrizer
 from .util import (
     get_page_class,
+    validate_page_mappings,
 )
 from .navigation import Navigation
+from .index import build_page_index
+from .config import (
+    build_skin_config,
+    slice_variables,
+)
+from .login import LoginCache
+from .lazy import LazyMapping
+from .data import (
+    get_data_format,
+    iter_row_offsets,
+    read_row,
+    render_row,
+)
+from .pool import BrowserPool
+from .timing import (
+    NavigationTimings,
+    TimingsStore,
+)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('pypom_navigation')
+    group.addoption(
+        '--validate-page-mappings',
+        action='store_true',
+        default=None,
+        help='resolve and validate default_pages and page_mappings for '
+             'all skins before the first test, abort on errors.')
+    parser.addini(
+        'validate_page_mappings',
+        type='bool',
+        default=False,
+        help='same as --validate-page-mappings')
+    group.addoption(
+        '--pages-import-mode',
+        choices=('lazy', 'eager'),
+        default=None,
+        help='lazy (default): import page object modules and optional '
+             'dependencies on demand. eager: import all the page object '
+             'modules referenced by default_pages and page_mappings '
+             'before the first test.')
+    parser.addini(
+        'pages_import_mode',
+        default='lazy',
+        help='same as --pages-import-mode')
+    group.addoption(
+        '--navigation-scope',
+        choices=('function', 'module', 'session'),
+        default=None,
+        help='reuse the same navigation instance and driver for all the '
+             'tests of a module or session (default: function). '
+             'Cookies and storage are reset between tests.')
+    parser.addini(
+        'navigation_scope',
+        default='function',
+        help='same as --navigation-scope')
+    group.addoption(
+        '--browser-pool-size',
+        type=int,
+        default=None,
+        help='number of idle drivers kept per skin and base url, '
+             'created by the browser_pool_factory fixture. 0 (default) '
+             'disables the pool.')
+    parser.addini(
+        'browser_pool_size',
+        default='0',
+        help='same as --browser-pool-size')
+    group.addoption(
+        '--browser-pool-max-uses',
+        type=int,
+        default=None,
+        help='evict pool drivers after the given number of tests '
+             '(default 0, unlimited).')
+    parser.addini(
+        'browser_pool_max_uses',
+        default='0',
+        help='same as --browser-pool-max-uses')
+    group.addoption(
+        '--login-cache',
+        action='store_true',
+        default=None,
+        help='navigation.login restores the browser state captured '
+             'after the first real login of each user, skin and base '
+             'url.')
+    parser.addini(
+        'login_cache',
+        type='bool',
+        default=False,
+        help='same as --login-cache')
+    group.addoption(
+        '--login-cache-ttl',
+        type=int,
+        default=None,
+        help='discard login states older than the given number of '
+             'seconds (default 0, never).')
+    parser.addini(
+        'login_cache_ttl',
+        default='0',
+        help='same as --login-cache-ttl')
+    group.addoption(
+        '--visit-if-needed',
+        action='store_true',
+        default=None,
+        help='navigation.visit_page does not reload the page if already '
+             'loaded (same page id and url).')
+    parser.addini(
+        'visit_if_needed',
+        type='bool',
+        default=False,
+        help='same as --visit-if-needed')
+    group.addoption(
+        '--lazy-pages',
+        action='store_true',
+        default=None,
+        help='navigation.update_page and navigation.action_performed '
+             'create the page instance and wait for the page to load '
+             'on first access.')
+    parser.addini(
+        'lazy_pages',
+        type='bool',
+        default=False,
+        help='same as --lazy-pages')
+    group.addoption(
+        '--navigation-skins',
+        default=None,
+        metavar='skins',
+        help='run tests requesting the skin fixture once for each given '
+             'skin (comma separated) or for all the skins defined in '
+             'variables with "all". If the skin fixture is already '
+             'parametrized, tests of the other skins are deselected.')
+    parser.addini(
+        'navigation_skins',
+        default='',
+        help='same as --navigation-skins')
+    group.addoption(
+        '--group-by-skin',
+        action='store_true',
+        default=None,
+        help='keep tests of the same skin together, on the same worker '
+             'if used with pytest-xdist --dist=loadgroup.')
+    parser.addini(
+        'group_by_skin',
+        type='bool',
+        default=False,
+        help='same as --group-by-skin')
+    group.addoption(
+        '--navigation-timings',
+        type=int,
+        default=None,
+        metavar='N',
+        help='record navigation step timings and show the N slowest '
+             'steps by page id (N=0 for all).')
+    group.addoption(
+        '--navigation-timings-json',
+        default=None,
+        metavar='path',
+        help='record navigation step timings and write them to a json '
+             'file.')
+    group.addoption(
+        '--navigation-timings-db',
+        default=None,
+        metavar='path',
+        help='record navigation step timings and test durations, '
+             'appending them to the given JSON lines file. Timings '
+             'recorded in previous runs are used by navigate_to, '
+             '--slowest-first and for detecting regressions.')
+    group.addoption(
+        '--navigation-timings-runs',
+        type=int,
+        default=10,
+        metavar='N',
+        help='keep only the last N runs recorded by '
+             '--navigation-timings-db (default 10, 0 for all).')
+    group.addoption(
+        '--navigation-regression-threshold',
+        type=float,
+        default=1.5,
+        metavar='ratio',
+        help='report navigation steps slower than the recorded ones '
+             'multiplied by ratio (default 1.5). Requires '
+             '--navigation-timings-db.')
+    group.addoption(
+        '--slowest-first',
+        action='store_true',
+        default=False,
+        help='run slowest tests first according to the durations '
+             'recorded by --navigation-timings-db (better packing with '
+             'pytest-xdist).')
+    group.addoption(
+        '--share-variables',
+        action='store_true',
+        default=None,
+        help='parse variables once on the pytest-xdist controller and '
+             'send to workers only the skins selected with '
+             '--navigation-skins (all if not provided).')
+    parser.addini(
+        'share_variables',
+        type='bool',
+        default=False,
+        help='same as --share-variables')
+
+
+def pytest_addhooks(pluginmanager):
+    from . import hooks
+    pluginmanager.add_hookspecs(hooks)
+
+
+def _get_option(config, name):
+    """ Return the command line option value if given, the ini value
+        otherwise
+    """
+    value = config.getoption(name)
+    if value is None:
+        value = config.getini(name)
+    return value
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    if report.failed:
+        # drivers used by failed tests are evicted from the browser pool
+        item.pypom_navigation_failed = True
+
+
+def _has_failed(request):
+    """ True if the test of request failed, see
+        pytest_runtest_makereport
+    """
+    return getattr(request.node, 'pypom_navigation_failed', False)
+
+
+def _get_variables(config):
+    """ Return variables parsed by pytest-variables """
+    try:
+        from pytest_variables.plugin import variables_key
+    except ImportError:
+        # old pytest-variables versions
+        return getattr(config, '_variables', {})
+    return config.stash.get(variables_key, {})
+
+
+def _set_variables(config, variables):
+    """ Replace variables parsed by pytest-variables """
+    try:
+        from pytest_variables.plugin import variables_key
+    except ImportError:
+        # old pytest-variables versions
+        config._variables = variables
+    else:
+        config.stash[variables_key] = variables
+
+
+SHARED_VARIABLES_KEY = 'pypom_navigation_variables'
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """ Send the variables parsed by the xdist controller to workers """
+    config = node.config
+    if not _get_option(config, 'share_variables'):
+        return
+    shared = getattr(config, '_navigation_shared_variables', None)
+    if shared is None:
+        try:
+            variables = slice_variables(
+                _get_variables(config), _get_skin_names(config))
+        except ValueError as error:
+            raise pytest.UsageError('invalid variables: {0}'.format(error))
+        try:
+            shared = json.dumps(variables, separators=(',', ':'))
+        except (TypeError, ValueError):
+            # not json serializable, workers parse variables files
+            shared = ''
+        config._navigation_shared_variables = shared
+    if shared:
+        node.workerinput[SHARED_VARIABLES_KEY] = shared
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config):
+    workerinput = getattr(config, 'workerinput', {})
+    if SHARED_VARIABLES_KEY in workerinput:
+        # xdist worker: variables files already parsed by the controller
+        config.option.variables = []
+        config.pluginmanager.register(
+            _SharedVariables(json.loads(workerinput[SHARED_VARIABLES_KEY])),
+            'pypom_navigation_shared_variables')
+
+
+class _SharedVariables(object):
+    """ Set the variables received from the xdist controller once
+        pytest-variables is configured
+    """
+
+    def __init__(self, variables):
+        self.variables = variables
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_configure(self, config):
+        _set_variables(config, self.variables)
+
+
+def _get_skin_names(config):
+    """ Return the skin names selected with ``--navigation-skins``, if
+        any
+    """
+    value = _get_option(config, 'navigation_skins')
+    if not value:
+        return []
+    if value == 'all':
+        return sorted(_get_variables(config).get('skins', {}))
+    return [skin.strip() for skin in value.split(',') if skin.strip()]
+
+
+def pytest_generate_tests(metafunc):
+    if 'data_row' in metafunc.fixturenames:
+        definition = getattr(metafunc, 'definition', None)
+        if definition is not None:
+            marker = _get_marker(definition, 'navigation_data')
+        else:
+            # old pytest version
+            marker = getattr(metafunc.function, 'navigation_data', None)
+        if marker is not None:
+            path, data_format = _get_data_source(
+                metafunc.module.__file__, marker)
+            offsets = list(iter_row_offsets(path, data_format))
+            metafunc.parametrize(
+                'data_row', offsets, indirect=True,
+                ids=['row{0}'.format(index)
+                     for index in range(len(offsets))])
+    if 'skin' not in metafunc.fixturenames:
+        return
+    skins = _get_skin_names(metafunc.config)
+    if skins and not _has_skin_params(metafunc):
+        metafunc.parametrize('skin', skins, scope='session')
+
+
+def _has_skin_params(metafunc):
+    """ True if the skin fixture is parametrized by the project itself
+        (``@pytest.fixture(params=...)``), in that case tests are
+        deselected by skin instead (see pytest_collection_modifyitems)
+    """
+    fixturedefs = getattr(metafunc, '_arg2fixturedefs', {}).get('skin')
+    return bool(fixturedefs and fixturedefs[-1].params)
+
+
+def _get_data_source(module_path, marker):
+    """ Return the path (relative to the test module) and the format of
+        a navigation_data marker data source
+    """
+    path = os.path.join(os.path.dirname(str(module_path)), marker.args[0])
+    return path, get_data_format(path, marker.kwargs.get('format'))
+
+
+def _get_item_skin(item):
+    """ Return the skin parameter of a collected test, if any """
+    callspec = getattr(item, 'callspec', None)
+    if callspec is None:
+        return None
+    return callspec.params.get('skin')
+
+
+def _get_marker(node, name):
+    try:
+        return node.get_closest_marker(name)
+    except AttributeError:
+        # old pytest version
+        return node.get_marker(name)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(session, config, items):
+    skins = _get_skin_names(config)
+    if skins:
+        # skin fixture parametrized by the project, see _has_skin_params
+        selected = []
+        deselected = []
+        for item in items:
+            skin = _get_item_skin(item)
+            if skin is None or skin in skins:
+                selected.append(item)
+            else:
+                deselected.append(item)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+
+    for item in items:
+        # skip_skins evaluated before any fixture setup when the skin is
+        # a test parameter, see skip_by_skin_names otherwise
+        skin = _get_item_skin(item)
+        if skin is None:
+            continue
+        marker = _get_marker(item, 'skip_skins')
+        if marker and skin in marker.args[0]:
+            item.add_marker(pytest.mark.skip(
+                reason='skipped on this skin: {0}'.format(skin)))
+
+    store = getattr(config, '_navigation_timings_store', None)
+    if store is not None and config.getoption('slowest_first'):
+        # unknown durations first, they could be slow new tests
+        items.sort(key=lambda item: -(
+            store.test_duration(item.nodeid) or float('inf')))
+
+    group_by_skin = _get_option(config, 'group_by_skin')
+    if group_by_skin:
+        # stable sort, keep the original order for the same skin
+        items.sort(key=lambda item: str(_get_item_skin(item) or ''))
+
+    prefixes = {}
+    for item in items:
+        marker = _get_marker(item, 'navigation_prefix')
+        if marker is not None:
+            prefixes[item] = (marker.args[0], _get_item_skin(item))
+    if prefixes:
+        # tests sharing a prefix run together where the first one was
+        first_positions = {}
+        positions = {}
+        for position, item in enumerate(items):
+            key = prefixes.get(item, (None, position))
+            positions[item] = first_positions.setdefault(key, position)
+        items.sort(key=positions.__getitem__)
+
+    if config.pluginmanager.hasplugin('xdist'):
+        for item in items:
+            skin = _get_item_skin(item)
+            if item in prefixes:
+                name = 'prefix-{0}'.format(prefixes[item][0])
+                if skin is not None:
+                    name = '{0}-{1}'.format(name, skin)
+            elif group_by_skin and skin is not None:
+                name = 'skin-{0}'.format(skin)
+            else:
+                continue
+            item.add_marker(pytest.mark.xdist_group(name=name))
 
 
 def pytest_configure(config):
@@ -63,6 +531,97 @@ def pytest_configure(config):
         "markers",
         "skip_skins(skins): mark test to be skipped for the given skin ids"
     )
+    config.addinivalue_line(
+        "markers",
+        "navigation_prefix(name): mark tests sharing the same navigation "
+        "steps, restored from the checkpoint name (see "
+        "Navigation.prefix). They are run together, on the same xdist "
+        "worker with --dist=loadgroup"
+    )
+    config.addinivalue_line(
+        "markers",
+        "navigation_data(path, format=None): run the test once for each "
+        "row of a CSV, JSON lines or YAML data source (path relative to "
+        "the test module), see the data_row fixture"
+    )
+    store_path = config.getoption('navigation_timings_db')
+    history = None
+    if store_path:
+        # loaded on first use, see TimingsStore
+        config._navigation_timings_store = TimingsStore(
+            store_path,
+            max_runs=config.getoption('navigation_timings_runs'))
+        history = config._navigation_timings_store
+        if not hasattr(config, 'workerinput'):
+            config._navigation_test_durations = _TestDurationsRecorder()
+            config.pluginmanager.register(
+                config._navigation_test_durations,
+                'pypom_navigation_test_durations')
+    if config.getoption('navigation_timings') is not None or \
+            config.getoption('navigation_timings_json') or store_path:
+        config._navigation_timings = NavigationTimings(
+            hook=config.hook, history=history)
+
+
+class _TestDurationsRecorder(object):
+    """ Collect test durations (setup, call and teardown) by node id """
+
+    def __init__(self):
+        self.durations = {}
+
+    def pytest_runtest_logreport(self, report):
+        self.durations[report.nodeid] = \
+            self.durations.get(report.nodeid, 0) + report.duration
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    timings = getattr(config, '_navigation_timings', None)
+    if timings is None:
+        return
+    if hasattr(config, 'workeroutput'):
+        # xdist worker, stats are merged by the controller
+        config.workeroutput['navigation_timings'] = timings.as_list()
+        return
+    path = config.getoption('navigation_timings_json')
+    if path:
+        timings.write_json(path)
+    store = getattr(config, '_navigation_timings_store', None)
+    if store is not None:
+        store.append(timings, config._navigation_test_durations.durations)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    timings = getattr(node.config, '_navigation_timings', None)
+    workeroutput = getattr(node, 'workeroutput', {})
+    if timings is not None and 'navigation_timings' in workeroutput:
+        timings.update(workeroutput['navigation_timings'])
+
+
+def pytest_terminal_summary(terminalreporter):
+    config = terminalreporter.config
+    timings = getattr(config, '_navigation_timings', None)
+    if timings is None or hasattr(config, 'workeroutput'):
+        return
+    limit = config.getoption('navigation_timings')
+    if limit is not None:
+        terminalreporter.write_sep('=', 'slowest navigation steps')
+        for item in timings.slowest(limit):
+            terminalreporter.write_line(
+                '{mean:.2f}s mean {max:.2f}s max {count} x '
+                '{skin} {page_id} {step}'.format(**item))
+    store = getattr(config, '_navigation_timings_store', None)
+    if store is not None:
+        regressions = store.regressions(
+            timings, config.getoption('navigation_regression_threshold'))
+        if regressions:
+            terminalreporter.write_sep(
+                '=', 'navigation timing regressions', yellow=True)
+            for item in regressions:
+                terminalreporter.write_line(
+                    '{mean:.2f}s mean (was {previous_mean:.2f}s) '
+                    '{skin} {page_id} {step}'.format(**item))
 
 
 def skip_skins(skins):
@@ -127,17 +686,95 @@ def page_mappings():
 
 
 @pytest.fixture(scope='session')
-def skin_base_url(skin, variables):
+def checked_page_mappings():
+    """ ``(default_pages, page_mappings)`` already checked by
+        ``check_page_mappings``, by object ids
+    """
+    return {}
+
+
+@pytest.fixture(autouse=True)
+def check_page_mappings(request, checked_page_mappings):
+    """ Validate ``default_pages`` and ``page_mappings`` if
+        ``--validate-page-mappings`` is enabled.
+
+        All the dotted names are resolved in one pass for every
+        configured skin, so a broken mapping aborts the whole run before
+        any browser is launched and reports all the errors together.
+        Resolved classes are cached and reused by the navigation engine.
+        Each distinct mapping (for example a fixture override in another
+        test module) is checked once per session.
+
+        With ``--pages-import-mode=eager`` page object modules are
+        imported here too, so import costs are not paid in the middle of
+        the first browser steps. Errors are reported when the broken page
+        is used unless validation is enabled.
+    """
+    config = request.config
+    validate = _get_option(config, 'validate_page_mappings')
+    if not validate and \
+            _get_option(config, 'pages_import_mode') != 'eager':
+        return
+    default_pages = request.getfixturevalue('default_pages')
+    page_mappings = request.getfixturevalue('page_mappings')
+    key = (id(default_pages), id(page_mappings))
+    if key in checked_page_mappings:
+        return
+    # keep the checked objects alive, so their ids are not reused
+    checked_page_mappings[key] = (default_pages, page_mappings)
+    errors = validate_page_mappings(default_pages, page_mappings)
+    if validate and errors:
+        pytest.exit('invalid page mappings:\n{0}'.format(
+            '\n'.join(errors)))
+
+
+@pytest.fixture(scope='session')
+def page_index_cache():
+    """ Page indexes by skin and base url, see ``page_index`` """
+    return {}
+
+
+@pytest.fixture
+def page_index(skin, skin_base_url, page_mappings, page_index_cache):
+    """ Returns the page mappings compiled for the current skin: absolute
+        urls, page classes and actions for each page id.
+
+        The index is built once per session and skin, unless a different
+        ``page_mappings`` object is provided (for example by a fixture
+        override in another test module).
+
+        :return: page index
+        :rtype: :py:class:`pypom_navigation.index.PageIndex`
+    """
+    key = (skin, skin_base_url)
+    cached = page_index_cache.get(key)
+    if cached is None or cached[0] is not page_mappings:
+        cached = page_index_cache[key] = (
+            page_mappings,
+            build_page_index(skin, skin_base_url, page_mappings))
+    return cached[1]
+
+
+@pytest.fixture(scope='session')
+def skin_config(skin, variables):
+    """ Returns the read only settings of the current skin built once
+        per session from ``variables``.
+
+        :return: skin config
+        :rtype: :py:class:`pypom_navigation.config.SkinConfig`
+    """
+    return build_skin_config(skin, variables)
+
+
+@pytest.fixture(scope='session')
+def skin_base_url(skin_config):
     """ Returns the skin_base_url associated to the skin.
     """
-    return variables \
-        .get('skins', {}) \
-        .get(skin, {}) \
-        .get('base_url', '')
+    return skin_config.base_url
 
 
 @pytest.fixture(scope='session')
-def credentials_mapping(skin, variables):
+def credentials_mapping(skin_config):
     """
         This fixture provides users credentials via a file specified on the
         --variables option. The file format is one supported by
@@ -146,10 +783,7 @@ def credentials_mapping(skin, variables):
         :return: credentials mapping dictionary with all available credentials
         :rtype: dict
     """
-    return variables \
-        .get('skins', {}) \
-        .get(skin, {}) \
-        .get('credentials', {})
+    return dict(skin_config.credentials)
 
 
 @pytest.fixture
@@ -173,6 +807,93 @@ def default_timeout(variables):
     return variables.get('default_timeout', 10)
 
 
+@pytest.fixture(scope='session')
+def browser_pool_factory():
+    """ Returns a callable used by the browser pool for creating new
+        drivers, called with the skin and the skin base url. No pool
+        is available by default.
+
+        For example::
+
+            @pytest.fixture(scope='session')
+            def browser_pool_factory():
+                from splinter import Browser
+                return lambda skin, base_url: Browser('firefox')
+    """
+    return None
+
+
+@pytest.fixture(scope='session')
+def browser_pool(request, browser_pool_factory):
+    """ Returns the drivers pool used by ``navigation`` instead of the
+        ``browser`` fixture if ``--browser-pool-size`` is greater than 0.
+
+        :return: browser pool or None
+        :rtype: :py:class:`pypom_navigation.pool.BrowserPool`
+    """
+    size = int(_get_option(request.config, 'browser_pool_size'))
+    if not size:
+        return None
+    if browser_pool_factory is None:
+        raise pytest.UsageError(
+            '--browser-pool-size requires a browser_pool_factory fixture')
+    pool = BrowserPool(
+        browser_pool_factory,
+        size=size,
+        max_uses=int(_get_option(request.config, 'browser_pool_max_uses')))
+    request.addfinalizer(pool.close)
+    return pool
+
+
+@pytest.fixture(scope='session')
+def navigation_timings(request):
+    """ Returns the navigation step timings collector if enabled with
+        ``--navigation-timings`` or ``--navigation-timings-json``.
+
+        :return: navigation timings or None
+        :rtype: :py:class:`pypom_navigation.timing.NavigationTimings`
+    """
+    return getattr(request.config, '_navigation_timings', None)
+
+
+@pytest.fixture(scope='session')
+def login_cache(request):
+    """ Returns the login states cache used by ``navigation.login`` if
+        enabled with ``--login-cache``. Override it for providing an
+        ``is_logged_in(navigation)`` check, for example::
+
+            @pytest.fixture(scope='session')
+            def login_cache():
+                from pypom_navigation.login import LoginCache
+                return LoginCache(
+                    is_logged_in=lambda navigation:
+                        navigation.page.has_text('Logout'))
+
+        :return: login cache or None
+        :rtype: :py:class:`pypom_navigation.login.LoginCache`
+    """
+    if not _get_option(request.config, 'login_cache'):
+        return None
+    return LoginCache(
+        ttl=int(_get_option(request.config, 'login_cache_ttl')) or None)
+
+
+@pytest.fixture(scope='session')
+def navigation_checkpoints():
+    """ Checkpoints stored by ``navigation.checkpoint`` and restored by
+        ``navigation.restore`` in the following tests
+    """
+    return {}
+
+
+@pytest.fixture(scope='session')
+def navigation_cache():
+    """ Navigation instances kept alive across tests depending on the
+        ``--navigation-scope`` option.
+    """
+    return {}
+
+
 @pytest.fixture
 def navigation(navigation_class,
                default_page_class,
@@ -182,27 +903,112 @@ def navigation(navigation_class,
                skin_base_url,
                request,
                variables,
-               default_timeout):
+               default_timeout,
+               page_index,
+               navigation_cache,
+               browser_pool,
+               navigation_timings,
+               login_cache,
+               navigation_checkpoints):
     """ Wraps a page and a page mappings accessible by
         pages.
 
         ``navigation.page`` is meant to be mutable since
         through the BDD steps the page instance could
         change.
+
+        With ``--navigation-scope=module`` or ``session`` the same
+        navigation instance, and its driver, is reused by the following
+        tests of the same module or session (and skin). The browser state
+        is reset with ``navigation.reset()`` before each reuse and all the
+        other settings (page mappings, page classes, credentials,
+        variables, timeout) are taken from the current test fixtures.
+
+        If the browser pool is enabled (see ``--browser-pool-size``) the
+        driver is checked out from ``browser_pool`` and given back at
+        the end of the test.
+
+        With ``--lazy-pages`` the pages wrapped by ``update_page`` and
+        ``action_performed`` are created and loaded on first access
+        (see ``pypom_navigation.lazy.LazyPage``).
+
+        With ``--login-cache`` ``navigation.login`` restores the login
+        states captured by previous tests (see ``login_cache``).
+
+        ``navigation.prefix`` runs steps shared by many tests once,
+        following tests restore the checkpoint stored at the end of
+        the steps (see ``navigation_checkpoints``).
     """
-    nav = navigation_class(
-        None,      # backwards compatibility
-        default_page_class,
-        page_mappings,
-        credentials_mapping,
-        skin,
-        skin_base_url,
-        request,
-        variables,
-        timeout=default_timeout)
+    scope = _get_option(request.config, 'navigation_scope')
+    if scope == 'module':
+        cache_key = (request.module.__name__, skin)
+    else:
+        cache_key = (None, skin)
+    nav = None
+    if scope in ('module', 'session'):
+        nav = navigation_cache.get(cache_key)
+        if nav is None and scope == 'module':
+            # give back the drivers of the previous module navigations
+            for cached in navigation_cache.values():
+                cached.release_driver(error=_has_failed(cached.request))
+            navigation_cache.clear()
+        elif nav is not None and _has_failed(nav.request):
+            # drivers used by failed tests are evicted from the pool, a
+            # fresh one is checked out on first use
+            nav.release_driver(error=True)
+
+    if nav is None:
+        nav = navigation_class(
+            None,      # backwards compatibility
+            default_page_class,
+            page_mappings,
+            credentials_mapping,
+            skin,
+            skin_base_url,
+            request,
+            variables,
+            timeout=default_timeout)
+        if scope in ('module', 'session'):
+            navigation_cache[cache_key] = nav
+        elif browser_pool is not None:
+            request.addfinalizer(lambda: nav.release_driver(
+                error=_has_failed(request)))
+        reused = False
+    else:
+        # only the page and its driver are reused, everything else
+        # comes from fixtures that could be overridden by this test
+        nav.default_page_class = default_page_class
+        nav.page_mappings = page_mappings
+        nav.credentials_mapping = credentials_mapping
+        nav.skin_base_url = skin_base_url
+        nav.request = request
+        nav.variables = variables
+        nav.kwargs = {'timeout': default_timeout}
+        reused = True
+    nav.page_index = page_index
+    nav.browser_pool = browser_pool
+    nav.visit_if_needed = _get_option(request.config, 'visit_if_needed')
+    nav.lazy_pages = _get_option(request.config, 'lazy_pages')
+    nav.login_cache = login_cache
+    nav.checkpoints = navigation_checkpoints
+    nav.timings = navigation_timings
+    if reused:
+        nav.reset()
     return nav
 
 
+@pytest.fixture
+def async_navigation(navigation):
+    """ Awaitable navigation for asyncio based tests (Python 3 only),
+        wrapping the ``navigation`` fixture.
+
+        :return: async navigation
+        :rtype: :py:class:`pypom_navigation.async_navigation.AsyncNavigation`
+    """
+    from .async_navigation import AsyncNavigation
+    return AsyncNavigation(navigation)
+
+
 @pytest.fixture
 def navigation_class():
     """ Returns the navigation class used for wrap pages"""
@@ -227,13 +1033,12 @@ def skip_by_skin_names(request, skin):
         except for skin2.
 
         See http://bit.ly/2dYnOSv for further info.
-    """
-    try:
-        marker = request.node.get_closest_marker('skip_skins')
-    except AttributeError:
-        # old pytest version
-        marker = request.node.get_marker('skip_skins')
 
+        Tests parametrized by skin are already skipped at collection
+        time without any fixture setup, this fixture handles the non
+        parametrized ``skin`` fixture overrides.
+    """
+    marker = _get_marker(request.node, 'skip_skins')
     if marker:
         if skin in marker.args[0]:
             pytest.skip('skipped on this skin: {}'.format(skin))
@@ -253,25 +1058,113 @@ def now():
     return datetime.datetime.now()
 
 
+BDD_VARS_SCOPES = ('test', 'module', 'session')
+
+
+@pytest.fixture(scope='session')
+def bdd_vars_factories(request):
+    """ Additional ``bdd_vars`` registered with the
+        ``pytest_pypom_navigation_bdd_vars`` hook.
+
+        :return: mapping of name to (factory, scope)
+        :rtype: dict
+    """
+    factories = {}
+
+    def register(name, factory, scope='test'):
+        if scope not in BDD_VARS_SCOPES:
+            raise ValueError('invalid scope {0!r} for bdd var {1}'.format(
+                scope, name))
+        factories[name] = (factory, scope)
+    request.config.hook.pytest_pypom_navigation_bdd_vars(register=register)
+    return factories
+
+
+@pytest.fixture(scope='session')
+def bdd_vars_cache():
+    """ Module and session scoped ``bdd_vars`` values """
+    return {}
+
+
+def _get_bdd_var_factory(request, skin, cache, name, factory, scope):
+    """ Return a callable computing a registered bdd var once per scope
+    """
+    if scope == 'test':
+        return lambda: factory(request)
+    module = request.module.__name__ if scope == 'module' else None
+    key = (skin, module, name)
+
+    def cached_factory():
+        if key not in cache:
+            cache[key] = factory(request)
+        return cache[key]
+    return cached_factory
+
+
 @pytest.fixture
-def bdd_vars(test_run_identifier, skin, now):
+def bdd_vars(request, skin, bdd_vars_factories, bdd_vars_cache):
     """ BDD step vars for test parametrization for dynamic values
-        such as test_run_identifier or datetime
+        such as test_run_identifier or datetime.
+
+        Values are computed on first access, so ``test_run_identifier``
+        and ``now`` are requested only if needed. Additional values can
+        be registered with the ``pytest_pypom_navigation_bdd_vars``
+        hook.
+
+        :return: lazy mapping
+        :rtype: :py:class:`pypom_navigation.lazy.LazyMapping`
     """
-    return {'test_run_identifier': test_run_identifier,
-            'skin': skin,
-            'datetime': now.isoformat()}
+    factories = {
+        'test_run_identifier':
+            lambda: request.getfixturevalue('test_run_identifier'),
+        'skin': lambda: skin,
+        'datetime': lambda: request.getfixturevalue('now').isoformat(),
+    }
+    for name, (factory, scope) in bdd_vars_factories.items():
+        factories[name] = _get_bdd_var_factory(
+            request, skin, bdd_vars_cache, name, factory, scope)
+    return LazyMapping(factories)
 
 
 @pytest.fixture
 def parametrizer_class():
     """ Provides a parametrizer class used for convert parametrized
         json values to regular python dicts.
+
+        Templates are compiled once and cached (see
+        ``pypom_navigation.parametrizer.CachingParametrizer``).
     """
-    return Parametrizer
+    from .parametrizer import CachingParametrizer
+    return CachingParametrizer
 
 
 @pytest.fixture
 def parametrizer(parametrizer_class, bdd_vars):
     """ Parametrizer object """
-    return Parametrizer(bdd_vars)
+    return parametrizer_class(bdd_vars)
+
+
+@pytest.fixture
+def data_row(request):
+    """ Returns the current data row of tests marked with
+        ``navigation_data``, for example::
+
+            @pytest.mark.navigation_data('users.csv')
+            def test_login(navigation, data_row):
+                navigation.login(data_row['user_id'], ...)
+
+        Only row offsets are collected, the row is read at setup time and
+        its string values are rendered by the ``parametrizer`` (so
+        ``$skin`` or ``$test_run_identifier`` can be used in data).
+
+        :return: data row
+        :rtype: dict
+    """
+    marker = _get_marker(request.node, 'navigation_data')
+    if marker is None:
+        raise pytest.UsageError(
+            '{0} requests data_row without a navigation_data '
+            'marker'.format(request.node.nodeid))
+    path, data_format = _get_data_source(request.module.__file__, marker)
+    row = read_row(path, data_format, request.param)
+    return render_row(row, request.getfixturevalue('parametrizer'))
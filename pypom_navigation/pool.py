@@ -0,0 +1,90 @@
+import threading
+
+from .util import clear_browser_state
+
+
+def default_health_check(driver):
+    """ Reset the browser state. A driver that fails is not healthy """
+    clear_browser_state(driver)
+    return True
+
+
+class BrowserPool(object):
+    """ Keep warm drivers per skin and base url.
+
+        Drivers are created by ``factory(skin, base_url)`` on checkout if
+        no idle driver is available. On checkin drivers are health checked
+        (by default cookies and storage are cleared) and kept for the next
+        checkout, unless the test failed, the health check fails, the
+        driver was used ``max_uses`` times or there are already ``size``
+        idle drivers for the same key. Evicted drivers are quit.
+
+        >>> from mock import MagicMock
+        >>> pool = BrowserPool(lambda skin, base_url: MagicMock(), size=1)
+        >>> driver = pool.checkout('skin1', 'http://base')
+        >>> pool.checkin(driver, 'skin1', 'http://base')
+        >>> pool.checkout('skin1', 'http://base') is driver
+        True
+    """
+
+    def __init__(self, factory, size=1, max_uses=None, health_check=None):
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self.health_check = health_check or default_health_check
+        self.idle = {}
+        self.in_use = {}
+        self.uses = {}
+        self.lock = threading.Lock()
+
+    def checkout(self, skin, base_url):
+        """ Return a driver for the given skin and base url """
+        key = (skin, base_url)
+        with self.lock:
+            drivers = self.idle.get(key)
+            driver = drivers.pop() if drivers else None
+        if driver is None:
+            driver = self.factory(skin, base_url)
+        with self.lock:
+            self.in_use[id(driver)] = driver
+        return driver
+
+    def checkin(self, driver, skin, base_url, error=False):
+        """ Give back a driver obtained with :meth:`checkout` """
+        key = (skin, base_url)
+        with self.lock:
+            self.in_use.pop(id(driver), None)
+            uses = self.uses[id(driver)] = self.uses.get(id(driver), 0) + 1
+        evict = error or (self.max_uses and uses >= self.max_uses)
+        if not evict:
+            try:
+                evict = not self.health_check(driver)
+            except Exception:
+                evict = True
+        if not evict:
+            with self.lock:
+                drivers = self.idle.setdefault(key, [])
+                if len(drivers) < self.size:
+                    drivers.append(driver)
+                    return
+        self.evict(driver)
+
+    def evict(self, driver):
+        """ Quit the given driver """
+        with self.lock:
+            self.uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        """ Quit all the idle and checked out drivers """
+        with self.lock:
+            drivers = list(self.in_use.values())
+            for idle_drivers in self.idle.values():
+                drivers.extend(idle_drivers)
+            self.idle.clear()
+            self.in_use.clear()
+        for driver in drivers:
+            self.evict(driver)
@@ -0,0 +1,276 @@
+import json
+import os
+import time
+
+
+class NullStepTimer(object):
+    """ Step timer used when timings are disabled """
+
+    def lap(self, phase):
+        pass
+
+    def stop(self):
+        pass
+
+
+NULL_STEP_TIMER = NullStepTimer()
+
+
+class StepTimer(object):
+    """ Measure the phases (``resolve``, ``visit``, ``wait``) of a
+        navigation step
+    """
+
+    def __init__(self, timings, navigation, step, page_id):
+        self.timings = timings
+        self.navigation = navigation
+        self.step = step
+        self.page_id = page_id
+        self.phases = {}
+        self.start = self.last = time.time()
+
+    def lap(self, phase):
+        """ Record the time elapsed since the previous lap for phase """
+        now = time.time()
+        self.phases[phase] = now - self.last
+        self.last = now
+
+    def stop(self):
+        """ Record the step """
+        self.phases['total'] = time.time() - self.start
+        self.timings.record(self.navigation, self.step, self.page_id,
+                            self.phases)
+
+
+class NavigationTimings(object):
+    """ Aggregated navigation step timings by skin, page id, step and
+        phase.
+
+        >>> timings = NavigationTimings()
+        >>> timings.add('skin1', 'HomePage', 'visit_page', 'total', 2)
+        >>> timings.add('skin1', 'HomePage', 'visit_page', 'total', 4)
+        >>> timings.as_list() == [{
+        ...     'skin': 'skin1', 'page_id': 'HomePage',
+        ...     'step': 'visit_page', 'phase': 'total', 'count': 2,
+        ...     'total': 6, 'min': 2, 'max': 4, 'mean': 3.0}]
+        True
+    """
+
+    def __init__(self, hook=None, history=None):
+        self.hook = hook
+        self.history = history
+        self.stats = {}
+
+    def start(self, navigation, step, page_id=None):
+        """ Return a :class:`StepTimer` for a new navigation step """
+        return StepTimer(self, navigation, step, page_id)
+
+    def record(self, navigation, step, page_id, phases):
+        """ Record the phase durations of a navigation step """
+        for phase, duration in phases.items():
+            self.add(navigation.skin, page_id, step, phase, duration)
+        if self.hook is not None:
+            self.hook.pytest_pypom_navigation_step(
+                navigation=navigation,
+                step=step,
+                page_id=page_id,
+                timings=phases)
+
+    def add(self, skin, page_id, step, phase, duration, count=1):
+        """ Add duration (seconds) to the aggregated stats """
+        key = (skin, page_id, step, phase)
+        stats = self.stats.get(key)
+        if stats is None:
+            self.stats[key] = [count, duration, duration, duration]
+        else:
+            stats[0] += count
+            stats[1] += duration
+            stats[2] = min(stats[2], duration)
+            stats[3] = max(stats[3], duration)
+
+    def mean(self, skin, page_id, step, phase='total'):
+        """ Return the mean duration or None if not available.
+            Durations recorded in previous runs (``history``) are used
+            if not yet recorded in this run.
+        """
+        stats = self.stats.get((skin, page_id, step, phase))
+        if stats is None:
+            if self.history is not None:
+                return self.history.mean(skin, page_id, step, phase)
+            return None
+        return float(stats[1]) / stats[0]
+
+    def as_list(self):
+        """ Return stats as a list of dicts sorted by key """
+        result = []
+        for key in sorted(self.stats, key=lambda key: tuple(
+                '' if item is None else item for item in key)):
+            count, total, min_value, max_value = self.stats[key]
+            result.append({
+                'skin': key[0],
+                'page_id': key[1],
+                'step': key[2],
+                'phase': key[3],
+                'count': count,
+                'total': total,
+                'min': min_value,
+                'max': max_value,
+                'mean': float(total) / count,
+            })
+        return result
+
+    def update(self, items):
+        """ Merge stats previously exported with :meth:`as_list` """
+        for item in items:
+            key = (item['skin'], item['page_id'], item['step'],
+                   item['phase'])
+            stats = self.stats.get(key)
+            if stats is None:
+                self.stats[key] = [item['count'], item['total'],
+                                   item['min'], item['max']]
+            else:
+                stats[0] += item['count']
+                stats[1] += item['total']
+                stats[2] = min(stats[2], item['min'])
+                stats[3] = max(stats[3], item['max'])
+
+    def slowest(self, limit=None):
+        """ Return total step stats sorted by mean duration """
+        items = [item for item in self.as_list()
+                 if item['phase'] == 'total']
+        items.sort(key=lambda item: item['mean'], reverse=True)
+        return items[:limit] if limit else items
+
+    def write_json(self, path):
+        """ Dump stats to a json file """
+        with open(path, 'w') as json_file:
+            json.dump(self.as_list(), json_file, indent=2, sort_keys=True)
+
+
+class TimingsStore(object):
+    """ Navigation step timings and test durations persisted across runs
+        in a JSON lines file, one line per aggregated step or test for
+        each run.
+
+        Only the last ``max_runs`` runs are used: older runs are dropped
+        from the file when a new run is appended. Recorded runs are
+        loaded on first use (``steps``, ``tests`` or ``mean``), so
+        pytest-xdist workers read the file only if they need it.
+    """
+
+    def __init__(self, path, max_runs=10):
+        self.path = path
+        self.max_runs = max_runs
+        self._steps = None
+        self._tests = None
+
+    @property
+    def steps(self):
+        """ Step timings of the recorded runs """
+        if self._steps is None:
+            self.load()
+        return self._steps
+
+    @property
+    def tests(self):
+        """ Test durations of the recorded runs, ``[count, total]`` by
+            node id
+        """
+        if self._tests is None:
+            self.load()
+        return self._tests
+
+    def read_runs(self, max_runs=None):
+        """ Return the records of the last max_runs recorded runs (all
+            if not provided), oldest first
+        """
+        runs = {}
+        if os.path.exists(self.path):
+            with open(self.path) as store_file:
+                for line in store_file:
+                    line = line.strip()
+                    if line:
+                        item = json.loads(line)
+                        runs.setdefault(item.get('run', 0), []).append(item)
+        keys = sorted(runs)
+        if max_runs is not None:
+            keys = keys[len(keys) - max_runs:] if max_runs > 0 else []
+        return [runs[key] for key in keys]
+
+    def load(self):
+        """ Load and aggregate the last ``max_runs`` recorded runs """
+        self._steps = NavigationTimings()
+        self._tests = {}
+        for items in self.read_runs(self.max_runs or None):
+            for item in items:
+                kind = item.get('kind')
+                if kind == 'step':
+                    self._steps.update([item])
+                elif kind == 'test':
+                    self.add_test(item['nodeid'], item['duration'])
+        return self
+
+    def mean(self, skin, page_id, step, phase='total'):
+        """ Return the recorded mean duration or None if not available
+        """
+        return self.steps.mean(skin, page_id, step, phase)
+
+    def add_test(self, nodeid, duration):
+        """ Add a test duration (seconds) """
+        stats = self.tests.setdefault(nodeid, [0, 0])
+        stats[0] += 1
+        stats[1] += duration
+
+    def test_duration(self, nodeid):
+        """ Return the mean test duration or None if unknown """
+        stats = self.tests.get(nodeid)
+        if stats is None:
+            return None
+        return float(stats[1]) / stats[0]
+
+    def append(self, timings, test_durations):
+        """ Append the stats of a run, dropping the runs older than the
+            last ``max_runs`` ones. Recorded runs are loaded first, so
+            they do not include this run.
+        """
+        if self._steps is None:
+            self.load()
+        runs = self.read_runs(
+            self.max_runs - 1 if self.max_runs else None)
+        run = time.time()
+        items = [item for items in runs for item in items]
+        for item in timings.as_list():
+            item.update(kind='step', run=run)
+            items.append(item)
+        for nodeid in sorted(test_durations):
+            items.append({
+                'kind': 'test',
+                'run': run,
+                'nodeid': nodeid,
+                'duration': test_durations[nodeid],
+            })
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as store_file:
+            for item in items:
+                store_file.write(json.dumps(item, sort_keys=True) + '\n')
+        try:
+            os.replace(tmp_path, self.path)
+        except AttributeError:
+            # python2 compatibility
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            os.rename(tmp_path, self.path)
+
+    def regressions(self, timings, threshold):
+        """ Return the total step stats of timings whose mean duration is
+            greater than the recorded one multiplied by threshold, with
+            the recorded mean added as ``previous_mean``
+        """
+        result = []
+        for item in timings.slowest():
+            previous = self.steps.mean(
+                item['skin'], item['page_id'], item['step'])
+            if previous is not None and item['mean'] > previous * threshold:
+                item['previous_mean'] = previous
+                result.append(item)
+        return result
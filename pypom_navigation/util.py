@@ -1,9 +1,123 @@
+import json
 try:
     from urlparse import urljoin
 except ImportError:
     # python3 compatibility
     from urllib.parse import urljoin
 from zope.dottedname.resolve import resolve
+try:
+    string_types = basestring  # noqa
+except NameError:
+    # python3 compatibility
+    string_types = str
+
+
+class PageClassCache(object):
+    """ Memoize page classes resolved from dotted names.
+
+        A dotted name always resolves to the same object, so once resolved
+        there is no need to go through the import machinery again::
+
+            >>> cache = PageClassCache()
+            >>> cache.resolve('pypom_navigation.pages.BasePage')
+            <class 'pypom_navigation.pages.base.BasePage'>
+            >>> cache.resolve('pypom_navigation.pages.BasePage')
+            <class 'pypom_navigation.pages.base.BasePage'>
+            >>> cache.info() == {'hits': 1, 'misses': 1, 'size': 1}
+            True
+            >>> cache.clear()
+            >>> cache.info() == {'hits': 0, 'misses': 0, 'size': 0}
+            True
+    """
+
+    def __init__(self):
+        self.cache = {}
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, dotted_name):
+        """ Return the object referenced by dotted_name """
+        try:
+            value = self.cache[dotted_name]
+        except KeyError:
+            self.misses += 1
+            value = self.cache[dotted_name] = resolve(dotted_name)
+        else:
+            self.hits += 1
+        return value
+
+    def clear(self):
+        """ Invalidate all the resolved names and reset counters """
+        self.cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        """ Return hit/miss counters and the number of cached names """
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self.cache)}
+
+
+page_class_cache = PageClassCache()
+
+
+def clear_page_class_cache():
+    """ Invalidate the page class cache used by :func:`get_page_class`.
+
+        Useful if you reload page object modules at runtime.
+    """
+    page_class_cache.clear()
+
+
+def validate_page_mappings(default_pages, page_mappings):
+    """ Resolve every dotted name referenced by default_pages and
+        page_mappings for all the configured skins.
+
+        All the problems found are collected and returned as a list of
+        error messages, an empty list means valid settings. Resolved
+        page classes are kept in ``page_class_cache``.
+
+        >>> validate_page_mappings(
+        ...     {'skin1': 'pypom_navigation.pages.BasePage'},
+        ...     {'HomePage': {'path': '/',
+        ...                   'actions': {'login': 'LoginPage'}}})
+        ["HomePage: action 'login' points to unknown page 'LoginPage'"]
+    """
+    errors = []
+
+    def check_dotted_name(prefix, dotted_name):
+        try:
+            page_class_cache.resolve(dotted_name)
+        except Exception as exc:
+            errors.append('{0}: cannot resolve {1!r} ({2})'.format(
+                prefix, dotted_name, exc))
+
+    for skin_name in sorted(default_pages):
+        check_dotted_name(
+            'default_pages[{0}]'.format(skin_name), default_pages[skin_name])
+
+    for page_id in sorted(page_mappings):
+        page_mapping = page_mappings[page_id]
+        if not isinstance(page_mapping, dict):
+            errors.append('{0}: mapping expected, got {1!r}'.format(
+                page_id, page_mapping))
+            continue
+        path = page_mapping.get('path', '/')
+        if not isinstance(path, string_types):
+            errors.append('{0}: invalid path {1!r}'.format(page_id, path))
+        page_class_mapping = page_mapping.get('page_class', None) or {}
+        for skin_name in sorted(page_class_mapping):
+            check_dotted_name(
+                '{0}: page_class[{1}]'.format(page_id, skin_name),
+                page_class_mapping[skin_name])
+        actions = page_mapping.get('actions', None) or {}
+        for action in sorted(actions):
+            if actions[action] not in page_mappings:
+                errors.append(
+                    '{0}: action {1!r} points to unknown page {2!r}'.format(
+                        page_id, action, actions[action]))
+    return errors
 
 
 def get_page_url(skin_name, page_mappings, page_id):
@@ -25,9 +139,12 @@ def get_page_class(skin_name, page_mappings, page_id=None, fallback=None,
         * the match for the given skin if defined
         * a fallback if defined
         * the given fallback if defined or the global default page class
+
+        Dotted names are resolved once and then served by
+        ``page_class_cache``.
     """
-    fallback = fallback and fallback or resolve(default_pages[
-        skin_name])
+    fallback = fallback and fallback or page_class_cache.resolve(
+        default_pages[skin_name])
     if not page_id:
         return fallback
 
@@ -35,11 +152,91 @@ def get_page_class(skin_name, page_mappings, page_id=None, fallback=None,
     if page_class_mapping is not None:
         result = page_class_mapping.get(
             skin_name, page_class_mapping.get('fallback', None))
-        return result and resolve(result) or fallback
+        return result and page_class_cache.resolve(result) or fallback
 
     return fallback
 
 
+CLEAR_STORAGE_SCRIPT = """
+try {
+    window.localStorage.clear();
+    window.sessionStorage.clear();
+} catch (e) {}
+"""
+
+
+def clear_browser_state(driver):
+    """ Delete all cookies, local and session storage for the current
+        driver so that it can be reused by another test
+    """
+    try:
+        delete_all = driver.cookies.delete_all
+    except AttributeError:
+        # old splinter versions, delete() without args deletes all
+        driver.cookies.delete()
+    else:
+        delete_all()
+    driver.execute_script(CLEAR_STORAGE_SCRIPT)
+
+
+CAPTURE_STORAGE_SCRIPT = """(function () {
+    var dump = function (storage) {
+        var items = {};
+        for (var i = 0; i < storage.length; i++) {
+            var key = storage.key(i);
+            items[key] = storage.getItem(key);
+        }
+        return items;
+    };
+    try {
+        return {local: dump(window.localStorage),
+                session: dump(window.sessionStorage)};
+    } catch (e) {
+        return {local: {}, session: {}};
+    }
+})()"""
+
+RESTORE_STORAGE_SCRIPT = """
+var state = %s;
+try {
+    Object.keys(state.local).forEach(function (key) {
+        window.localStorage.setItem(key, state.local[key]);
+    });
+    Object.keys(state.session).forEach(function (key) {
+        window.sessionStorage.setItem(key, state.session[key]);
+    });
+} catch (e) {}
+"""
+
+
+def capture_browser_state(driver):
+    """ Return the cookies, local and session storage of the current
+        driver as a json serializable dict
+    """
+    storage = driver.evaluate_script(CAPTURE_STORAGE_SCRIPT) or {}
+    return {
+        'cookies': driver.cookies.all(verbose=True),
+        'local_storage': storage.get('local', {}),
+        'session_storage': storage.get('session', {}),
+    }
+
+
+def restore_browser_state(driver, state):
+    """ Restore a browser state returned by ``capture_browser_state``.
+
+        The driver must be on a page of the same domain.
+    """
+    for cookie in state['cookies']:
+        attributes = dict(cookie)
+        name = attributes.pop('name')
+        value = attributes.pop('value')
+        driver.cookies.add({name: value}, **attributes)
+    driver.execute_script(RESTORE_STORAGE_SCRIPT % json.dumps({
+        'local': state['local_storage'],
+        'session': state['session_storage'],
+    }))
+
+
 def page_factory(base_url, browser, default_page_class, page_mappings,
                  skin_name, page_id=None, **kwargs):
     url = base_url
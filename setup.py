@@ -28,6 +28,10 @@ tests_require = [
     'mock',
 ]
 
+benchmarks_require = [
+    'pytest-benchmark',
+]
+
 docs_require = [
     'Sphinx',
     'sphinx_rtd_theme',
@@ -73,6 +77,7 @@ setup(
     },
     extras_require={
         'tests': tests_require,
+        'benchmarks': benchmarks_require,
         'docs': docs_require,
     },
 )
@@ -0,0 +1,109 @@
+import asyncio
+import threading
+
+import pytest
+from mock import MagicMock
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    asyncio.set_event_loop(None)
+    loop.close()
+
+
+def test_async_navigation(async_navigation, navigation):
+    """ Async navigation wraps the navigation fixture """
+    from pypom_navigation.async_navigation import AsyncNavigation
+
+    assert isinstance(async_navigation, AsyncNavigation)
+    assert async_navigation.navigation is navigation
+    assert async_navigation.page is None
+    assert async_navigation.skin == navigation.skin
+
+
+def test_async_steps(loop):
+    """ Steps run in the executor """
+    from pypom_navigation.async_navigation import AsyncNavigation
+
+    threads = []
+    navigation = MagicMock()
+    navigation.visit_page.side_effect = \
+        lambda *args, **kwargs: threads.append(threading.current_thread())
+    async_navigation = AsyncNavigation(navigation)
+
+    asyncio.set_event_loop(loop)
+    loop.run_until_complete(async_navigation.visit_page('HomePage', timeout=1))
+    loop.run_until_complete(
+        async_navigation.update_page('HomePage', timeout=1))
+    loop.run_until_complete(
+        async_navigation.action_performed('back', timeout=1))
+    assert navigation.visit_page.assert_called_once_with(
+        'HomePage', timeout=1) is None
+    assert navigation.update_page.assert_called_once_with(
+        'HomePage', timeout=1) is None
+    assert navigation.action_performed.assert_called_once_with(
+        'back', fallback=None, timeout=1) is None
+    assert threads[0] is not threading.current_thread()
+
+
+def test_async_concurrent(loop):
+    """ Several navigations driven concurrently """
+    from pypom_navigation.async_navigation import AsyncNavigation
+
+    barrier = threading.Barrier(2, timeout=5)
+    navigations = [MagicMock(), MagicMock()]
+    for navigation in navigations:
+        # would block forever if steps were not concurrent
+        navigation.visit_page.side_effect = \
+            lambda *args, **kwargs: barrier.wait()
+
+    asyncio.set_event_loop(loop)
+    loop.run_until_complete(asyncio.gather(*[
+        AsyncNavigation(navigation).visit_page('HomePage')
+        for navigation in navigations]))
+    for navigation in navigations:
+        assert navigation.visit_page.called is True
+
+
+def test_async_driver_loop_thread(loop):
+    """ The driver is resolved on the event loop thread """
+    from mock import PropertyMock
+    from pypom_navigation.async_navigation import AsyncNavigation
+
+    threads = []
+    navigation = MagicMock(page=None)
+    type(navigation).driver = PropertyMock(
+        side_effect=lambda: threads.append(threading.current_thread()))
+    asyncio.set_event_loop(loop)
+    loop.run_until_complete(
+        AsyncNavigation(navigation).visit_page('HomePage'))
+    assert threads == [threading.current_thread()]
+    assert navigation.visit_page.called is True
+
+
+def test_async_same_navigation(loop):
+    """ Steps of the same navigation run one at a time """
+    import time
+    from pypom_navigation.async_navigation import AsyncNavigation
+
+    running = []
+    overlaps = []
+
+    def step(*args, **kwargs):
+        running.append(args)
+        overlaps.append(len(running))
+        time.sleep(0.01)
+        running.remove(args)
+
+    navigation = MagicMock()
+    navigation.visit_page.side_effect = step
+    navigation.update_page.side_effect = step
+    async_navigation = AsyncNavigation(navigation)
+    asyncio.set_event_loop(loop)
+    loop.run_until_complete(asyncio.gather(
+        async_navigation.visit_page('HomePage'),
+        async_navigation.update_page('AnotherPage'),
+        async_navigation.visit_page('LastPage')))
+    assert overlaps == [1, 1, 1]
@@ -0,0 +1,69 @@
+import pytest
+
+
+def test_build_skin_config():
+    """ Skin config built from variables """
+    from pypom_navigation.config import build_skin_config
+
+    variables = {
+        'skins': {
+            'skin1': {
+                'base_url': 'https://skin1-coolsite.com',
+                'credentials': {'Administrator': {
+                    'username': 'admin', 'password': 'pwd'}},
+            },
+        },
+    }
+    config = build_skin_config('skin1', variables)
+    assert config.skin == 'skin1'
+    assert config.base_url == 'https://skin1-coolsite.com'
+    assert dict(config.credentials) == \
+        variables['skins']['skin1']['credentials']
+
+
+def test_build_skin_config_defaults():
+    """ Missing skin variables """
+    from pypom_navigation.config import build_skin_config
+
+    config = build_skin_config('skin2', {})
+    assert config.base_url == ''
+    assert dict(config.credentials) == {}
+
+
+def test_skin_config_read_only():
+    """ Skin config is read only """
+    from pypom_navigation.config import build_skin_config
+
+    config = build_skin_config('skin1', {})
+    with pytest.raises(AttributeError):
+        config.base_url = 'http://another'
+    with pytest.raises(TypeError):
+        config.credentials['Administrator'] = {}
+
+
+def test_slice_variables():
+    """ Variables sliced by skin names """
+    from pypom_navigation.config import slice_variables
+
+    variables = {'default_timeout': 5,
+                 'skins': {'skin1': {'base_url': 'https://skin1'},
+                           'skin2': {'base_url': 'https://skin2'}}}
+    assert slice_variables(variables) == variables
+    assert slice_variables(variables, ['skin2', 'skin3']) == {
+        'default_timeout': 5,
+        'skins': {'skin2': {'base_url': 'https://skin2'}}}
+    assert slice_variables({}, ['skin1']) == {}
+    assert set(variables['skins']) == set(['skin1', 'skin2'])
+
+
+@pytest.mark.parametrize('variables', [
+    [],
+    {'skins': []},
+    {'skins': {'skin1': 'invalid'}},
+])
+def test_slice_variables_invalid(variables):
+    """ Invalid variables """
+    from pypom_navigation.config import slice_variables
+
+    with pytest.raises(ValueError):
+        slice_variables(variables)
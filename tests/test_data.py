@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+
+def _write(tmpdir, name, content):
+    path = tmpdir.join(name)
+    path.write_binary(content.encode('utf-8'))
+    return str(path)
+
+
+def _read_all(path, data_format):
+    from pypom_navigation.data import (
+        iter_row_offsets,
+        read_row,
+    )
+    return [read_row(path, data_format, offset)
+            for offset in iter_row_offsets(path, data_format)]
+
+
+@pytest.mark.parametrize('name,data_format', [
+    ['data.csv', 'csv'],
+    ['data.jsonl', 'jsonl'],
+    ['data.ndjson', 'jsonl'],
+    ['data.YAML', 'yaml'],
+    ['data.yml', 'yaml'],
+])
+def test_get_data_format(name, data_format):
+    """ Data format guessed by extension """
+    from pypom_navigation.data import get_data_format
+
+    assert get_data_format(name) == data_format
+    assert get_data_format('data.txt', data_format) == data_format
+
+
+def test_get_data_format_unsupported():
+    """ Unsupported data sources """
+    from pypom_navigation.data import get_data_format
+
+    with pytest.raises(ValueError):
+        get_data_format('data.txt')
+    with pytest.raises(ValueError):
+        get_data_format('data.csv', 'xml')
+
+
+def test_csv(tmpdir):
+    """ CSV rows, quoted newlines included """
+    path = _write(tmpdir, 'data.csv',
+                  'user_id,comment\n'
+                  'Administrator,"first\nsecond"\n'
+                  '\n'
+                  'Editor,città\n')
+    assert _read_all(path, 'csv') == [
+        {'user_id': 'Administrator', 'comment': 'first\nsecond'},
+        {'user_id': 'Editor', 'comment': u'città'},
+    ]
+
+
+def test_jsonl(tmpdir):
+    """ JSON lines rows """
+    path = _write(tmpdir, 'data.jsonl',
+                  '{"user_id": "Administrator", "items": 1}\n'
+                  '\n'
+                  '{"user_id": "Editor", "items": 2}')
+    assert _read_all(path, 'jsonl') == [
+        {'user_id': 'Administrator', 'items': 1},
+        {'user_id': 'Editor', 'items': 2},
+    ]
+
+
+def test_yaml(tmpdir):
+    """ YAML sequence rows """
+    path = _write(tmpdir, 'data.yml',
+                  '---\n'
+                  '# users\n'
+                  '- user_id: Administrator\n'
+                  '  tags:\n'
+                  '    - admin\n'
+                  '-\n'
+                  '  user_id: Editor\n')
+    assert _read_all(path, 'yaml') == [
+        {'user_id': 'Administrator', 'tags': ['admin']},
+        {'user_id': 'Editor'},
+    ]
+
+
+@pytest.mark.parametrize('name,data_format,content', [
+    ['data.csv', 'csv', 'user_id\nAdministrator\nEditor\n'],
+    ['data.jsonl', 'jsonl',
+     '{"user_id": "Administrator"}\n{"user_id": "Editor"}\n'],
+    ['data.yml', 'yaml',
+     '- user_id: Administrator\n- user_id: Editor\n'],
+])
+def test_byte_order_mark(tmpdir, name, data_format, content):
+    """ UTF-8 byte order mark (as exported by spreadsheets) skipped """
+    path = _write(tmpdir, name, u'\ufeff' + content)
+    assert _read_all(path, data_format) == [
+        {'user_id': 'Administrator'},
+        {'user_id': 'Editor'},
+    ]
+
+
+def test_render_row():
+    """ String values rendered by the parametrizer """
+    from pypom_navigation.data import render_row
+    from pypom_navigation.parametrizer import CachingParametrizer
+
+    row = {'user_id': '$skin-user', 'items': 1}
+    assert render_row(row, CachingParametrizer({'skin': 'skin1'})) == {
+        'user_id': 'skin1-user', 'items': 1}
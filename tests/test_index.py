@@ -0,0 +1,66 @@
+import pytest
+
+
+@pytest.fixture
+def page_mappings():
+    return {
+        'HomePage': {
+            'path': '/home'
+        },
+        'AnotherPage': {
+            'path': '/example',
+            'actions': {'back': 'HomePage'}
+        }
+    }
+
+
+def test_build_page_index(page_mappings):
+    """ Page index """
+    from pypom_navigation.index import build_page_index
+
+    index = build_page_index(
+        'skin1', 'https://skin1-coolsite.com', page_mappings)
+    assert len(index) == 2
+    assert sorted(index) == ['AnotherPage', 'HomePage']
+    assert 'HomePage' in index
+    assert index.get('Unknown') is None
+    assert index['HomePage'].url == 'https://skin1-coolsite.com/home'
+    assert index['HomePage'].path == '/home'
+    assert index['HomePage'].page_class is None
+    assert dict(index['HomePage'].actions) == {}
+    assert dict(index['AnotherPage'].actions) == {'back': 'HomePage'}
+
+
+def test_build_page_index_page_class():
+    """ Page index, page class resolution for the given skin """
+    import pypom_navigation
+    import pypom_navigation.pages
+    from pypom_navigation.index import build_page_index
+
+    page_mappings = {
+        'HomePage': {
+            'page_class': {
+                'skin1': 'pypom_navigation.pages',
+                'fallback': 'pypom_navigation',
+            }
+        },
+    }
+
+    index1 = build_page_index('skin1', 'http://base', page_mappings)
+    index2 = build_page_index('skin2', 'http://base', page_mappings)
+    assert index1['HomePage'].page_class is pypom_navigation.pages
+    assert index2['HomePage'].page_class is pypom_navigation
+
+
+def test_page_index_read_only(page_mappings):
+    """ Page index and records are read only """
+    from pypom_navigation.index import build_page_index
+
+    index = build_page_index(
+        'skin1', 'https://skin1-coolsite.com', page_mappings)
+    with pytest.raises(AttributeError):
+        index.skin = 'skin2'
+    with pytest.raises(AttributeError):
+        index['HomePage'].url = 'http://another'
+    with pytest.raises(TypeError):
+        index['AnotherPage'].actions['back'] = 'AnotherPage'
@@ -0,0 +1,57 @@
+from mock import MagicMock
+
+
+def test_lazy_page_setattr():
+    """ Attributes are set on the page instance """
+    from pypom_navigation.lazy import LazyPage
+
+    page_instance = MagicMock()
+    page = LazyPage('driver', lambda: page_instance)
+    page.navigation = 'navigation'
+    assert page.forced is True
+    assert page_instance.navigation == 'navigation'
+
+
+def test_lazy_page_repr():
+    """ Lazy page repr """
+    from pypom_navigation.lazy import LazyPage
+
+    page = LazyPage('driver', lambda: 'page')
+    assert repr(page) == '<LazyPage not forced>'
+    page.force()
+    assert repr(page) == "<LazyPage 'page'>"
+
+
+def test_lazy_mapping():
+    """ Values are computed once on first access """
+    from pypom_navigation.lazy import LazyMapping
+
+    factory = MagicMock(return_value='value')
+    mapping = LazyMapping({'name': factory})
+    assert 'name' in mapping
+    assert 'missing' not in mapping
+    assert len(mapping) == 1
+    assert mapping.is_computed('name') is False
+    assert factory.called is False
+    assert dict(mapping) == {'name': 'value'}
+    assert mapping.is_computed('name') is True
+    assert mapping['name'] == 'value'
+    assert factory.call_count == 1
+
+
+def test_lazy_mapping_set_delete():
+    """ Lazy mappings can be updated """
+    import pytest
+    from pypom_navigation.lazy import LazyMapping
+
+    mapping = LazyMapping({'name': lambda: 'value'})
+    mapping['name'] = 'another'
+    mapping['new'] = 'new value'
+    assert dict(mapping) == {'name': 'another', 'new': 'new value'}
+    assert len(mapping) == 2
+    del mapping['name']
+    assert 'name' not in mapping
+    with pytest.raises(KeyError):
+        del mapping['name']
+    with pytest.raises(KeyError):
+        mapping['name']
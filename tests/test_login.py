@@ -0,0 +1,26 @@
+def test_login_cache_ttl():
+    """ States older than ttl are discarded """
+    from pypom_navigation.login import LoginCache
+
+    now = [0]
+    cache = LoginCache(ttl=10, clock=lambda: now[0])
+    cache.set('key', 'state')
+    now[0] = 10
+    assert cache.get('key') == 'state'
+    now[0] = 11
+    assert cache.get('key') is None
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_login_cache_invalidate_all():
+    """ Discard all the states """
+    from pypom_navigation.login import LoginCache
+
+    cache = LoginCache()
+    cache.set('key1', 'state1')
+    cache.set('key2', 'state2')
+    assert cache.get('key1') == 'state1'
+    cache.invalidate()
+    assert cache.get('key1') is None
+    assert cache.get('key2') is None
@@ -1,5 +1,8 @@
 import pytest
-from mock import MagicMock
+from mock import (
+    MagicMock,
+    call,
+)
 
 
 @pytest.fixture
@@ -197,3 +200,453 @@ def test_get_page_instance_kwargs(navigation, default_timeout,
         navigation.driver, timeout=default_timeout, new=2) is None
     assert navigation.kwargs['timeout'] == default_timeout
     assert 'new' not in navigation.kwargs
+
+
+def test_navigation_page_index(navigation, page_index):
+    """ Navigation uses the page index compiled for the session """
+    assert navigation.page_index is page_index
+    assert navigation.get_page_absolute_url('HomePage') == \
+        'https://skin1-coolsite.com/home'
+    assert navigation.get_page_actions('AnotherPage') == \
+        {'back': 'HomePage'}
+
+
+def test_navigation_page_index_get_page_url(navigation, page_index,
+                                           default_page_class):
+    """ get_page_url overrides are honoured with a page index """
+    from pypom_navigation.navigation import Navigation
+
+    class CustomNavigation(Navigation):
+        def get_page_url(self, page_id):
+            return '/custom/{0}'.format(page_id)
+
+    navigation.__class__ = CustomNavigation
+    assert navigation.page_index is page_index
+    assert navigation.get_page_absolute_url('HomePage') == \
+        'https://skin1-coolsite.com/custom/HomePage'
+
+    navigation.visit_page('HomePage')
+    default_page_class.return_value.driver.visit.assert_called_once_with(
+        'https://skin1-coolsite.com/custom/HomePage')
+
+
+def test_navigation_no_page_index(navigation, page, default_page_class,
+                                  browser):
+    """ Navigation falls back to page_mappings without a page index """
+    navigation.page_index = None
+    assert navigation.get_page_absolute_url('HomePage') == \
+        'https://skin1-coolsite.com/home'
+    assert navigation.get_page_actions('AnotherPage') == \
+        {'back': 'HomePage'}
+    assert navigation.get_page_class('HomePage') is default_page_class
+
+    navigation.setPage(page, 'AnotherPage')
+    home_page = navigation.action_performed('back')
+    assert navigation.page_id == 'HomePage'
+    assert home_page is default_page_class.return_value
+
+
+def test_reset(navigation, page):
+    """ Reset browser state keeping the driver """
+    navigation.setPage(page, 'HomePage')
+    navigation.reset()
+    assert navigation.page is page
+    assert navigation.page_id is None
+    assert navigation.driver is page.driver
+    assert page.driver.cookies.delete_all.assert_called_once_with() is None
+    assert page.driver.execute_script.call_count == 1
+
+
+def test_reset_no_page(navigation, browser):
+    """ Reset without a page set does not open a browser """
+    navigation.reset()
+    assert navigation.page is None
+    assert browser.cookies.delete_all.called is False
+
+
+def test_browser_pool(navigation, browser, default_page_class):
+    """ Drivers checked out from the browser pool """
+    pool = MagicMock()
+    navigation.browser_pool = pool
+    navigation.visit_page('HomePage')
+    assert pool.checkout.assert_called_once_with(
+        'skin1', 'https://skin1-coolsite.com') is None
+    assert default_page_class.call_args[0][0] is pool.checkout.return_value
+    assert navigation.driver is not browser
+
+    navigation.release_driver(error=True)
+    assert pool.checkin.assert_called_once_with(
+        pool.checkout.return_value, 'skin1', 'https://skin1-coolsite.com',
+        error=True) is None
+    assert navigation.page is None
+    assert navigation.pool_driver is None
+
+
+def test_visit_if_needed(navigation, default_page_class):
+    """ Visit only if the page is not already loaded """
+    driver = default_page_class.return_value.driver
+    navigation.visit_if_needed = True
+    home_page = navigation.visit_page('HomePage')
+    assert driver.visit.call_count == 1
+    assert navigation.skipped_visits == 0
+
+    driver.url = 'https://skin1-coolsite.com/home'
+    assert navigation.visit_page('HomePage') is home_page
+    assert driver.visit.call_count == 1
+    assert default_page_class.call_count == 1
+    assert navigation.skipped_visits == 1
+
+    navigation.visit_page('AnotherPage')
+    assert driver.visit.call_count == 2
+    assert navigation.skipped_visits == 1
+
+
+def test_visit_if_needed_url_changed(navigation, default_page_class):
+    """ Visit if the url changed (same page id) """
+    driver = default_page_class.return_value.driver
+    navigation.visit_if_needed = True
+    navigation.visit_page('HomePage')
+    driver.url = 'https://skin1-coolsite.com/home?page=2'
+    navigation.visit_page('HomePage')
+    assert driver.visit.call_count == 2
+    assert navigation.skipped_visits == 0
+
+
+def test_visit_if_needed_disabled(navigation, default_page_class):
+    """ Always visit by default """
+    driver = default_page_class.return_value.driver
+    assert navigation.visit_if_needed is False
+    navigation.visit_page('HomePage')
+    driver.url = 'https://skin1-coolsite.com/home'
+    navigation.visit_page('HomePage')
+    assert driver.visit.call_count == 2
+    assert navigation.skipped_visits == 0
+
+
+def test_invalidate_snapshot(navigation, page, default_page_class):
+    """ Page snapshots are invalidated on each page transition """
+    navigation.setPage(page, 'AnotherPage')
+    assert page.invalidate_snapshot.call_count == 1
+
+    navigation.action_performed('back')
+    navigation.visit_page('HomePage')
+    assert default_page_class.return_value.invalidate_snapshot.call_count \
+        == 2
+
+    navigation.visit_if_needed = True
+    default_page_class.return_value.driver.url = \
+        'https://skin1-coolsite.com/home'
+    navigation.visit_page('HomePage')
+    assert navigation.skipped_visits == 1
+    assert default_page_class.return_value.invalidate_snapshot.call_count \
+        == 3
+
+
+def test_lazy_pages(navigation, page, default_page_class):
+    """ Lazy pages are created and loaded on first access """
+    from pypom_navigation.lazy import LazyPage
+
+    navigation.lazy_pages = True
+    navigation.setPage(page, 'AnotherPage')
+    lazy_page = navigation.action_performed('back')
+    assert isinstance(lazy_page, LazyPage)
+    assert navigation.page is lazy_page
+    assert navigation.page_id == 'HomePage'
+    assert lazy_page.driver is page.driver
+    assert default_page_class.called is False
+
+    lazy_page.wait_for_page_to_load.assert_called_once_with()
+    page_instance = default_page_class.return_value
+    assert navigation.page is page_instance
+    assert navigation.page_id == 'HomePage'
+    assert page_instance.navigation is navigation
+    default_page_class.assert_called_once_with(
+        page.driver, timeout=navigation.kwargs['timeout'])
+
+
+def test_lazy_pages_chain(navigation, page, default_page_class):
+    """ Intermediate lazy pages never accessed are never loaded """
+    navigation.lazy_pages = True
+    navigation.setPage(page, 'HomePage')
+    first = navigation.update_page('AnotherPage')
+    second = navigation.update_page('HomePage')
+    assert navigation.page is second
+    assert default_page_class.called is False
+
+    assert second.force() is default_page_class.return_value
+    assert default_page_class.call_count == 1
+
+    first.force()
+    assert default_page_class.call_count == 2
+    assert navigation.page is default_page_class.return_value
+    assert navigation.page_id == 'HomePage'
+
+
+def test_login_no_cache(navigation, page):
+    """ Always log in if the login cache is disabled """
+    do_login = MagicMock()
+    navigation.setPage(page)
+    assert navigation.login('Administrator', do_login) is False
+    assert navigation.login('Administrator', do_login) is False
+    assert do_login.call_count == 2
+    do_login.assert_called_with('admin', 'pwd')
+
+
+def test_login_cache(navigation, page, default_page_class):
+    """ Login states are captured and restored """
+    from pypom_navigation.login import LoginCache
+
+    navigation.login_cache = LoginCache()
+    navigation.setPage(page)
+    default_page_class.return_value.driver = page.driver
+    page.driver.url = 'about:blank'
+    page.driver.cookies.all.return_value = [
+        {'name': 'session', 'value': '123'}]
+    page.driver.evaluate_script.return_value = {
+        'local': {}, 'session': {}}
+    do_login = MagicMock()
+    assert navigation.login('Administrator', do_login) is False
+    do_login.assert_called_once_with('admin', 'pwd')
+
+    assert navigation.login('Administrator', do_login) is True
+    assert do_login.call_count == 1
+    assert page.driver.visit.call_args_list == [
+        call('https://skin1-coolsite.com'),
+        call('https://skin1-coolsite.com')]
+    page.driver.cookies.add.assert_called_once_with({'session': '123'})
+    assert navigation.page is default_page_class.return_value
+    assert navigation.page.wait_for_page_to_load.called is True
+
+    navigation.invalidate_login('Administrator')
+    assert navigation.login('Administrator', do_login) is False
+    assert do_login.call_count == 2
+
+    navigation.invalidate_login()
+    assert navigation.login_cache.states == {}
+
+
+def test_login_cache_is_logged_in(navigation, page, default_page_class):
+    """ Restored states failing the is logged in check are discarded """
+    from pypom_navigation.login import LoginCache
+
+    is_logged_in = MagicMock(return_value=False)
+    navigation.login_cache = LoginCache(is_logged_in=is_logged_in)
+    navigation.setPage(page)
+    default_page_class.return_value.driver = page.driver
+    page.driver.cookies.all.return_value = []
+    page.driver.evaluate_script.return_value = {
+        'local': {}, 'session': {}}
+    navigation.capture_login('Administrator')
+    do_login = MagicMock()
+    assert navigation.login('Administrator', do_login) is False
+    is_logged_in.assert_called_once_with(navigation)
+    assert do_login.call_count == 1
+
+    assert navigation.restore_login(
+        'Administrator', is_logged_in=lambda navigation: True) is True
+
+
+def test_login_cache_is_logged_in_page(navigation, default_page_class,
+                                       browser):
+    """ The is logged in check reads the page loaded after the restore """
+    from pypom_navigation.login import LoginCache
+
+    driver = MagicMock(url='https://skin1-coolsite.com/login')
+    loaded = []
+    driver.visit.side_effect = lambda url: loaded.append(url)
+    browser_page = default_page_class.return_value
+    browser_page.driver = driver
+    # logged in if the base url has been loaded with the restored state
+    browser_page.has_text.side_effect = \
+        lambda text: loaded == ['https://skin1-coolsite.com']
+    driver.cookies.all.return_value = []
+    driver.evaluate_script.return_value = {'local': {}, 'session': {}}
+    navigation.login_cache = LoginCache(
+        is_logged_in=lambda navigation: navigation.page.has_text('Logout'))
+    navigation.login_cache.set(
+        navigation.get_login_key('Administrator'),
+        {'cookies': [], 'local_storage': {}, 'session_storage': {}})
+
+    assert navigation.page is None
+    do_login = MagicMock()
+    assert navigation.login('Administrator', do_login) is True
+    assert do_login.called is False
+    assert navigation.page is browser_page
+    browser_page.has_text.assert_called_once_with('Logout')
+
+
+def test_checkpoint_restore(navigation, page, default_page_class):
+    """ Checkpoints store page id, url and browser state """
+    navigation.setPage(page, 'AnotherPage')
+    page.driver.url = 'https://skin1-coolsite.com/example?step=2'
+    page.driver.cookies.all.return_value = [
+        {'name': 'session', 'value': '123'}]
+    page.driver.evaluate_script.return_value = {
+        'local': {'cart': '1'}, 'session': {}}
+    assert navigation.restore('cart') is None
+    navigation.checkpoint('cart')
+    assert navigation.checkpoints[
+        ('skin1', 'https://skin1-coolsite.com', 'cart')]['page_id'] == \
+        'AnotherPage'
+
+    navigation.setPage(page, 'HomePage')
+    restored = navigation.restore('cart')
+    assert restored is default_page_class.return_value
+    assert navigation.page is restored
+    assert navigation.page_id == 'AnotherPage'
+    assert page.driver.cookies.delete_all.called is True
+    page.driver.cookies.add.assert_called_once_with({'session': '123'})
+    restored.driver.visit.assert_called_once_with(
+        'https://skin1-coolsite.com/example?step=2')
+    restored.wait_for_page_to_load.assert_called_once_with()
+
+
+def test_prefix(navigation, page, default_page_class):
+    """ Prefix steps run once, then the checkpoint is restored """
+    navigation.setPage(page, 'HomePage')
+    page.driver.url = 'https://skin1-coolsite.com/home'
+    page.driver.cookies.all.return_value = []
+    page.driver.evaluate_script.return_value = {
+        'local': {}, 'session': {}}
+    steps = MagicMock()
+    assert navigation.prefix('home', steps) is False
+    steps.assert_called_once_with(navigation)
+    assert navigation.prefix('home', steps) is True
+    assert steps.call_count == 1
+    assert navigation.page is default_page_class.return_value
+
+
+def test_timings(navigation, page):
+    """ Navigation step timings """
+    from pypom_navigation.timing import NavigationTimings
+
+    navigation.timings = NavigationTimings()
+    navigation.visit_page('AnotherPage')
+    navigation.action_performed('back')
+    navigation.action_performed('unknown')
+    navigation.update_page('AnotherPage')
+
+    steps = set((item['page_id'], item['step'], item['phase'])
+                for item in navigation.timings.as_list())
+    assert steps == set([
+        ('AnotherPage', 'visit_page', 'resolve'),
+        ('AnotherPage', 'visit_page', 'visit'),
+        ('AnotherPage', 'visit_page', 'wait'),
+        ('AnotherPage', 'visit_page', 'total'),
+        ('HomePage', 'action_performed', 'resolve'),
+        ('HomePage', 'action_performed', 'wait'),
+        ('HomePage', 'action_performed', 'total'),
+        (None, 'action_performed', 'resolve'),
+        (None, 'action_performed', 'wait'),
+        (None, 'action_performed', 'total'),
+        ('AnotherPage', 'update_page', 'resolve'),
+        ('AnotherPage', 'update_page', 'wait'),
+        ('AnotherPage', 'update_page', 'total'),
+    ])
+
+
+def test_merge_kwargs_once(navigation, page, default_timeout):
+    """ Keyword args merged once per step, only if overridden """
+    merge_kwargs = MagicMock(wraps=navigation.merge_kwargs)
+    navigation.merge_kwargs = merge_kwargs
+    navigation.visit_page('AnotherPage')
+    navigation.action_performed('back')
+    navigation.update_page('AnotherPage')
+    assert merge_kwargs.called is False
+
+    navigation.visit_page('AnotherPage', new=1)
+    navigation.action_performed('back', new=1)
+    navigation.update_page('AnotherPage', new=1)
+    assert merge_kwargs.call_count == 3
+    assert navigation.kwargs == {'timeout': default_timeout}
+
+
+class BackPage(object):
+    """ Page providing the back action """
+
+    def __init__(self, driver, **kwargs):
+        self.driver = driver
+
+    def wait_for_page_to_load(self):
+        return self
+
+    def back(self):
+        self.driver.back()
+
+
+@pytest.fixture
+def back_page_class(navigation):
+    """ Replayable back action for AnotherPage """
+    get_page_class = navigation.get_page_class
+
+    def get_back_page_class(page_id=None, fallback=None):
+        if page_id == 'AnotherPage':
+            return BackPage
+        return get_page_class(page_id=page_id, fallback=fallback)
+    navigation.get_page_class = get_back_page_class
+    return BackPage
+
+
+def test_navigate_to_actions(navigation, back_page_class, default_page_class,
+                             browser):
+    """ Navigate to a page following actions """
+    navigation.visit_page('AnotherPage')
+    assert browser.visit.call_count == 1
+
+    home_page = navigation.navigate_to('HomePage')
+    assert navigation.page_id == 'HomePage'
+    assert home_page is default_page_class.return_value
+    assert browser.back.call_count == 1
+    assert browser.visit.call_count == 1
+
+    assert navigation.navigate_to('HomePage') is home_page
+
+
+def test_navigate_to_visit(navigation, default_page_class):
+    """ Navigate to a page not reachable with actions """
+    driver = default_page_class.return_value.driver
+    del default_page_class.back
+    navigation.navigate_to('HomePage')
+    assert driver.visit.call_count == 1
+
+    navigation.navigate_to('AnotherPage')
+    assert navigation.page_id == 'AnotherPage'
+    assert driver.visit.call_count == 2
+
+    # AnotherPage provides no back method
+    navigation.navigate_to('HomePage')
+    assert navigation.page_id == 'HomePage'
+    assert driver.visit.call_count == 3
+
+
+def test_navigate_to_timings(navigation, back_page_class, browser):
+    """ Navigate to a page visiting it if cheaper """
+    from pypom_navigation.timing import NavigationTimings
+
+    navigation.timings = NavigationTimings()
+    navigation.timings.add('skin1', 'HomePage', 'visit_page', 'total', 1)
+    navigation.timings.add('skin1', 'HomePage', 'follow_action', 'total', 2)
+    stats = navigation.timings.stats
+    navigation.visit_page('AnotherPage')
+    navigation.navigate_to('HomePage')
+    assert stats[('skin1', 'HomePage', 'visit_page', 'total')][0] == 2
+    assert browser.back.call_count == 0
+
+    for i in range(5):
+        navigation.timings.add(
+            'skin1', 'HomePage', 'follow_action', 'total', 0)
+    navigation.visit_page('AnotherPage')
+    driver = navigation.page.driver
+    navigation.navigate_to('HomePage')
+    assert stats[('skin1', 'HomePage', 'visit_page', 'total')][0] == 2
+    assert driver.back.call_count == 1
+    assert stats[('skin1', 'HomePage', 'follow_action', 'total')][0] == 7
+
+
+def test_navigate_to_no_page_index(navigation, back_page_class, browser):
+    """ Page index built on demand """
+    navigation.page_index = None
+    navigation.visit_page('AnotherPage')
+    navigation.navigate_to('HomePage')
+    assert navigation.page_index is not None
+    assert browser.back.call_count == 1
@@ -0,0 +1,266 @@
+import pytest
+from mock import MagicMock
+
+
+@pytest.fixture
+def clock():
+    """ Fake clock advanced by sleep calls """
+    class Clock(object):
+
+        def __init__(self):
+            self.now = 0
+            self.sleeps = []
+
+        def time(self):
+            return self.now
+
+        def sleep(self, seconds):
+            self.sleeps.append(seconds)
+            self.now += seconds
+    return Clock()
+
+
+@pytest.fixture
+def page():
+    """ A base page with a mock driver """
+    from pypom_navigation.pages import BasePage
+
+    class MyPage(BasePage):
+        expected_durations = BasePage.expected_durations.__class__()
+
+    page = MyPage.__new__(MyPage)
+    page.driver = MagicMock()
+    page.timeout = 10
+    page.wait = MagicMock()
+    return page
+
+
+def test_poll_backoff(clock):
+    """ Poll intervals grow up to max_interval """
+    from pypom_navigation.pages.wait import AdaptiveWait
+
+    wait = AdaptiveWait(timeout=2,
+                        initial_interval=0.1,
+                        max_interval=0.4,
+                        clock=clock.time,
+                        sleep=clock.sleep)
+    assert wait.poll(lambda: False) is False
+    assert clock.sleeps == pytest.approx([0.1, 0.2, 0.4, 0.4, 0.4, 0.4, 0.1])
+    assert clock.now == pytest.approx(2)
+
+
+def test_poll_immediate(clock):
+    """ No sleep if the condition is already met """
+    from pypom_navigation.pages.wait import (
+        AdaptiveWait,
+        ExpectedDurations,
+    )
+
+    durations = ExpectedDurations()
+    wait = AdaptiveWait(clock=clock.time,
+                        sleep=clock.sleep,
+                        durations=durations)
+    assert wait.poll(lambda: 'value', key='key') == 'value'
+    assert clock.sleeps == []
+    assert durations.get('key') == 0
+
+
+def test_poll_learned(clock):
+    """ Learned durations are used as first poll interval and
+        for bounding negative checks
+    """
+    from pypom_navigation.pages.wait import (
+        AdaptiveWait,
+        ExpectedDurations,
+    )
+
+    durations = ExpectedDurations()
+    wait = AdaptiveWait(timeout=10,
+                        initial_interval=0.01,
+                        negative_factor=3,
+                        negative_min=0.5,
+                        clock=clock.time,
+                        sleep=clock.sleep,
+                        durations=durations)
+    assert wait.negative_timeout('key') == 10
+    values = iter([False, True])
+    assert wait.poll(lambda: next(values), key='key') is True
+    assert clock.sleeps == [0.01]
+    assert durations.get('key') == 0.01
+
+    assert wait.negative_timeout('key') == 0.5
+    durations.add('key', 1.01)
+    assert wait.negative_timeout('key') == pytest.approx(0.93)
+
+
+def test_until_timeout(clock):
+    """ until raises a TimeoutException """
+    from selenium.common.exceptions import TimeoutException
+    from pypom_navigation.pages.wait import AdaptiveWait
+
+    wait = AdaptiveWait(timeout=1, clock=clock.time, sleep=clock.sleep)
+    with pytest.raises(TimeoutException):
+        wait.until(lambda: False)
+    assert clock.now == 1
+
+
+def test_has_text_default(page):
+    """ Without adaptive waits splinter waits for the page timeout """
+    page.driver.is_text_present.return_value = False
+    assert page.has_text('text') is False
+    page.driver.is_text_present.assert_called_once_with(
+        'text', wait_time=10)
+
+
+def test_has_text_adaptive(page):
+    """ Negative checks don't burn the whole timeout once the page
+        durations are known
+    """
+    page.adaptive_wait = {'negative_min': 0.05, 'initial_interval': 0.01}
+    page.driver.find_by_tag.return_value.text = 'hello world'
+    assert page.has_text('hello') is True
+    assert page.driver.is_text_present.called is False
+    assert page.has_text('missing') is False
+
+
+def test_has_text_adaptive_variables(page):
+    """ Adaptive waits can be enabled with the adaptive_wait variable """
+    page.navigation = MagicMock()
+    page.navigation.variables = {'adaptive_wait': True}
+    page.driver.find_by_tag.side_effect = Exception('stale')
+    page.expected_durations.add((page.__class__, 'has_text'), 0.01)
+    assert page.get_adaptive_wait().timeout == 10
+    assert page.has_text('hello') is False
+
+
+def test_wait_for_url_change(page):
+    """ wait_for_url_change with and without adaptive waits """
+    from selenium.common.exceptions import TimeoutException
+
+    page.driver.url = 'http://page2'
+    assert page.wait_for_url_change('http://page1') is page
+    assert page.wait.until.called is True
+
+    page.adaptive_wait = True
+    assert page.wait_for_url_change('http://page1') is page
+    assert (page.__class__, 'wait_for_url_change') in \
+        page.expected_durations.durations
+
+    page.timeout = 0.05
+    with pytest.raises(TimeoutException):
+        page.wait_for_url_change('http://page2')
+
+
+def test_has_texts(page):
+    """ Many texts are checked reading the body text once per check """
+    from mock import PropertyMock
+
+    page.timeout = 0.05
+    type(page.driver.find_by_tag.return_value).text = PropertyMock(
+        side_effect=['hello', 'hello', 'hello world'] + ['hello'] * 100)
+    assert page.has_texts(['hello', 'world']) == {
+        'hello': True, 'world': True}
+    assert page.driver.find_by_tag.call_count == 3
+    page.driver.find_by_tag.assert_called_with('body')
+
+    assert page.has_texts(['hello', 'missing']) == {
+        'hello': True, 'missing': False}
+
+
+def test_has_texts_found(page):
+    """ No polling if all the texts are present """
+    page.driver.find_by_tag.return_value.text = 'hello world'
+    assert page.has_texts(['hello', 'world']) == {
+        'hello': True, 'world': True}
+    assert page.driver.find_by_tag.call_count == 1
+
+
+def test_has_texts_hidden(page):
+    """ Same text source as has_text: the body text, so hidden texts are
+        not found
+    """
+    page.timeout = 0.01
+    page.adaptive_wait = True
+    page.driver.find_by_tag.return_value.text = 'visible'
+    assert page.has_text('visible') is True
+    assert page.has_texts(['visible', 'hidden']) == {
+        'visible': True, 'hidden': False}
+    assert page.has_text('hidden') is False
+
+
+def test_find_many(page):
+    """ Elements for many selectors with one script execution """
+    page.driver.evaluate_script.return_value = [['element'], []]
+    assert page.find_many(['.item', '#missing']) == {
+        '.item': ['element'], '#missing': []}
+    assert page.driver.evaluate_script.call_count == 1
+    assert '[".item", "#missing"]' in \
+        page.driver.evaluate_script.call_args[0][0]
+
+
+def test_snapshot_disabled(page):
+    """ Page state is read from the driver by default """
+    page.driver.url = 'http://page1'
+    assert page.current_url == 'http://page1'
+    page.driver.url = 'http://page2'
+    assert page.current_url == 'http://page2'
+
+
+def test_snapshot(page):
+    """ Page state is memoized until invalidated """
+    page.snapshot_cache = True
+    page.driver.url = 'http://page1'
+    assert page.current_url == 'http://page1'
+    page.driver.url = 'http://page2'
+    assert page.current_url == 'http://page1'
+    page.invalidate_snapshot()
+    assert page.current_url == 'http://page2'
+
+
+def test_snapshot_variables(page):
+    """ Snapshot cache enabled with the snapshot_cache variable """
+    page.navigation = MagicMock()
+    page.navigation.variables = {'snapshot_cache': True}
+    getter = MagicMock(return_value='value')
+    assert page.snapshot('name', getter) == 'value'
+    assert page.snapshot('name', getter) == 'value'
+    assert getter.call_count == 1
+
+
+def test_snapshot_has_text(page):
+    """ Texts found in the page text snapshot don't hit the driver """
+    page.snapshot_cache = True
+    page.driver.find_by_tag.return_value.text = 'hello world'
+    assert page.has_text('hello') is True
+    assert page.has_text('world') is True
+    assert page.has_texts(['hello', 'world']) == {
+        'hello': True, 'world': True}
+    assert page.driver.find_by_tag.call_count == 1
+    assert page.driver.is_text_present.called is False
+    assert page.driver.evaluate_script.called is False
+
+    page.driver.is_text_present.return_value = True
+    assert page.has_text('new text') is True
+    assert page.driver.is_text_present.call_count == 1
+    assert page.has_text('hello') is True
+    assert page.driver.find_by_tag.call_count == 2
+
+
+def test_snapshot_find_many(page):
+    """ find_many results are memoized """
+    page.snapshot_cache = True
+    page.driver.evaluate_script.return_value = [['element']]
+    assert page.find_many(['.item']) == {'.item': ['element']}
+    assert page.find_many(['.item']) == {'.item': ['element']}
+    assert page.driver.evaluate_script.call_count == 1
+
+
+def test_snapshot_wait_for_url_change(page):
+    """ Url changes are not hidden by the snapshot """
+    page.snapshot_cache = True
+    page.adaptive_wait = True
+    page.driver.url = 'http://page1'
+    assert page.current_url == 'http://page1'
+    page.driver.url = 'http://page2'
+    page.wait_for_url_change('http://page1')
+    assert page.current_url == 'http://page2'
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+
+TEMPLATES = [
+    '{"baudrate": $baudrate_value}',
+    '{"name": "$a_name"}',
+    '{"name": "${name}"}',
+    '{"price": "$$10", "name": "$name"}',
+    '{"name": "{! name.upper() !}"}',
+    '{"name": "$name", "upper": "{! name.upper() !}"}',
+    '{% if name %}yes{% endif %}',
+    'trailing newline $name\n',
+    'plain text',
+    '$ alone and $1 invalid',
+    '',
+    '{% if name %}$name{% endif %} $missing',
+    '{! "$name".upper() !} $name {# $name #}',
+    '$name{%- if name %} x {% endif -%} $padded $braces',
+    '{! 1 !} $newline',
+    '{$bang name !} $bang',
+    '{% raw %}$name {! name !}{% endraw %}',
+]
+
+
+@pytest.fixture
+def mapping():
+    return {'baudrate_value': 250, 'name': 'a name', 'padded': ' a ',
+            'braces': '{! name !}', 'newline': 'a\n', 'bang': '!'}
+
+
+@pytest.mark.parametrize('template', TEMPLATES)
+def test_parametrize_compatibility(mapping, template):
+    """ Same results as the parametrizer package """
+    from parametrizer import Parametrizer
+    from pypom_navigation.parametrizer import CachingParametrizer
+
+    expected = Parametrizer(mapping).parametrize(template)
+    assert CachingParametrizer(mapping).parametrize(template) == expected
+    assert CachingParametrizer(mapping).parametrize(template) == expected
+
+
+def test_parametrize_cache():
+    """ Templates are compiled once """
+    from pypom_navigation.parametrizer import (
+        CachingParametrizer,
+        TemplateCache,
+    )
+
+    class Parametrizer(CachingParametrizer):
+        cache = TemplateCache(maxsize=2)
+
+    assert Parametrizer({'name': 'a'}).parametrize('$name') == 'a'
+    assert Parametrizer({'name': 'b'}).parametrize('$name') == 'b'
+    assert Parametrizer.cache.info() == {
+        'hits': 1, 'misses': 1, 'size': 1, 'maxsize': 2, 'hit_rate': 0.5}
+
+    Parametrizer({}).parametrize('$other')
+    Parametrizer({}).parametrize('{! 1 + 1 !}')
+    assert Parametrizer.cache.info()['size'] == 2
+    assert ('substitution', '$name') not in Parametrizer.cache.cache
+
+    Parametrizer.cache.clear()
+    assert Parametrizer.cache.info()['size'] == 0
+
+
+def test_parametrize_cache_jinja2():
+    """ jinja2 templates compiled once whatever the values substituted
+        outside tags are
+    """
+    from pypom_navigation.parametrizer import (
+        CachingParametrizer,
+        TemplateCache,
+    )
+
+    class Parametrizer(CachingParametrizer):
+        cache = TemplateCache()
+
+    template = 'run $test_run_identifier {! name.upper() !}'
+    for identifier in ('QA-1', 'QA-2', 'QA-3'):
+        assert Parametrizer(
+            {'test_run_identifier': identifier, 'name': 'a'}
+        ).parametrize(template) == 'run {0} A'.format(identifier)
+    assert len([key for key in Parametrizer.cache.cache
+                if key[0] == 'jinja2']) == 1
+
+    # values substituted inside tags are part of the template source
+    for identifier in ('QA-1', 'QA-2'):
+        assert Parametrizer({'test_run_identifier': identifier}).parametrize(
+            '{! "$test_run_identifier".lower() !}') == identifier.lower()
+    assert len([key for key in Parametrizer.cache.cache
+                if key[0] == 'jinja2']) == 3
+
+
+def test_parametrize_lazy():
+    """ Only the referenced variables are read """
+    from pypom_navigation.lazy import LazyMapping
+    from pypom_navigation.parametrizer import CachingParametrizer
+
+    def unexpected():
+        raise AssertionError('not referenced')
+
+    mapping = LazyMapping({
+        'name': lambda: 'a name',
+        'unused': unexpected,
+    })
+    parametrizer = CachingParametrizer(mapping)
+    assert parametrizer.parametrize('$name {! name.upper() !}') == \
+        'a name A NAME'
+    assert mapping.is_computed('unused') is False
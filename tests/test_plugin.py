@@ -243,10 +243,110 @@ def test_bdd_vars(bdd_vars, skin, now, test_run_identifier):
     assert bdd_vars['test_run_identifier'] == test_run_identifier
 
 
+def test_bdd_vars_lazy(testdir):
+    """ bdd_vars values are computed on first access """
+    testdir.makepyfile("""
+        import pytest
+
+
+        SETUPS = []
+
+
+        @pytest.fixture
+        def test_run_identifier():
+            SETUPS.append('test_run_identifier')
+            return 'QA-123'
+
+
+        @pytest.fixture
+        def now():
+            SETUPS.append('now')
+            raise RuntimeError('not expected')
+
+
+        def test_lazy(bdd_vars):
+            assert SETUPS == []
+            assert bdd_vars['skin'] == 'skin1'
+            assert bdd_vars['test_run_identifier'] == 'QA-123'
+            assert bdd_vars['test_run_identifier'] == 'QA-123'
+            assert SETUPS == ['test_run_identifier']
+    """)
+
+    result = testdir.runpytest()
+
+    result.assert_outcomes(passed=1)
+
+
+def test_bdd_vars_hook(testdir):
+    """ Additional bdd_vars registered with a hook, cached by scope """
+    testdir.makeconftest("""
+        CALLS = []
+
+
+        def pytest_pypom_navigation_bdd_vars(register):
+            def factory(name):
+                def compute(request):
+                    CALLS.append(name)
+                    return '{0}-{1}'.format(name, len(CALLS))
+                return compute
+            register('per_test', factory('per_test'))
+            register('per_module', factory('per_module'), scope='module')
+            register('per_session', factory('per_session'),
+                     scope='session')
+            register('unused', factory('unused'), scope='session')
+    """)
+    testdir.makepyfile(test_first="""
+        from conftest import CALLS
+
+
+        def test_first(bdd_vars):
+            assert bdd_vars['per_session'] == 'per_session-1'
+            assert bdd_vars['per_module'] == 'per_module-2'
+            assert bdd_vars['per_test'] == 'per_test-3'
+
+
+        def test_second(bdd_vars):
+            assert bdd_vars['per_session'] == 'per_session-1'
+            assert bdd_vars['per_module'] == 'per_module-2'
+            assert bdd_vars['per_test'] == 'per_test-4'
+    """)
+    testdir.makepyfile(test_second="""
+        from conftest import CALLS
+
+
+        def test_third(bdd_vars):
+            assert bdd_vars['per_session'] == 'per_session-1'
+            assert bdd_vars['per_module'] == 'per_module-5'
+            assert 'unused' in bdd_vars
+            assert 'unused' not in CALLS
+    """)
+
+    result = testdir.runpytest()
+
+    result.assert_outcomes(passed=3)
+
+
+def test_bdd_vars_hook_invalid_scope(testdir):
+    """ Invalid bdd_vars scopes """
+    testdir.makeconftest("""
+        def pytest_pypom_navigation_bdd_vars(register):
+            register('value', lambda request: 1, scope='class')
+    """)
+    testdir.makepyfile("""
+        def test_invalid(bdd_vars):
+            pass
+    """)
+
+    result = testdir.runpytest()
+
+    assert "invalid scope 'class' for bdd var value" in result.stdout.str()
+    result.assert_outcomes(errors=1)
+
+
 def test_parametrizer_class(parametrizer_class):
     """ Test parametrizer class """
     from parametrizer import Parametrizer
-    assert parametrizer_class is Parametrizer
+    assert issubclass(parametrizer_class, Parametrizer)
 
 
 def test_parametrizer(parametrizer_class, parametrizer, test_run_identifier):
@@ -254,3 +354,1016 @@ def test_parametrizer(parametrizer_class, parametrizer, test_run_identifier):
     assert isinstance(parametrizer, parametrizer_class)
     assert parametrizer.parametrize(
         '$test_run_identifier') == test_run_identifier
+
+
+def test_page_index(page_index, skin):
+    """ Page index compiled for the current skin """
+    from pypom_navigation.index import PageIndex
+    assert isinstance(page_index, PageIndex)
+    assert page_index.skin == skin
+
+
+@pytest.mark.parametrize('option', [
+    ['--validate-page-mappings'],
+    ['-o', 'validate_page_mappings=true'],
+])
+def test_validate_page_mappings(testdir, option):
+    """ Invalid page mappings abort the session before the first test """
+    testdir.makepyfile("""
+        import pytest
+
+
+        @pytest.fixture(scope='session')
+        def page_mappings():
+            return {
+                'HomePage': {
+                    'page_class': {'skin1': 'mypackage.pages.HomePage'},
+                    'actions': {'login': 'LoginPage'},
+                },
+            }
+
+
+        def test_first():
+            assert 0
+
+
+        def test_second():
+            assert 0
+    """)
+
+    result = testdir.runpytest(*option)
+
+    result_text = result.stdout.str()
+    assert 'invalid page mappings' in result_text
+    assert "cannot resolve 'mypackage.pages.HomePage'" in result_text
+    assert "action 'login' points to unknown page 'LoginPage'" in \
+        result_text
+    assert 'test_second' not in result_text
+    assert result.ret != 0
+
+
+@pytest.mark.parametrize('option', [
+    ['--validate-page-mappings'],
+    ['--pages-import-mode=eager'],
+])
+def test_validate_page_mappings_overrides(testdir, option):
+    """ Function scoped page mappings overrides are checked once each """
+    for name in ('one', 'two'):
+        testdir.makepyfile(**{'test_{0}'.format(name): """
+            import pytest
+
+
+            MAPPINGS = {'NAME': {'path': '/NAME'}}
+
+
+            @pytest.fixture
+            def page_mappings():
+                return MAPPINGS
+
+
+            def test_first(navigation):
+                pass
+
+
+            def test_second(navigation, checked_page_mappings):
+                checked = [value[1] for value in
+                           checked_page_mappings.values()]
+                assert checked.count(MAPPINGS) == 1
+                assert checked[-1] is MAPPINGS
+        """.replace('NAME', name)})
+
+    result = testdir.runpytest(*option)
+
+    result.assert_outcomes(passed=4)
+
+
+def test_validate_page_mappings_disabled(testdir):
+    """ Page mappings are not validated by default """
+    testdir.makepyfile("""
+        import pytest
+
+
+        @pytest.fixture(scope='session')
+        def page_mappings():
+            return {
+                'HomePage': {
+                    'page_class': {'skin1': 'mypackage.pages.HomePage'},
+                },
+            }
+
+
+        def test_first():
+            pass
+    """)
+
+    result = testdir.runpytest()
+
+    assert result.ret == 0
+
+
+@pytest.mark.parametrize('option,imported', [
+    [[], False],
+    [['--pages-import-mode=lazy'], False],
+    [['--pages-import-mode=eager'], True],
+    [['-o', 'pages_import_mode=eager'], True],
+])
+def test_pages_import_mode(testdir, option, imported):
+    """ Page object modules imported before the first test on demand """
+    from pypom_navigation.util import clear_page_class_cache
+
+    # page classes resolved by previous in process runs
+    clear_page_class_cache()
+    testdir.makepyfile(mypages="""
+        from pypom_navigation.pages import BasePage
+
+
+        class HomePage(BasePage):
+            pass
+    """)
+    testdir.makepyfile("""
+        import sys
+        import pytest
+
+
+        @pytest.fixture(scope='session')
+        def page_mappings():
+            return {
+                'HomePage': {
+                    'page_class': {'skin1': 'mypages.HomePage'},
+                },
+            }
+
+
+        def test_imported():
+            assert ('mypages' in sys.modules) is IMPORTED
+    """.replace('IMPORTED', str(imported)))
+
+    result = testdir.runpytest(*option)
+
+    assert result.ret == 0
+
+
+@pytest.mark.parametrize('option,reused', [
+    [[], False],
+    [['--navigation-scope=function'], False],
+    [['--navigation-scope=module'], True],
+    [['--navigation-scope=session'], True],
+    [['-o', 'navigation_scope=session'], True],
+])
+def test_navigation_scope(testdir, option, reused):
+    """ Navigation and driver reused across tests """
+    testdir.makepyfile("""
+        import pytest
+        from mock import MagicMock
+
+
+        @pytest.fixture
+        def browser():
+            return MagicMock()
+
+
+        @pytest.fixture(scope='session')
+        def page_mappings():
+            return {'HomePage': {'path': '/home'}}
+
+
+        @pytest.fixture
+        def default_page_class():
+            return lambda driver, **kwargs: MagicMock(driver=driver)
+
+
+        NAVIGATIONS = []
+
+
+        def test_first(navigation):
+            navigation.visit_page('HomePage')
+            NAVIGATIONS.append(navigation)
+
+
+        def test_second(navigation, request):
+            NAVIGATIONS.append(navigation)
+            assert navigation.request.node is request.node
+            if REUSED:
+                assert NAVIGATIONS[0] is NAVIGATIONS[1]
+                assert navigation.page_id is None
+                assert navigation.driver.cookies.delete_all.called
+            else:
+                assert NAVIGATIONS[0] is not NAVIGATIONS[1]
+                assert navigation.page is None
+    """.replace('REUSED', str(reused)))
+
+    result = testdir.runpytest(*option)
+
+    assert result.ret == 0
+
+
+@pytest.mark.parametrize('scope', ['function', 'module', 'session'])
+def test_navigation_scope_fixture_overrides(testdir, scope):
+    """ Reused navigations honour fixture overrides of other modules """
+    testdir.makeconftest("""
+        import pytest
+        from mock import MagicMock
+
+
+        @pytest.fixture
+        def browser():
+            return MagicMock()
+
+
+        @pytest.fixture
+        def default_page_class():
+            return lambda driver, **kwargs: MagicMock(driver=driver)
+    """)
+    for name in ('one', 'two'):
+        testdir.makepyfile(**{'test_{0}'.format(name): """
+            import pytest
+
+
+            @pytest.fixture(scope='session')
+            def page_mappings():
+                return {'HomePage': {'path': '/NAME'}}
+
+
+            @pytest.fixture
+            def credentials_mapping():
+                return {'NAME': {'username': 'NAME', 'password': 'pwd'}}
+
+
+            @pytest.fixture
+            def default_timeout():
+                return len('NAME') * 10
+
+
+            def test_visit(navigation):
+                page = navigation.visit_page('HomePage')
+                page.driver.visit.assert_called_with('/NAME')
+                assert navigation.page_mappings['HomePage']['path'] == \\
+                    '/NAME'
+                assert navigation.get_credentials('NAME') == ('NAME', 'pwd')
+                assert navigation.kwargs['timeout'] == len('NAME') * 10
+        """.replace('NAME', name)})
+
+    result = testdir.runpytest('--navigation-scope={0}'.format(scope))
+
+    assert result.ret == 0
+    result.assert_outcomes(passed=2)
+
+
+def test_browser_pool_disabled(browser_pool):
+    """ No browser pool by default """
+    assert browser_pool is None
+
+
+def test_browser_pool(testdir):
+    """ Drivers reused across tests through the browser pool """
+    testdir.makepyfile("""
+        import pytest
+        from mock import MagicMock
+
+
+        DRIVERS = []
+
+
+        @pytest.fixture(scope='session')
+        def browser_pool_factory():
+            def factory(skin, base_url):
+                DRIVERS.append(MagicMock())
+                return DRIVERS[-1]
+            return factory
+
+
+        @pytest.fixture(scope='session')
+        def page_mappings():
+            return {'HomePage': {'path': '/home'}}
+
+
+        @pytest.fixture
+        def default_page_class():
+            return lambda driver, **kwargs: MagicMock(driver=driver)
+
+
+        def test_first(navigation):
+            assert navigation.visit_page('HomePage').driver is DRIVERS[0]
+
+
+        def test_second(navigation):
+            assert navigation.visit_page('HomePage').driver is DRIVERS[0]
+            assert 0
+
+
+        def test_third(navigation):
+            assert DRIVERS[0].quit.called
+            assert navigation.visit_page('HomePage').driver is DRIVERS[1]
+    """)
+
+    result = testdir.runpytest('--browser-pool-size=1')
+
+    result.assert_outcomes(passed=2, failed=1)
+
+
+@pytest.mark.parametrize('scope', ['module', 'session'])
+def test_browser_pool_navigation_scope(testdir, scope):
+    """ Reused navigations give back their drivers to the browser pool """
+    testdir.makeconftest("""
+        import pytest
+        from mock import MagicMock
+
+
+        DRIVERS = []
+
+
+        @pytest.fixture(scope='session')
+        def browser_pool_factory():
+            def factory(skin, base_url):
+                DRIVERS.append(MagicMock())
+                return DRIVERS[-1]
+            return factory
+
+
+        @pytest.fixture(scope='session')
+        def page_mappings():
+            return {'HomePage': {'path': '/home'}}
+
+
+        @pytest.fixture
+        def default_page_class():
+            return lambda driver, **kwargs: MagicMock(driver=driver)
+    """)
+    for name in ('one', 'two', 'three'):
+        testdir.makepyfile(**{'test_{0}'.format(name): """
+            from conftest import DRIVERS
+
+
+            def test_first(navigation, browser_pool):
+                navigation.visit_page('HomePage')
+                assert len(browser_pool.in_use) == 1
+
+
+            def test_failed(navigation):
+                navigation.visit_page('HomePage')
+                assert 0
+
+
+            def test_evicted(navigation, browser_pool):
+                assert DRIVERS[-1].quit.called
+                assert navigation.visit_page('HomePage').driver is \\
+                    DRIVERS[-1]
+                assert not DRIVERS[-1].quit.called
+                assert len(browser_pool.in_use) == 1
+        """})
+
+    result = testdir.runpytest('--browser-pool-size=1',
+                               '--navigation-scope={0}'.format(scope))
+
+    result.assert_outcomes(passed=6, failed=3)
+
+
+def test_browser_pool_no_factory(testdir):
+    """ Browser pool without factory """
+    testdir.makepyfile("""
+        def test_first(navigation):
+            pass
+    """)
+
+    result = testdir.runpytest('--browser-pool-size=1')
+
+    assert 'requires a browser_pool_factory fixture' in result.stdout.str()
+    assert result.ret != 0
+
+
+@pytest.mark.parametrize('option,enabled', [
+    [[], False],
+    [['--visit-if-needed'], True],
+    [['-o', 'visit_if_needed=true'], True],
+])
+def test_visit_if_needed(testdir, option, enabled):
+    """ Visit if needed option """
+    testdir.makepyfile("""
+        def test_visit_if_needed(navigation):
+            assert navigation.visit_if_needed is ENABLED
+    """.replace('ENABLED', str(enabled)))
+
+    result = testdir.runpytest(*option)
+
+    assert result.ret == 0
+
+
+@pytest.mark.parametrize('option,enabled', [
+    [[], False],
+    [['--lazy-pages'], True],
+    [['-o', 'lazy_pages=true'], True],
+])
+def test_lazy_pages(testdir, option, enabled):
+    """ Lazy pages option """
+    testdir.makepyfile("""
+        def test_lazy_pages(navigation):
+            assert navigation.lazy_pages is ENABLED
+    """.replace('ENABLED', str(enabled)))
+
+    result = testdir.runpytest(*option)
+
+    assert result.ret == 0
+
+
+def test_skin_config(skin_config, skin, skin_base_url, credentials_mapping):
+    """ Skin settings fixtures read from the skin config """
+    assert skin_config.skin == skin
+    assert skin_config.base_url == skin_base_url
+    assert skin_config.credentials == credentials_mapping
+    assert type(credentials_mapping) is dict
+
+
+def test_function_scoped_variables(testdir):
+    """ Function scoped variables overrides are still supported """
+    testdir.makepyfile("""
+        import pytest
+
+
+        @pytest.fixture
+        def variables():
+            return {'default_timeout': 3}
+
+
+        @pytest.fixture
+        def skin_base_url(variables):
+            return 'https://skin1-coolsite.com'
+
+
+        @pytest.fixture
+        def credentials_mapping(variables):
+            return {}
+
+
+        def test_navigation(navigation, default_timeout):
+            assert default_timeout == 3
+            assert navigation.kwargs['timeout'] == 3
+            assert navigation.default_page_class.__name__ == 'BasePage'
+    """)
+
+    result = testdir.runpytest()
+
+    assert result.ret == 0
+    result.assert_outcomes(passed=1)
+
+
+def test_function_scoped_default_pages(testdir):
+    """ Function scoped default_pages overrides are still supported """
+    testdir.makepyfile("""
+        import pytest
+
+
+        @pytest.fixture
+        def default_pages():
+            return {'skin1': 'pypom_navigation.pages.BasePage'}
+
+
+        def test_navigation(navigation, skin_config):
+            assert navigation.default_page_class.__name__ == 'BasePage'
+    """)
+
+    result = testdir.runpytest()
+
+    assert result.ret == 0
+    result.assert_outcomes(passed=1)
+
+
+@pytest.mark.parametrize('option,ttl', [
+    [[], None],
+    [['--login-cache'], None],
+    [['--login-cache', '--login-cache-ttl=60'], 60],
+    [['-o', 'login_cache=true', '-o', 'login_cache_ttl=30'], 30],
+])
+def test_login_cache(testdir, option, ttl):
+    """ Login cache options """
+    testdir.makepyfile("""
+        def test_login_cache(navigation, login_cache):
+            assert navigation.login_cache is login_cache
+            if ENABLED:
+                assert login_cache.ttl == TTL
+            else:
+                assert login_cache is None
+    """.replace('ENABLED', str(bool(option))).replace('TTL', str(ttl)))
+
+    result = testdir.runpytest(*option)
+
+    assert result.ret == 0
+
+
+def test_navigation_timings_disabled(navigation_timings, navigation):
+    """ No navigation timings by default """
+    assert navigation_timings is None
+    assert navigation.timings is None
+
+
+def test_navigation_timings(testdir):
+    """ Navigation timings summary, json file and hook """
+    import json
+
+    testdir.makeconftest("""
+        STEPS = []
+
+
+        def pytest_pypom_navigation_step(navigation, step, page_id,
+                                         timings):
+            STEPS.append((step, page_id, sorted(timings)))
+    """)
+    testdir.makepyfile("""
+        import pytest
+        from mock import MagicMock
+        from conftest import STEPS
+
+
+        @pytest.fixture
+        def browser():
+            return MagicMock()
+
+
+        @pytest.fixture(scope='session')
+        def page_mappings():
+            return {'HomePage': {'path': '/home'},
+                    'SlowPage': {'path': '/slow'}}
+
+
+        @pytest.fixture
+        def default_page_class():
+            return MagicMock()
+
+
+        def test_timings(navigation):
+            navigation.visit_page('HomePage')
+            navigation.update_page('SlowPage')
+            assert STEPS == [
+                ('visit_page', 'HomePage',
+                 ['resolve', 'total', 'visit', 'wait']),
+                ('update_page', 'SlowPage',
+                 ['resolve', 'total', 'wait']),
+            ]
+    """)
+
+    result = testdir.runpytest('--navigation-timings=0',
+                               '--navigation-timings-json=timings.json')
+
+    assert result.ret == 0
+    result.stdout.fnmatch_lines([
+        '*slowest navigation steps*',
+        '*s mean *s max 1 x skin1 * *_page',
+        '*s mean *s max 1 x skin1 * *_page',
+    ])
+    with open(str(testdir.tmpdir.join('timings.json'))) as json_file:
+        items = json.load(json_file)
+    assert set((item['page_id'], item['step']) for item in items) == \
+        set([('HomePage', 'visit_page'), ('SlowPage', 'update_page')])
+
+
+def test_page_index_overrides(testdir):
+    """ Page index follows page_mappings overrides """
+    testdir.makepyfile(test_a="""
+        import pytest
+
+
+        @pytest.fixture(scope='session')
+        def page_mappings():
+            return {'APage': {}}
+
+
+        INDEXES = []
+
+
+        def test_a(page_index):
+            assert list(page_index) == ['APage']
+            INDEXES.append(page_index)
+
+
+        def test_a_cached(page_index):
+            assert page_index is INDEXES[0]
+    """)
+    testdir.makepyfile(test_b="""
+        import pytest
+
+
+        @pytest.fixture
+        def page_mappings():
+            return {'BPage': {}}
+
+
+        def test_b(page_index):
+            assert list(page_index) == ['BPage']
+    """)
+
+    result = testdir.runpytest()
+
+    result.assert_outcomes(passed=3)
+
+
+@pytest.mark.parametrize('option,skins', [
+    ['--navigation-skins=all', ['skin1', 'skin2']],
+    ['--navigation-skins=skin2', ['skin2']],
+    ['--navigation-skins=skin1, skin2', ['skin1', 'skin2']],
+])
+def test_navigation_skins(testdir, option, skins):
+    """ Tests parametrized by skin """
+    import os
+
+    testdir.makepyfile("""
+        def test_generated_skins(skin_base_url, skin):
+            assert skin_base_url == 'https://{0}-coolsite.com'.format(skin)
+
+
+        def test_generated_no_skin():
+            pass
+    """)
+
+    result = testdir.runpytest(
+        '--variables={0}'.format(os.path.join(os.path.dirname(__file__),
+                                              'credentials.yml')),
+        option,
+        '-v'
+    )
+
+    # the autouse skip_by_skin_names fixture requests skin, so all
+    # the tests are parametrized
+    result_text = result.stdout.str()
+    for skin in skins:
+        assert 'test_generated_skins[{0}] PASSED'.format(skin) in \
+            result_text
+        assert 'test_generated_no_skin[{0}] PASSED'.format(skin) in \
+            result_text
+    result.assert_outcomes(passed=len(skins) * 2)
+
+
+def test_group_by_skin(testdir):
+    """ Tests of the same skin grouped on the same xdist worker """
+    import os
+
+    pytest.importorskip('xdist')
+    testdir.makepyfile("""
+        import pytest
+
+
+        @pytest.mark.parametrize('value', range(4))
+        def test_generated_skins(skin, value):
+            pass
+    """)
+
+    result = testdir.runpytest(
+        '--variables={0}'.format(os.path.join(os.path.dirname(__file__),
+                                              'credentials.yml')),
+        '--navigation-skins=all',
+        '--group-by-skin',
+        '-n', '2',
+        '--dist=loadgroup',
+        '-v'
+    )
+
+    workers = {}
+    for line in result.stdout.lines:
+        if 'PASSED' in line and '@skin-' in line:
+            worker = line.split(']')[0]
+            skin = line.split('@')[1].split()[0]
+            workers.setdefault(skin, set()).add(worker)
+    assert sorted(workers) == ['skin-skin1', 'skin-skin2']
+    assert all(len(value) == 1 for value in workers.values())
+    result.assert_outcomes(passed=8)
+
+
+@pytest.mark.parametrize('option,skins', [
+    [[], ['skin1', 'skin2', 'skin3']],
+    [['--navigation-skins=skin2'], ['skin2']],
+    [['-o', 'navigation_skins=skin1,skin3'], ['skin1', 'skin3']],
+])
+def test_navigation_skins_fixture_params(testdir, option, skins):
+    """ Skins selected among the skin fixture params """
+    testdir.makepyfile("""
+        import pytest
+
+
+        @pytest.fixture(scope='session', params=['skin1', 'skin2', 'skin3'])
+        def skin(request):
+            return request.param
+
+
+        def test_skin(skin):
+            pass
+    """)
+
+    result = testdir.runpytest('-v', *option)
+
+    result_text = result.stdout.str()
+    for skin in skins:
+        assert 'test_skin[{0}] PASSED'.format(skin) in result_text
+    result.assert_outcomes(passed=len(skins))
+
+
+def test_navigation_prefix(testdir):
+    """ Tests sharing a navigation prefix run together """
+    testdir.makepyfile("""
+        import pytest
+
+
+        def test_a():
+            pass
+
+
+        @pytest.mark.navigation_prefix('login')
+        def test_b(navigation_checkpoints):
+            pass
+
+
+        def test_c():
+            pass
+
+
+        @pytest.mark.navigation_prefix('login')
+        def test_d():
+            pass
+
+
+        @pytest.mark.navigation_prefix('cart')
+        def test_e():
+            pass
+    """)
+
+    result = testdir.runpytest('-v', '-p', 'no:xdist')
+
+    passed = [line.split('::')[1].split()[0]
+              for line in result.stdout.lines if 'PASSED' in line]
+    assert passed == ['test_a', 'test_b', 'test_d', 'test_c', 'test_e']
+    assert result.ret == 0
+
+
+def test_navigation_prefix_xdist(testdir):
+    """ Tests sharing a navigation prefix run on the same xdist worker
+        restoring the checkpoint
+    """
+    pytest.importorskip('xdist')
+    testdir.makepyfile("""
+        import pytest
+        from mock import MagicMock
+
+
+        @pytest.fixture
+        def browser():
+            browser = MagicMock()
+            browser.url = 'about:blank'
+            browser.cookies.all.return_value = []
+            browser.evaluate_script.return_value = {
+                'local': {}, 'session': {}}
+            return browser
+
+
+        @pytest.fixture(scope='session')
+        def page_mappings():
+            return {'HomePage': {'path': '/home'}}
+
+
+        @pytest.fixture(scope='session')
+        def default_page_class():
+            return lambda driver, **kwargs: MagicMock(driver=driver)
+
+
+        STEPS = []
+
+
+        @pytest.mark.navigation_prefix('home')
+        @pytest.mark.parametrize('value', range(4))
+        def test_prefix(navigation, value):
+            navigation.prefix(
+                'home', lambda navigation: STEPS.append(value))
+            assert len(STEPS) == 1
+    """)
+
+    result = testdir.runpytest('-n', '2', '--dist=loadgroup', '-v')
+
+    workers = set(line.split(']')[0] for line in result.stdout.lines
+                  if 'PASSED' in line and '@prefix-home' in line)
+    assert len(workers) == 1
+    result.assert_outcomes(passed=4)
+
+
+def test_navigation_data(testdir):
+    """ Tests generated from a data source """
+    testdir.makefile('.csv', users='user_id,name\n'
+                                   'Administrator,admin-$skin\n'
+                                   'Editor,editor-$skin\n')
+    testdir.makefile('.jsonl', users='{"user_id": "Administrator"}\n')
+    testdir.makepyfile("""
+        import pytest
+
+
+        NAMES = {'Administrator': 'admin-skin1', 'Editor': 'editor-skin1'}
+
+
+        @pytest.mark.navigation_data('users.csv')
+        def test_csv(data_row):
+            assert data_row['name'] == NAMES[data_row['user_id']]
+
+
+        @pytest.mark.navigation_data('users.jsonl', format='jsonl')
+        def test_jsonl(data_row, skin):
+            assert data_row == {'user_id': 'Administrator'}
+    """)
+
+    result = testdir.runpytest('-v', '-p', 'no:xdist')
+
+    result_text = result.stdout.str()
+    assert 'test_csv[row0] PASSED' in result_text
+    assert 'test_csv[row1] PASSED' in result_text
+    assert 'test_jsonl[row0] PASSED' in result_text
+    result.assert_outcomes(passed=3)
+
+
+def test_navigation_data_no_marker(testdir):
+    """ data_row requested without a navigation_data marker """
+    testdir.makepyfile("""
+        def test_data(data_row):
+            pass
+    """)
+
+    result = testdir.runpytest()
+
+    assert 'test_data requests data_row without a navigation_data ' \
+        'marker' in result.stdout.str() + result.stderr.str()
+    assert result.ret != 0
+
+
+def test_navigation_data_xdist(testdir):
+    """ Data rows distributed to xdist workers """
+    pytest.importorskip('xdist')
+    testdir.makefile('.jsonl', rows='\n'.join(
+        '{"value": %d}' % value for value in range(10)))
+    testdir.makepyfile("""
+        import pytest
+
+
+        @pytest.mark.navigation_data('rows.jsonl')
+        def test_rows(data_row, request):
+            index = int(request.node.callspec.id.replace('row', ''))
+            assert data_row == {'value': index}
+    """)
+
+    result = testdir.runpytest('-n', '2')
+
+    result.assert_outcomes(passed=10)
+
+
+@pytest.mark.parametrize('option,skins,parsed', [
+    [[], ['skin1', 'skin2'], True],
+    [['--share-variables'], ['skin1', 'skin2'], False],
+    [['--share-variables', '--navigation-skins=skin2'], ['skin2'], False],
+    [['-o', 'share_variables=true', '--navigation-skins=all'],
+     ['skin1', 'skin2'], False],
+])
+def test_share_variables(testdir, option, skins, parsed):
+    """ Variables parsed once by the xdist controller """
+    import os
+
+    pytest.importorskip('xdist')
+    testdir.makepyfile("""
+        def test_variables(request, variables, skin_base_url):
+            assert sorted(variables['skins']) == SKINS
+            assert bool(request.config.option.variables) is PARSED
+            assert skin_base_url.startswith('https://skin')
+    """.replace('SKINS', repr(skins)).replace('PARSED', str(parsed)))
+
+    result = testdir.runpytest(
+        '--variables={0}'.format(os.path.join(os.path.dirname(__file__),
+                                              'credentials.yml')),
+        '-n', '2',
+        *option
+    )
+
+    assert result.ret == 0
+
+
+def test_share_variables_invalid(testdir):
+    """ Variables are validated by the xdist controller """
+    pytest.importorskip('xdist')
+    testdir.makefile('.json', variables='{"skins": {"skin1": "invalid"}}')
+    testdir.makepyfile("""
+        def test_variables(variables):
+            pass
+    """)
+
+    result = testdir.runpytest(
+        '--variables=variables.json', '-n', '1', '--share-variables')
+
+    assert 'invalid variables: variables for skin skin1 must be a mapping' \
+        in result.stderr.str()
+    assert result.ret != 0
+
+
+def test_skip_by_skin_names_no_setup(testdir):
+    """ Tests skipped by skin name without fixture setup """
+    testdir.makepyfile("""
+        import pytest
+
+
+        SETUPS = []
+
+
+        @pytest.fixture(scope='session', params=['skin1', 'skin2'])
+        def skin(request):
+            SETUPS.append(request.param)
+            return request.param
+
+
+        @pytest.mark.skip_skins(['skin1'])
+        def test_generated_skip_skins(skin):
+            assert skin == 'skin2'
+
+
+        @pytest.mark.skip_skins(['skin1'])
+        def test_generated_skip_skins_setups(skin):
+            assert SETUPS == ['skin2']
+    """)
+
+    result = testdir.runpytest('-v')
+
+    result_text = result.stdout.str()
+    assert 'test_generated_skip_skins[skin1] SKIPPED' in result_text
+    assert 'test_generated_skip_skins_setups[skin1] SKIPPED' in result_text
+    result.assert_outcomes(passed=2, skipped=2)
+
+
+def test_skip_by_skin_names_fixture(testdir):
+    """ Skip by skin names (non parametrized skin fixture) """
+    testdir.makepyfile("""
+        import pytest
+
+
+        @pytest.fixture(scope='session')
+        def skin():
+            return 'skin2'
+
+
+        @pytest.mark.skip_skins(['skin2'])
+        def test_generated_skip_skins(skin):
+            assert 0
+    """)
+
+    result = testdir.runpytest('-v')
+
+    assert 'test_generated_skip_skins SKIPPED' in result.stdout.str()
+    result.assert_outcomes(skipped=1)
+
+
+def test_navigation_timings_db(testdir):
+    """ Timings persisted across runs, slowest first and regressions """
+    import json
+
+    testdir.makepyfile("""
+        import time
+        import pytest
+        from mock import MagicMock
+
+
+        @pytest.fixture
+        def browser():
+            return MagicMock()
+
+
+        @pytest.fixture(scope='session')
+        def page_mappings():
+            return {'HomePage': {'path': '/home'}}
+
+
+        @pytest.fixture
+        def default_page_class():
+            return MagicMock()
+
+
+        def test_fast(navigation):
+            navigation.visit_page('HomePage')
+
+
+        def test_slow():
+            time.sleep(0.05)
+    """)
+    store_path = str(testdir.tmpdir.join('timings.jsonl'))
+
+    result = testdir.runpytest('--navigation-timings-db=timings.jsonl',
+                               '-v')
+    assert result.ret == 0
+    result.stdout.fnmatch_lines(['*test_fast PASSED*', '*test_slow PASSED*'])
+    with open(store_path) as store_file:
+        items = [json.loads(line) for line in store_file]
+    assert set(item['kind'] for item in items) == set(['step', 'test'])
+
+    result = testdir.runpytest('--navigation-timings-db=timings.jsonl',
+                               '--slowest-first', '-v')
+    assert result.ret == 0
+    result.stdout.fnmatch_lines(['*test_slow PASSED*', '*test_fast PASSED*'])
+
+    # pretend visits were faster in previous runs
+    with open(store_path, 'a') as store_file:
+        store_file.write(json.dumps({
+            'kind': 'step', 'skin': 'skin1', 'page_id': 'HomePage',
+            'step': 'visit_page', 'phase': 'total', 'count': 1000000,
+            'total': 0, 'min': 0, 'max': 0}) + '\n')
+    result = testdir.runpytest('--navigation-timings-db=timings.jsonl',
+                               '--navigation-regression-threshold=1')
+    assert result.ret == 0
+    result.stdout.fnmatch_lines([
+        '*navigation timing regressions*',
+        '*s mean (was 0.00s) skin1 HomePage visit_page',
+    ])
@@ -0,0 +1,99 @@
+from mock import MagicMock
+
+
+def test_checkout_new_drivers():
+    """ New drivers are created for each key """
+    from pypom_navigation.pool import BrowserPool
+
+    factory = MagicMock(side_effect=lambda skin, base_url: MagicMock())
+    pool = BrowserPool(factory, size=1)
+    driver1 = pool.checkout('skin1', 'http://skin1')
+    driver2 = pool.checkout('skin2', 'http://skin2')
+    assert driver1 is not driver2
+    assert factory.call_count == 2
+    factory.assert_called_with('skin2', 'http://skin2')
+
+
+def test_checkin_reuse():
+    """ Healthy drivers are reused """
+    from pypom_navigation.pool import BrowserPool
+
+    factory = MagicMock(side_effect=lambda skin, base_url: MagicMock())
+    pool = BrowserPool(factory, size=1)
+    driver = pool.checkout('skin1', 'http://skin1')
+    pool.checkin(driver, 'skin1', 'http://skin1')
+    assert driver.cookies.delete_all.called is True
+    assert pool.checkout('skin1', 'http://skin1') is driver
+    assert pool.checkout('skin1', 'http://skin1') is not driver
+    assert factory.call_count == 2
+    assert driver.quit.called is False
+
+
+def test_checkin_error():
+    """ Drivers used by failed tests are evicted """
+    from pypom_navigation.pool import BrowserPool
+
+    pool = BrowserPool(lambda skin, base_url: MagicMock(), size=1)
+    driver = pool.checkout('skin1', 'http://skin1')
+    pool.checkin(driver, 'skin1', 'http://skin1', error=True)
+    assert driver.quit.called is True
+    assert pool.checkout('skin1', 'http://skin1') is not driver
+
+
+def test_checkin_unhealthy():
+    """ Drivers failing the health check are evicted """
+    from pypom_navigation.pool import BrowserPool
+
+    pool = BrowserPool(lambda skin, base_url: MagicMock(), size=1)
+    driver = pool.checkout('skin1', 'http://skin1')
+    driver.cookies.delete_all.side_effect = Exception('browser crashed')
+    pool.checkin(driver, 'skin1', 'http://skin1')
+    assert driver.quit.called is True
+
+    pool = BrowserPool(lambda skin, base_url: MagicMock(), size=1,
+                       health_check=lambda driver: False)
+    driver = pool.checkout('skin1', 'http://skin1')
+    pool.checkin(driver, 'skin1', 'http://skin1')
+    assert driver.quit.called is True
+
+
+def test_checkin_max_uses():
+    """ Drivers are evicted after max uses """
+    from pypom_navigation.pool import BrowserPool
+
+    pool = BrowserPool(lambda skin, base_url: MagicMock(), size=1,
+                       max_uses=2)
+    driver = pool.checkout('skin1', 'http://skin1')
+    pool.checkin(driver, 'skin1', 'http://skin1')
+    assert pool.checkout('skin1', 'http://skin1') is driver
+    pool.checkin(driver, 'skin1', 'http://skin1')
+    assert driver.quit.called is True
+    assert pool.checkout('skin1', 'http://skin1') is not driver
+
+
+def test_checkin_size():
+    """ No more than size idle drivers per key """
+    from pypom_navigation.pool import BrowserPool
+
+    pool = BrowserPool(lambda skin, base_url: MagicMock(), size=1)
+    driver1 = pool.checkout('skin1', 'http://skin1')
+    driver2 = pool.checkout('skin1', 'http://skin1')
+    pool.checkin(driver1, 'skin1', 'http://skin1')
+    pool.checkin(driver2, 'skin1', 'http://skin1')
+    assert driver1.quit.called is False
+    assert driver2.quit.called is True
+
+
+def test_close():
+    """ Close quits idle and checked out drivers """
+    from pypom_navigation.pool import BrowserPool
+
+    pool = BrowserPool(lambda skin, base_url: MagicMock(), size=1)
+    driver1 = pool.checkout('skin1', 'http://skin1')
+    driver2 = pool.checkout('skin1', 'http://skin1')
+    pool.checkin(driver1, 'skin1', 'http://skin1')
+    pool.close()
+    assert driver1.quit.called is True
+    assert driver2.quit.called is True
+    assert pool.idle == {}
+    assert pool.in_use == {}
@@ -0,0 +1,178 @@
+import json
+
+import pytest
+from mock import MagicMock
+
+
+def test_step_timer():
+    """ Step timer records phases and total """
+    from pypom_navigation.timing import NavigationTimings
+
+    hook = MagicMock()
+    navigation = MagicMock(skin='skin1')
+    timings = NavigationTimings(hook=hook)
+    timer = timings.start(navigation, 'visit_page', 'HomePage')
+    timer.lap('resolve')
+    timer.lap('visit')
+    timer.stop()
+
+    phases = sorted(item['phase'] for item in timings.as_list())
+    assert phases == ['resolve', 'total', 'visit']
+    assert timings.mean('skin1', 'HomePage', 'visit_page') >= 0
+    assert timings.mean('skin1', 'HomePage', 'update_page') is None
+    assert hook.pytest_pypom_navigation_step.call_count == 1
+    kwargs = hook.pytest_pypom_navigation_step.call_args[1]
+    assert kwargs['navigation'] is navigation
+    assert kwargs['step'] == 'visit_page'
+    assert kwargs['page_id'] == 'HomePage'
+    assert sorted(kwargs['timings']) == ['resolve', 'total', 'visit']
+
+
+def test_slowest():
+    """ Slowest steps by mean total duration """
+    from pypom_navigation.timing import NavigationTimings
+
+    timings = NavigationTimings()
+    timings.add('skin1', 'HomePage', 'visit_page', 'total', 1)
+    timings.add('skin1', 'HomePage', 'visit_page', 'wait', 5)
+    timings.add('skin1', 'LoginPage', 'visit_page', 'total', 3)
+    timings.add('skin1', None, 'action_performed', 'total', 2)
+
+    slowest = timings.slowest()
+    assert [item['page_id'] for item in slowest] == \
+        ['LoginPage', None, 'HomePage']
+    assert len(timings.slowest(1)) == 1
+
+
+def test_update():
+    """ Merge exported stats """
+    from pypom_navigation.timing import NavigationTimings
+
+    timings = NavigationTimings()
+    timings.add('skin1', 'HomePage', 'visit_page', 'total', 1)
+    other = NavigationTimings()
+    other.add('skin1', 'HomePage', 'visit_page', 'total', 3)
+    other.add('skin2', 'HomePage', 'visit_page', 'total', 3)
+    timings.update(other.as_list())
+    assert timings.stats == {
+        ('skin1', 'HomePage', 'visit_page', 'total'): [2, 4, 1, 3],
+        ('skin2', 'HomePage', 'visit_page', 'total'): [1, 3, 3, 3],
+    }
+
+
+def test_write_json(tmpdir):
+    """ Write stats to json """
+    from pypom_navigation.timing import NavigationTimings
+
+    timings = NavigationTimings()
+    timings.add('skin1', 'HomePage', 'visit_page', 'total', 1)
+    path = str(tmpdir.join('timings.json'))
+    timings.write_json(path)
+    with open(path) as json_file:
+        assert json.load(json_file) == timings.as_list()
+
+
+def test_mean_history():
+    """ Mean from previous runs if not recorded in this run """
+    from pypom_navigation.timing import NavigationTimings
+
+    history = NavigationTimings()
+    history.add('skin1', 'HomePage', 'visit_page', 'total', 4)
+    timings = NavigationTimings(history=history)
+    assert timings.mean('skin1', 'HomePage', 'visit_page') == 4
+    assert timings.mean('skin1', 'LoginPage', 'visit_page') is None
+    timings.add('skin1', 'HomePage', 'visit_page', 'total', 2)
+    assert timings.mean('skin1', 'HomePage', 'visit_page') == 2
+
+
+def test_timings_store(tmpdir):
+    """ Timings persisted across runs """
+    from pypom_navigation.timing import (
+        NavigationTimings,
+        TimingsStore,
+    )
+
+    path = str(tmpdir.join('timings.jsonl'))
+    store = TimingsStore(path).load()
+    assert store.steps.stats == {}
+    assert store.test_duration('test_a') is None
+
+    for duration in (1, 3):
+        timings = NavigationTimings()
+        timings.add('skin1', 'HomePage', 'visit_page', 'total', duration)
+        TimingsStore(path).append(timings, {'test_a': duration * 2})
+
+    store = TimingsStore(path).load()
+    assert store.steps.mean('skin1', 'HomePage', 'visit_page') == 2
+    assert store.test_duration('test_a') == 4
+    with open(path) as store_file:
+        assert len(store_file.readlines()) == 4
+
+
+def test_timings_store_max_runs(tmpdir):
+    """ Only the last runs are kept """
+    from pypom_navigation.timing import (
+        NavigationTimings,
+        TimingsStore,
+    )
+
+    path = str(tmpdir.join('timings.jsonl'))
+    with open(path, 'w') as store_file:
+        # legacy records without run
+        store_file.write(json.dumps({
+            'kind': 'test', 'nodeid': 'test_a', 'duration': 100}) + '\n')
+    for duration in (1, 2, 3, 4):
+        timings = NavigationTimings()
+        timings.add('skin1', 'HomePage', 'visit_page', 'total', duration)
+        store = TimingsStore(path, max_runs=2)
+        store.append(timings, {'test_a': duration})
+        # history loaded before appending does not include this run
+        assert store.steps.mean('skin1', 'HomePage', 'visit_page') == \
+            {1: None, 2: 1, 3: 1.5, 4: 2.5}[duration]
+
+    store = TimingsStore(path, max_runs=2)
+    assert store.mean('skin1', 'HomePage', 'visit_page') == 3.5
+    assert store.test_duration('test_a') == 3.5
+    assert len(store.read_runs()) == 2
+    assert TimingsStore(path, max_runs=1).mean(
+        'skin1', 'HomePage', 'visit_page') == 4
+    assert not tmpdir.join('timings.jsonl.tmp').exists()
+
+
+def test_timings_store_lazy(tmpdir):
+    """ Recorded runs are read on first use """
+    from pypom_navigation.timing import (
+        NavigationTimings,
+        TimingsStore,
+    )
+
+    path = tmpdir.join('timings.jsonl')
+    store = TimingsStore(str(path))
+    path.write('not json')
+    timings = NavigationTimings(history=store)
+    timings.add('skin1', 'HomePage', 'visit_page', 'total', 1)
+    assert timings.mean('skin1', 'HomePage', 'visit_page') == 1
+    assert store._steps is None
+    with pytest.raises(ValueError):
+        timings.mean('skin1', 'LoginPage', 'visit_page')
+
+
+def test_timings_store_regressions(tmpdir):
+    """ Regressions compared to previous runs """
+    from pypom_navigation.timing import (
+        NavigationTimings,
+        TimingsStore,
+    )
+
+    store = TimingsStore(str(tmpdir.join('timings.jsonl')))
+    store.steps.add('skin1', 'HomePage', 'visit_page', 'total', 1)
+    store.steps.add('skin1', 'LoginPage', 'visit_page', 'total', 1)
+    timings = NavigationTimings()
+    timings.add('skin1', 'HomePage', 'visit_page', 'total', 2)
+    timings.add('skin1', 'LoginPage', 'visit_page', 'total', 1.2)
+    timings.add('skin1', 'NewPage', 'visit_page', 'total', 10)
+
+    regressions = store.regressions(timings, 1.5)
+    assert [(item['page_id'], item['previous_mean'])
+            for item in regressions] == [('HomePage', 1)]
+    assert len(store.regressions(timings, 1.1)) == 2
@@ -221,3 +221,166 @@ def test_page_factory():
     assert result_page is not page_mock
     assert not default_page_class.called
     assert result_page.base_url == 'http://baseurl.com/subpath'
+
+
+def test_get_page_class_cache():
+    """ Dotted names are resolved once """
+    from pypom_navigation.util import (
+        get_page_class,
+        page_class_cache,
+        clear_page_class_cache,
+    )
+
+    skin_name = 'skin1'
+    page_mappings = {
+        'HomePage': {
+            'path': '/',
+            'page_class': {
+                'skin1': 'pypom_navigation',
+            }
+        },
+    }
+    default_pages = {skin_name: 'pypom_navigation.pages.BasePage'}
+
+    clear_page_class_cache()
+    for i in range(3):
+        assert get_page_class(
+            skin_name,
+            page_mappings,
+            page_id='HomePage',
+            default_pages=default_pages) == pypom_navigation
+    assert page_class_cache.info() == {'hits': 4, 'misses': 2, 'size': 2}
+
+    clear_page_class_cache()
+    assert page_class_cache.info() == {'hits': 0, 'misses': 0, 'size': 0}
+
+
+def test_get_page_class_cache_mappings():
+    """ Different page mappings never share cached results """
+    from pypom_navigation.util import get_page_class
+
+    skin_name = 'skin1'
+    default_pages = {skin_name: 'pypom_navigation.pages.BasePage'}
+
+    assert get_page_class(
+        skin_name,
+        {'HomePage': {'page_class': {'skin1': 'pypom_navigation'}}},
+        page_id='HomePage',
+        default_pages=default_pages) == pypom_navigation
+    assert get_page_class(
+        skin_name,
+        {'HomePage': {'page_class': {'skin1': 'pypom_navigation.pages'}}},
+        page_id='HomePage',
+        default_pages=default_pages) == pypom_navigation.pages
+
+
+def test_validate_page_mappings():
+    """ Validate page mappings (valid) """
+    from pypom_navigation.util import validate_page_mappings
+
+    default_pages = {
+        'skin1': 'pypom_navigation.pages.BasePage',
+        'skin2': 'pypom_navigation.pages.BasePage',
+    }
+    page_mappings = {
+        'HomePage': {
+            'path': '/',
+            'page_class': {
+                'skin1': 'pypom_navigation.pages.BasePage',
+                'fallback': 'pypom_navigation.pages.BasePage',
+            },
+            'actions': {'self': 'HomePage'},
+        },
+        'AnotherPage': {},
+    }
+    assert validate_page_mappings(default_pages, page_mappings) == []
+
+
+def test_validate_page_mappings_errors():
+    """ Validate page mappings, all errors are reported """
+    from pypom_navigation.util import validate_page_mappings
+
+    default_pages = {
+        'skin1': 'pypom_navigation.pages.BasePage',
+        'skin2': 'pypom_navigation.pages.MissingPage',
+    }
+    page_mappings = {
+        'HomePage': {
+            'path': 1,
+            'page_class': {
+                'skin1': 'pypom_navigation.missing',
+            },
+            'actions': {'login': 'LoginPage'},
+        },
+        'AnotherPage': None,
+    }
+    errors = validate_page_mappings(default_pages, page_mappings)
+    assert len(errors) == 5
+    assert errors[0].startswith(
+        "default_pages[skin2]: cannot resolve "
+        "'pypom_navigation.pages.MissingPage'")
+    assert errors[1] == 'AnotherPage: mapping expected, got None'
+    assert errors[2] == 'HomePage: invalid path 1'
+    assert errors[3].startswith(
+        "HomePage: page_class[skin1]: cannot resolve "
+        "'pypom_navigation.missing'")
+    assert errors[4] == \
+        "HomePage: action 'login' points to unknown page 'LoginPage'"
+
+
+def test_capture_restore_browser_state():
+    """ Capture and restore cookies, local and session storage """
+    import json
+    from mock import MagicMock
+    from pypom_navigation.util import (
+        capture_browser_state,
+        restore_browser_state,
+    )
+
+    driver = MagicMock()
+    driver.cookies.all.return_value = [
+        {'name': 'session', 'value': '123', 'path': '/'}]
+    driver.evaluate_script.return_value = {
+        'local': {'token': 'abc'}, 'session': {}}
+    state = capture_browser_state(driver)
+    driver.cookies.all.assert_called_once_with(verbose=True)
+    assert state == {
+        'cookies': [{'name': 'session', 'value': '123', 'path': '/'}],
+        'local_storage': {'token': 'abc'},
+        'session_storage': {},
+    }
+    assert json.loads(json.dumps(state)) == state
+
+    another_driver = MagicMock()
+    restore_browser_state(another_driver, state)
+    another_driver.cookies.add.assert_called_once_with(
+        {'session': '123'}, path='/')
+    script = another_driver.execute_script.call_args[0][0]
+    assert '"token": "abc"' in script
+
+
+def test_clear_browser_state():
+    """ Delete all cookies with a real splinter cookie manager """
+    from mock import MagicMock
+    from splinter.driver.webdriver.cookie_manager import CookieManager
+    from pypom_navigation.util import (
+        CLEAR_STORAGE_SCRIPT,
+        clear_browser_state,
+    )
+
+    webdriver = MagicMock()
+    driver = MagicMock(cookies=CookieManager(webdriver))
+    clear_browser_state(driver)
+    webdriver.delete_all_cookies.assert_called_once_with()
+    driver.execute_script.assert_called_once_with(CLEAR_STORAGE_SCRIPT)
+
+
+def test_clear_browser_state_old_splinter():
+    """ Old splinter versions delete all cookies without arguments """
+    from mock import MagicMock
+    from pypom_navigation.util import clear_browser_state
+
+    driver = MagicMock()
+    driver.cookies = MagicMock(spec=['delete'])
+    clear_browser_state(driver)
+    driver.cookies.delete.assert_called_once_with()